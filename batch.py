@@ -0,0 +1,142 @@
+"""
+batch.py - Batch Solving Module
+
+This module solves many puzzles at once by spreading them across a pool of worker processes. Puzzles travel to
+the workers as 81-character strings in chunks and solutions come back the same way, so no `Board` or `Cell`
+objects are pickled between processes. Each worker solves straight from the parsed numbers with one of the
+engines in the `solver` module, and the lookup tables those engines use are built once per worker, on first use.
+The process pool machinery is only imported when a pool is started, so solving in the current process stays
+cheap to import.
+
+Only a bounded number of chunks is in flight at any time, so the input can be an arbitrarily long iterator.
+
+Functions:
+    - solve_chunk: Solves a list of puzzle strings in the current process.
+    - solve_many: Solves an iterable of puzzle strings across a process pool, yielding results in input order
+      or in completion order.
+
+Usage:
+    - Call `solve_many()` with any iterable of puzzle strings and iterate over the `(puzzle, solution)` pairs
+      it yields. `solution` is None for puzzles that have no solution, and the `ValueError` raised while
+      parsing for lines that are not puzzles.
+
+Example:
+    ```python
+    for puzzle, solution in solve_many(puzzles, workers=4, chunksize=256):
+        print(solution)
+    ```
+
+Dependencies:
+    - board: Provides the conversion between puzzle strings and numbers.
+    - solver: Provides the solving engines.
+"""
+
+
+from collections import deque
+from itertools import islice
+import os
+
+from board import format_digits, parse_puzzle
+from solver import get_engine
+
+
+def solve_chunk(puzzles, engine: str = 'backtracking'):
+    """
+    Solves a list of puzzles in the current process.
+
+    Args:
+        puzzles (list of str): The 81-character puzzle strings.
+        engine (str): Name of the solving engine in `solver.ENGINES`.
+
+    Returns:
+        list: The 81-character solution string of each puzzle, None if it has no solution, or the
+              `ValueError` raised while parsing it if it is not a valid puzzle.
+    """
+    solve = get_engine(engine)
+    solutions = []
+    for puzzle in puzzles:
+        try:
+            solution = solve(parse_puzzle(puzzle))
+        except ValueError as error:
+            solutions.append(error)
+            continue
+        solutions.append(None if solution is None else format_digits(solution))
+
+    return solutions
+
+
+def _chunked(puzzles, chunksize: int):
+    """
+    Splits an iterable of puzzles into lists of at most `chunksize` puzzles.
+
+    Args:
+        puzzles (iterable of str): The puzzles to split.
+        chunksize (int): The largest number of puzzles per chunk.
+
+    Yields:
+        list of str: The next chunk.
+    """
+    puzzles = iter(puzzles)
+    while True:
+        chunk = list(islice(puzzles, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_many(puzzles, workers=None, chunksize: int = 256, ordered: bool = True, engine: str = 'backtracking'):
+    """
+    Solves many puzzles across a pool of worker processes.
+
+    Args:
+        puzzles (iterable of str): The 81-character puzzle strings. The iterable is consumed lazily.
+        workers (int or None): Number of worker processes; None uses every CPU, and 1 solves in the
+                               current process without a pool.
+        chunksize (int): Number of puzzles sent to a worker at a time.
+        ordered (bool): If True, results are yielded in input order; otherwise as soon as each chunk
+                        is solved.
+        engine (str): Name of the solving engine in `solver.ENGINES`.
+
+    Yields:
+        tuple: A `(puzzle, solution)` pair, where `solution` is the 81-character solution string, None
+               if the puzzle has no solution, or the `ValueError` raised while parsing it if it is not a
+               valid puzzle.
+
+    Raises:
+        ValueError: If the engine name is unknown or `chunksize` is not positive.
+    """
+    get_engine(engine)
+    if chunksize < 1:
+        raise ValueError('chunksize must be positive.')
+
+    chunks = _chunked(puzzles, chunksize)
+    if workers == 1:
+        for chunk in chunks:
+            yield from zip(chunk, solve_chunk(chunk, engine))
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    with ProcessPoolExecutor(workers) as executor:
+        if ordered:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(solve_chunk, chunk, engine)))
+                if len(pending) >= max_pending:
+                    chunk, future = pending.popleft()
+                    yield from zip(chunk, future.result())
+            while pending:
+                chunk, future = pending.popleft()
+                yield from zip(chunk, future.result())
+        else:
+            pending = {}
+            for chunk in chunks:
+                pending[executor.submit(solve_chunk, chunk, engine)] = chunk
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from zip(pending.pop(future), future.result())
+            for future in as_completed(list(pending)):
+                yield from zip(pending.pop(future), future.result())
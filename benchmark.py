@@ -0,0 +1,259 @@
+"""
+benchmark.py - Solver Benchmark Module
+
+This module measures the solver on the puzzle corpora bundled in the `corpora` directory and checks the
+results against a stored baseline, so a change that slows down candidate finding, the logical techniques or
+the search is caught before it ships.
+
+Every puzzle is solved through `Board.solve()`, so the timings cover building the board, finding candidates,
+the techniques and the engine. Node and guess counts come from a separate run of the plain search on the
+same puzzle, so counting never skews the timings; unlike timings they do not depend on the machine.
+
+Corpora:
+    - easy: Puzzles solved by singles alone.
+    - hard: Well-known hard puzzles and generated ones that the techniques cannot finish.
+    - seventeen: Puzzles with 17 givens, the fewest a unique puzzle can have.
+    - pathological: Puzzles whose first row solves to 987654321, the worst case for a search that tries
+      numbers in order.
+
+Functions:
+    - load_corpus: Reads a bundled corpus.
+    - count_search: Counts the search nodes and guesses needed for one puzzle.
+    - run_corpus: Measures one list of puzzles.
+    - run: Measures several corpora.
+    - compare: Lists the regressions of a run against a baseline.
+    - main: Runs the benchmark from the command line.
+
+Constants:
+    - CORPORA_DIR: The directory holding the corpora, one puzzle per line.
+    - CORPORA: The names of the bundled corpora.
+
+Usage:
+    - Run `python benchmark.py -o baseline.json` once to store a baseline.
+    - Run `python benchmark.py --baseline baseline.json` after a change; the exit status is 1 if any corpus
+      regressed by more than the tolerance.
+
+Dependencies:
+    - board: Provides the `Board` class and puzzle parsing.
+    - puzzle_io: Provides the puzzle file reader.
+    - solver: Provides `Grid`, `search` and the engine names.
+    - stats: Provides `SolveStats`, which collects the search counts.
+"""
+
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from board import Board, parse_puzzle
+from puzzle_io import read_puzzles
+from solver import ENGINES, Grid, search
+from stats import SolveStats
+
+
+CORPORA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpora')
+CORPORA = ('easy', 'hard', 'seventeen', 'pathological')
+
+
+def load_corpus(name: str):
+    """
+    Reads a bundled corpus.
+
+    Args:
+        name (str): One of `CORPORA`.
+
+    Returns:
+        list of str: The puzzles of the corpus.
+    """
+    with open(os.path.join(CORPORA_DIR, name + '.txt'), encoding='utf-8') as file:
+        return list(read_puzzles(file))
+
+
+def count_search(puzzle: str):
+    """
+    Counts the search nodes and guesses the plain search needs to solve a puzzle.
+
+    Args:
+        puzzle (str): An 81-character puzzle string, with ' ', '.' or '0' for empty cells.
+
+    Returns:
+        SolveStats: The statistics of the search; every count is 0 if the givens conflict.
+    """
+    stats = SolveStats()
+    grid = Grid.from_digits(parse_puzzle(puzzle))
+    if grid is not None:
+        search(grid, stats)
+    return stats
+
+
+def _percentile(values, fraction: float):
+    """
+    Finds the nearest-rank percentile of a list of numbers.
+
+    Args:
+        values (list of float): The numbers.
+        fraction (float): The percentile as a fraction between 0 and 1.
+
+    Returns:
+        float: The percentile, or 0.0 for an empty list.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def run_corpus(puzzles, engine: str = 'backtracking', repeat: int = 1):
+    """
+    Solves every puzzle of a corpus and measures the solver.
+
+    Args:
+        puzzles (list of str): The puzzles to solve.
+        engine (str): Name of the solving engine in `solver.ENGINES`.
+        repeat (int): How many times to solve each puzzle; the fastest time counts.
+
+    Returns:
+        dict: The number of puzzles, the number left unsolved, the total time in seconds, puzzles per
+              second, the p50 and p99 latency in milliseconds, and the node and guess counts of each puzzle.
+    """
+    latencies = []
+    unsolved = 0
+    for puzzle in puzzles:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            solved = Board(puzzle).solve(engine)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        latencies.append(best)
+        unsolved += not solved
+
+    searches = [count_search(puzzle) for puzzle in puzzles]
+    seconds = sum(latencies)
+    return {
+        'puzzles': len(puzzles),
+        'unsolved': unsolved,
+        'seconds': seconds,
+        'puzzles_per_sec': len(puzzles) / seconds if seconds else 0.0,
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000,
+        'nodes': [stats.nodes for stats in searches],
+        'guesses': [stats.guesses for stats in searches],
+    }
+
+
+def run(corpora=CORPORA, engine: str = 'backtracking', repeat: int = 1):
+    """
+    Measures the solver on several bundled corpora.
+
+    Args:
+        corpora (iterable of str): Names of the corpora to run.
+        engine (str): Name of the solving engine in `solver.ENGINES`.
+        repeat (int): How many times to solve each puzzle; the fastest time counts.
+
+    Returns:
+        dict: The engine, the Python version and the `run_corpus` results of each corpus.
+    """
+    return {
+        'engine': engine,
+        'python': platform.python_version(),
+        'corpora': {name: run_corpus(load_corpus(name), engine, repeat) for name in corpora},
+    }
+
+
+def compare(results, baseline, tolerance: float = 0.25):
+    """
+    Lists the regressions of a run against a baseline, for the corpora both of them measured.
+
+    Puzzles per second and p99 latency regress if they are worse than the baseline by more than
+    `tolerance`. Node and guess counts do not depend on the machine, so any increase is a regression.
+
+    Args:
+        results (dict): The results of `run()`.
+        baseline (dict): Earlier results of `run()`.
+        tolerance (float): The allowed slowdown as a fraction of the baseline.
+
+    Returns:
+        list of str: A description of each regression; empty if there are none.
+    """
+    regressions = []
+    for name, result in results['corpora'].items():
+        base = baseline['corpora'].get(name)
+        if base is None:
+            continue
+
+        if result['puzzles_per_sec'] < base['puzzles_per_sec'] * (1 - tolerance):
+            regressions.append(f'{name}: {result["puzzles_per_sec"]:.1f} puzzles/sec, '
+                               f'baseline {base["puzzles_per_sec"]:.1f}')
+        if result['p99_ms'] > base['p99_ms'] * (1 + tolerance):
+            regressions.append(f'{name}: p99 {result["p99_ms"]:.2f} ms, baseline {base["p99_ms"]:.2f} ms')
+        for counter in ('nodes', 'guesses'):
+            if sum(result[counter]) > sum(base[counter]):
+                regressions.append(f'{name}: {sum(result[counter])} {counter}, baseline {sum(base[counter])}')
+
+    return regressions
+
+
+def parse_args(argv=None):
+    """
+    Parses the command-line arguments.
+
+    Args:
+        argv (list of str or None): The arguments, or None to read them from `sys.argv`.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the Sudoku solver.')
+    parser.add_argument('--corpus', action='append', choices=CORPORA,
+                        help='corpus to run; may be repeated (default: all)')
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='backtracking',
+                        help='solving engine')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='times to solve each puzzle; the fastest time counts')
+    parser.add_argument('-o', '--output',
+                        help='file to save the results to as JSON')
+    parser.add_argument('--baseline',
+                        help='JSON results of an earlier run to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown against the baseline, as a fraction')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Runs the benchmark, prints a summary, saves the results and checks them against a baseline.
+
+    Args:
+        argv (list of str or None): The command-line arguments, or None to read them from `sys.argv`.
+
+    Returns:
+        int: The exit status; 1 if any corpus regressed against the baseline, 0 otherwise.
+    """
+    args = parse_args(argv)
+    results = run(args.corpus or CORPORA, args.engine, args.repeat)
+
+    print(f'{"corpus":<14}{"puzzles":>8}{"puzzles/s":>12}{"p50 ms":>10}{"p99 ms":>10}{"nodes":>10}{"guesses":>10}')
+    for name, result in results['corpora'].items():
+        print(f'{name:<14}{result["puzzles"]:>8}{result["puzzles_per_sec"]:>12.1f}{result["p50_ms"]:>10.2f}'
+              f'{result["p99_ms"]:>10.2f}{sum(result["nodes"]):>10}{sum(result["guesses"]):>10}')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f'Regression: {regression}')
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,600 @@
+"""
+bitboard.py - Bitboard Solving Engine
+
+This module solves Sudoku on bitboards. Each number gets one integer with bit `i` set when cell `i` can still
+hold it (81 bits on a 9x9 board), and one more integer holds the filled cells. Python integers stand in for
+SIMD registers: each deduction is a short run of whole-board shifts, ANDs and ORs, not a loop over cells.
+
+    - Naked singles: two accumulators ORed across the number bitboards give the cells with at least one and at
+      least two candidates; the cells with exactly one are placed together.
+    - Hidden singles: the nine bitboards are stacked into one integer, one layer per number. Shifting the
+      stack by each offset of a row, column or box and masking with the units' first cells counts every unit
+      of every number at once, and each unit left with one cell is spread back onto that cell by a carry-free
+      multiplication.
+    - Box/line interactions: the same folds over the parts of each box on one row or column find pointing
+      pairs (a number's cells in a box all on one line) and box/line reduction (a number's cells on a line all
+      in one box) for every box, line and number together.
+
+Placing numbers clears their cells from the other numbers' bitboards and their peers from their own with one
+AND per number, however many are placed. `BitBoard.propagate` repeats the steps, always going back to the
+cheapest after a change, and the search branches on a cell with the fewest candidates, copying the ten integers
+of the board at each node instead of keeping a trail. The engine is registered in `solver.ENGINES` as
+'bitboard'; `propagate_board` runs the same deductions on a `Board` in place of its `find_candidates` and
+`propagate` loop.
+
+Classes:
+    - BitBoard: The number bitboards and the filled cells of a board, with placement and propagation.
+
+Functions:
+    - solve_bitboard: Solves a puzzle given as a flat list of numbers, with the same inputs and outputs as
+      the other engines registered in the `solver` module.
+    - propagate_board: Runs the bitboard deductions on a `Board` and writes the results back to its cells.
+
+Example:
+    ```python
+    board = BitBoard.from_digits(digits)
+    if board is not None and board.propagate():
+        print(board.to_digits())
+    ```
+
+Dependencies:
+    - units: Provides the units and peers of each cell for every board size.
+"""
+
+
+from collections import namedtuple
+import time
+
+from units import CLASSIC, geometry_for_cells
+
+
+_Masks = namedtuple('_Masks', ['full', 'peers', 'replicate', 'row_starts', 'col_starts', 'box_starts',
+                               'row_offsets', 'col_offsets', 'box_offsets', 'row_spread', 'col_spread',
+                               'box_spread', 'hseg_starts', 'vseg_starts', 'hseg_offsets', 'vseg_offsets',
+                               'hseg_spread', 'vseg_spread', 'hseg_row_offsets', 'vseg_col_offsets',
+                               'hseg_row_spread', 'vseg_col_spread', 'hseg_by_col', 'hseg_by_row', 'vseg_by_row',
+                               'vseg_by_col'])
+_Masks.__doc__ = """
+Holds the masks, shifts and multipliers of one board size.
+
+Masks named `*_starts` have a bit on the first cell of every unit or segment of their kind, in every number's
+layer of the stacked board. `(stack >> offset) & starts` brings one cell of every unit onto its first cell, so
+folding a stacked board over a unit's offsets counts every unit of every number at once. Multiplying bits on
+first cells by a `*_spread` value copies each bit onto its whole unit or segment without any carry, since the
+copies never overlap. A segment is the part of a box on one row (`hseg`) or on one column (`vseg`).
+"""
+
+_MASKS = {}
+
+# Maps the binary spelling of a bitboard, one character per cell, to 0 and the number it is the bitboard of
+_BINARY_DIGITS = tuple(bytes.maketrans(b'01', bytes((0, digit))) for digit in range(26))
+
+
+def _unit_masks(tables):
+    """
+    Returns the masks of a board size, building them once.
+
+    Args:
+        tables (Geometry): The tables of the board size.
+
+    Returns:
+        _Masks: The masks.
+    """
+    masks = _MASKS.get(tables.box_size)
+    if masks is not None:
+        return masks
+
+    box_size, size, cells = tables.box_size, tables.size, tables.cells
+    replicate = sum(1 << (cells * number) for number in range(size))
+
+    def stacked(indices):
+        mask = 0
+        for index in indices:
+            mask |= 1 << index
+        return mask * replicate
+
+    def mask_of(indices):
+        mask = 0
+        for index in indices:
+            mask |= 1 << index
+        return mask
+
+    corners = range(0, size, box_size)
+    hseg_starts = [row * size + col for row in range(size) for col in corners]
+    vseg_starts = [row * size + col for row in corners for col in range(size)]
+    masks = _MASKS[tables.box_size] = _Masks(
+        full=(1 << cells) - 1,
+        peers=tuple(mask_of(peers) for peers in tables.peers),
+        replicate=replicate,
+        row_starts=stacked(unit[0] for unit in tables.row_units),
+        col_starts=stacked(unit[0] for unit in tables.col_units),
+        box_starts=stacked(unit[0] for unit in tables.box_units),
+        row_offsets=tuple(range(size)),
+        col_offsets=tuple(range(0, cells, size)),
+        box_offsets=tuple(index for index in tables.box_units[0]),
+        row_spread=mask_of(tables.row_units[0]),
+        col_spread=mask_of(tables.col_units[0]),
+        box_spread=mask_of(tables.box_units[0]),
+        hseg_starts=stacked(hseg_starts),
+        vseg_starts=stacked(vseg_starts),
+        hseg_offsets=tuple(range(box_size)),
+        vseg_offsets=tuple(range(0, box_size * size, size)),
+        hseg_spread=mask_of(range(box_size)),
+        vseg_spread=mask_of(range(0, box_size * size, size)),
+        hseg_row_offsets=tuple(corners),
+        vseg_col_offsets=tuple(corner * size for corner in corners),
+        hseg_row_spread=mask_of(corners),
+        vseg_col_spread=mask_of(corner * size for corner in corners),
+        hseg_by_col=tuple((col, stacked(index for index in hseg_starts if index % size == col)) for col in corners),
+        hseg_by_row=tuple((row * size, stacked(index for index in hseg_starts if index // size % box_size == row))
+                          for row in range(box_size)),
+        vseg_by_row=tuple((row * size, stacked(index for index in vseg_starts if index // size == row))
+                          for row in corners),
+        vseg_by_col=tuple((col, stacked(index for index in vseg_starts if index % box_size == col))
+                          for col in range(box_size)),
+    )
+    return masks
+
+
+def _fold(stack: int, offsets, starts: int):
+    """
+    Counts, up to two, the set bits of every unit or segment of a stacked board at once.
+
+    Args:
+        stack (int): The stacked board.
+        offsets (tuple of int): The offset of each cell of a unit from its first cell.
+        starts (int): The first cell of every unit, in every layer.
+
+    Returns:
+        tuple of int: The units with at least one and at least two bits set, as bits on their first cells.
+    """
+    ones = twos = 0
+    for offset in offsets:
+        bits = (stack >> offset) & starts
+        twos |= ones & bits
+        ones |= bits
+    return ones, twos
+
+
+class BitBoard:
+    """
+    Represents a board as one bitboard per number.
+
+    Attributes:
+        positions (list of int): For each number (index 0 for 1), the cells that hold it or can still hold it.
+        placed (int): The cells whose number is known.
+        geometry (Geometry): The tables of the board size.
+    """
+
+    __slots__ = ('positions', 'placed', 'geometry', '_masks')
+
+    def __init__(self, geometry=CLASSIC, positions=None, placed: int = 0):
+        """
+        Initializes a board, empty unless bitboards are given.
+
+        Args:
+            geometry (Geometry): The tables of the board size.
+            positions (list of int or None): The number bitboards to use without copying.
+            placed (int): The cells whose number is known.
+        """
+        self.geometry = geometry
+        self._masks = _unit_masks(geometry)
+        self.positions = [self._masks.full] * geometry.size if positions is None else positions
+        self.placed = placed
+
+    @classmethod
+    def from_digits(cls, digits):
+        """
+        Builds a board from the numbers of a puzzle.
+
+        Args:
+            digits (list of int): The numbers in row-major order, with 0 for empty cells. Their count gives
+                                  the board size.
+
+        Returns:
+            BitBoard or None: The board with every given number placed, or None if the givens conflict.
+
+        Raises:
+            ValueError: If no supported board has that many cells.
+        """
+        board = cls(geometry_for_cells(len(digits)))
+        givens = [0] * board.geometry.size
+        for index, digit in enumerate(digits):
+            if digit:
+                givens[digit - 1] |= 1 << index
+        return board if board.assign_all(givens) else None
+
+    def copy(self):
+        """
+        Copies the board.
+
+        Returns:
+            BitBoard: The copy.
+        """
+        return BitBoard(self.geometry, self.positions[:], self.placed)
+
+    def to_digits(self):
+        """
+        Returns the numbers of the board.
+
+        Returns:
+            list of int: The numbers in row-major order, with 0 for cells whose number is not known.
+        """
+        # Each bitboard is spelled out in binary, one byte per cell, with its number in place of the ones, and
+        # the byte strings are added as integers; no cell holds two numbers, so nothing carries
+        cells = self.geometry.cells
+        total = 0
+        for digit, positions in enumerate(self.positions, 1):
+            bits = format(positions & self.placed, f'0{cells}b').encode()
+            total += int.from_bytes(bits.translate(_BINARY_DIGITS[digit]), 'big')
+        return list(total.to_bytes(cells, 'little'))
+
+    def cell_masks(self):
+        """
+        Returns the candidates of every cell in the layout of `Cell.mask`.
+
+        Returns:
+            list of int: The candidate mask of each cell, 0 for cells whose number is known.
+        """
+        masks = [0] * self.geometry.cells
+        for bit, positions in enumerate(self.positions):
+            positions &= ~self.placed
+            while positions:
+                low = positions & -positions
+                masks[low.bit_length() - 1] |= 1 << bit
+                positions ^= low
+        return masks
+
+    def place(self, index: int, digit: int):
+        """
+        Places a number in one cell.
+
+        Args:
+            index (int): Flat index of the cell.
+            digit (int): The number to place.
+
+        Returns:
+            bool: False if the number cannot go in that cell, True otherwise.
+        """
+        placements = [0] * len(self.positions)
+        placements[digit - 1] = 1 << index
+        return self.assign_all(placements)
+
+    def assign_all(self, placements):
+        """
+        Places any numbers in any cells at once. Each number's bitboard is updated with a single AND and OR
+        that clear the new cells and the peers of the number's new cells, whatever the number of placements.
+
+        Args:
+            placements (list of int): For each number (index 0 for 1), the cells to place it in as a
+                                      bitboard, 0 for none.
+
+        Returns:
+            bool: False if a number cannot go in one of its cells, two numbers share a cell or a number is
+                  placed in two peers, True otherwise. The board is left unchanged after False.
+        """
+        positions = self.positions
+        peers = self._masks.peers
+        new = 0
+        count = 0
+        eliminated = []
+        for number, cells in enumerate(placements):
+            removed = 0
+            if cells:
+                if cells & ~positions[number]:
+                    return False
+                new |= cells
+                count += cells.bit_count()
+                rest = cells
+                while rest:
+                    low = rest & -rest
+                    rest ^= low
+                    removed |= peers[low.bit_length() - 1]
+                if removed & cells:
+                    return False
+            eliminated.append(removed)
+
+        if new.bit_count() != count:
+            return False
+        keep = ~new
+        for number, cells in enumerate(placements):
+            positions[number] = (positions[number] & keep & ~eliminated[number]) | cells
+        self.placed |= new
+        return True
+
+    def _counts(self):
+        """
+        Counts the candidates of every cell at once, up to three.
+
+        Returns:
+            tuple of int: The cells with at least one, at least two and at least three candidates, where a
+                          cell whose number is known counts as one.
+        """
+        ones = twos = threes = 0
+        for positions in self.positions:
+            threes |= twos & positions
+            twos |= ones & positions
+            ones |= positions
+        return ones, twos, threes
+
+    def _naked_singles(self):
+        """
+        Places every empty cell that has a single candidate.
+
+        Returns:
+            bool or None: None on a contradiction, otherwise whether anything was placed.
+        """
+        ones = twos = 0
+        for positions in self.positions:
+            twos |= ones & positions
+            ones |= positions
+        if ones != self._masks.full:
+            return None
+
+        singles = ones & ~twos & ~self.placed
+        if not singles:
+            return False
+
+        # A cell with one candidate is in no other number's bitboard, so only the peers need clearing
+        peers = self._masks.peers
+        numbers = self.positions
+        for number, positions in enumerate(numbers):
+            cells = singles & positions
+            if cells:
+                eliminated = 0
+                while cells:
+                    low = cells & -cells
+                    cells ^= low
+                    eliminated |= peers[low.bit_length() - 1]
+                if eliminated & singles & positions:
+                    return None
+                numbers[number] = positions & ~eliminated
+        self.placed |= singles
+        return True
+
+    def _stack(self):
+        """
+        Stacks the number bitboards into one integer, the bitboard of each number shifted into a layer of
+        its own, so one shift or AND works on every number at once.
+
+        Returns:
+            int: The stacked board.
+        """
+        cells = self.geometry.cells
+        stack = 0
+        for number, positions in enumerate(self.positions):
+            stack |= positions << (cells * number)
+        return stack
+
+    def _unstack(self, stack: int):
+        """
+        Splits a stacked board back into the number bitboards.
+
+        Args:
+            stack (int): The stacked board.
+
+        Returns:
+            list of int: The bitboard of each number.
+        """
+        cells, full = self.geometry.cells, self._masks.full
+        return [(stack >> (cells * number)) & full for number in range(len(self.positions))]
+
+    def _hidden_singles(self):
+        """
+        Places every number that has a single possible cell left in a row, column or box, finding them for
+        every unit and number in one fold of the stacked board per kind of unit.
+
+        Returns:
+            bool or None: None on a contradiction, otherwise whether anything was placed.
+        """
+        masks = self._masks
+        stack = self._stack()
+        spread = 0
+        for offsets, starts, unit in ((masks.row_offsets, masks.row_starts, masks.row_spread),
+                                      (masks.col_offsets, masks.col_starts, masks.col_spread),
+                                      (masks.box_offsets, masks.box_starts, masks.box_spread)):
+            ones, twos = _fold(stack, offsets, starts)
+            if ones != starts:
+                return None
+            spread |= (ones & ~twos) * unit
+
+        singles = stack & spread & ~(self.placed * masks.replicate)
+        if not singles:
+            return False
+        return True if self.assign_all(self._unstack(singles)) else None
+
+    def _box_line(self):
+        """
+        Removes candidates with pointing pairs (a number's cells in a box all on one line) and box/line
+        reduction (a number's cells on a line all in one box), for every box, line and number at once.
+
+        Returns:
+            bool: Whether any candidate was removed.
+        """
+        masks = self._masks
+        stack = self._stack()
+        eliminated = 0
+
+        # The segments of each row that still hold each number, then the boxes and rows with only one of them
+        hsegs = 0
+        for offset in masks.hseg_offsets:
+            hsegs |= stack >> offset
+        hsegs &= masks.hseg_starts
+
+        ones, twos = _fold(hsegs, masks.vseg_offsets, masks.box_starts)
+        pointing = hsegs & (ones & ~twos) * masks.vseg_spread
+        for shift, starts in masks.hseg_by_col:
+            segments = pointing & starts
+            if segments:
+                eliminated |= (segments >> shift) * masks.row_spread & ~(segments * masks.hseg_spread)
+
+        ones, twos = _fold(hsegs, masks.hseg_row_offsets, masks.row_starts)
+        claiming = hsegs & (ones & ~twos) * masks.hseg_row_spread
+        for shift, starts in masks.hseg_by_row:
+            segments = claiming & starts
+            if segments:
+                eliminated |= (segments >> shift) * masks.box_spread & ~(segments * masks.hseg_spread)
+
+        # The same for the segments of each column
+        vsegs = 0
+        for offset in masks.vseg_offsets:
+            vsegs |= stack >> offset
+        vsegs &= masks.vseg_starts
+
+        ones, twos = _fold(vsegs, masks.hseg_offsets, masks.box_starts)
+        pointing = vsegs & (ones & ~twos) * masks.hseg_spread
+        for shift, starts in masks.vseg_by_row:
+            segments = pointing & starts
+            if segments:
+                eliminated |= (segments >> shift) * masks.col_spread & ~(segments * masks.vseg_spread)
+
+        ones, twos = _fold(vsegs, masks.vseg_col_offsets, masks.col_starts)
+        claiming = vsegs & (ones & ~twos) * masks.vseg_col_spread
+        for shift, starts in masks.vseg_by_col:
+            segments = claiming & starts
+            if segments:
+                eliminated |= (segments >> shift) * masks.box_spread & ~(segments * masks.vseg_spread)
+
+        eliminated &= stack
+        if not eliminated:
+            return False
+        self.positions = self._unstack(stack ^ eliminated)
+        return True
+
+    def propagate(self):
+        """
+        Repeats naked singles, hidden singles and box/line interactions, always going back to the cheapest
+        step after a change, until none of them changes anything.
+
+        Returns:
+            bool: False if the board has no solution, True otherwise.
+        """
+        while True:
+            for step in (self._naked_singles, self._hidden_singles, self._box_line):
+                changed = step()
+                if changed is None:
+                    return False
+                if changed:
+                    break
+            else:
+                return True
+
+    def best_cell(self):
+        """
+        Finds an empty cell with the fewest candidates, looking at every cell only when no cell has two.
+
+        Returns:
+            int: Flat index of the cell, or -1 if every number is known.
+        """
+        empty = self._masks.full & ~self.placed
+        if not empty:
+            return -1
+
+        _, twos, threes = self._counts()
+        pairs = empty & twos & ~threes
+        if pairs:
+            return (pairs & -pairs).bit_length() - 1
+
+        best = -1
+        best_count = len(self.positions) + 1
+        while empty:
+            low = empty & -empty
+            empty ^= low
+            count = sum(1 for positions in self.positions if positions & low)
+            if count < best_count:
+                best = low.bit_length() - 1
+                best_count = count
+        return best
+
+
+def _search(board: BitBoard, stats, depth: int, deadline):
+    """
+    Solves a board with propagation and depth-first search, copying the board at each guess.
+
+    Args:
+        board (BitBoard): The board to solve; it may be changed.
+        stats (SolveStats or None): If given, the nodes, guesses, backtracks and depth are added to it.
+        depth (int): The depth of this node, for `stats.max_depth`.
+        deadline (float or None): The `time.monotonic()` value at which to give up, or None.
+
+    Returns:
+        BitBoard or None: The solved board, or None if there is no solution.
+
+    Raises:
+        TimeoutError: If the deadline passes.
+    """
+    if stats is not None:
+        stats.nodes += 1
+        stats.max_depth = max(stats.max_depth, depth)
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError('The search ran past its deadline.')
+
+    if not board.propagate():
+        return None
+    index = board.best_cell()
+    if index < 0:
+        return board
+
+    bit = 1 << index
+    for digit in range(1, len(board.positions) + 1):
+        if not board.positions[digit - 1] & bit:
+            continue
+        if stats is not None:
+            stats.guesses += 1
+
+        child = board.copy()
+        child.place(index, digit)
+        solved = _search(child, stats, depth + 1, deadline)
+        if solved is not None:
+            return solved
+        if stats is not None:
+            stats.backtracks += 1
+
+    return None
+
+
+def solve_bitboard(digits, stats=None, deadline=None):
+    """
+    Solves a puzzle with bitboard propagation and depth-first search.
+
+    Args:
+        digits (list of int): The numbers of the puzzle in row-major order, with 0 for empty cells.
+        stats (SolveStats or None): If given, the search adds its counters to it.
+        deadline (float or None): The `time.monotonic()` value at which to give up, or None to search
+                                  without a time limit.
+
+    Returns:
+        list of int or None: The numbers of the solution, or None if the puzzle has no solution.
+
+    Raises:
+        ValueError: If no supported board has that many cells.
+        TimeoutError: If the deadline passes before the search ends.
+    """
+    board = BitBoard.from_digits(digits)
+    if board is None:
+        return None
+    solved = _search(board, stats, 0, deadline)
+    return None if solved is None else solved.to_digits()
+
+
+def propagate_board(board):
+    """
+    Runs the bitboard deductions on a `Board` and writes the numbers and candidates they leave back to its
+    cells, in place of `find_candidates` followed by `propagate`.
+
+    Args:
+        board (Board): The board to update.
+
+    Returns:
+        bool: False if the board has no solution, in which case it is left unchanged; True otherwise.
+    """
+    bits = BitBoard.from_digits(board.to_digits())
+    if bits is None or not bits.propagate():
+        return False
+
+    for cell, digit, mask in zip(board.cells, bits.to_digits(), bits.cell_masks()):
+        if digit:
+            cell.number = digit
+        cell.mask = mask
+    board.update_unit_masks()
+    return True
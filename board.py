@@ -4,28 +4,67 @@ board.py - Sudoku Board Management Module
 This module defines the `Board` class, which represents a 9x9 Sudoku board and contains methods to
 manage the board's cells, find candidate numbers for empty cells, and apply solving techniques.
 The `Board` class uses the `Cell` class from the `cell` module to represent each cell on the board.
+Alongside the cells, the board keeps a 9-bit "used digits" mask for every row, column and 3x3 box, so a
+cell's candidates are found with a single AND/NOT of three integers.
+
+Boards of other sizes work the same way: a board with n x n boxes has n * n numbers, masks of that many bits
+and the index tables of `units.geometry(n)`. Puzzle strings write the numbers 10-25 as 'A'-'P', so a 16x16
+board is a 256-character string and a 25x25 board a 625-character one.
 
 Classes:
     - Board: Manages the layout and operations of a 9x9 Sudoku grid. It initializes from an input string
       representing the initial puzzle state and includes methods for finding possible values for each
       cell, based on Sudoku constraints within rows, columns, and 3x3 subgrids.
 
+Constants:
+    - BLANKS: The characters accepted for empty cells.
+    - TECHNIQUES: The registered logical techniques as (cost, name, function) tuples, cheapest first.
+
+Functions:
+    - parse_puzzle: Converts a puzzle string into a flat list of numbers without building cells.
+    - format_digits: Converts a flat list of numbers back into a puzzle string.
+    - solve_puzzle: Solves a puzzle string and returns the solution string; the library entry point.
+    - register_technique: Decorator that adds a logical technique to `TECHNIQUES`.
+    - hidden_singles, naked_pairs, pointing_pairs, box_line_reduction, hidden_pairs, naked_triples,
+      hidden_triples: The built-in techniques, registered in that order of cost.
+
 Key Methods:
-    - __init__: Initializes the board with a provided string of 81 characters, where each character represents
-      a cell's value or is a blank space (' ') for empty cells.
+    - __init__: Initializes the board with a provided string of 81 characters (or 16, 256 or 625 for other
+      sizes), where each character represents a cell's value or is a blank space (' '), '.' or '0' for
+      empty cells.
+    - from_digits: Builds a board from a flat list of numbers, skipping the puzzle string.
     - add_cell_num: Sets a specific number for a cell in the board.
+    - place: Sets a cell's number, updates the unit masks and removes the number from the candidates of the
+      cell's 20 peers, queueing any peer left with a single candidate.
+    - propagate: Places queued single candidates until none remain, touching only the peers of each placement.
     - output: Outputs the board’s current state to the console, showing numbers and blank spaces for empty cells.
     - find_candidates: Finds potential candidate values for each empty cell by eliminating values found in the
-      same row, column, and 3x3 subgrid.
+      same row, column, and 3x3 subgrid, using the board's unit masks.
+    - update_unit_masks: Rebuilds the row, column and box masks from the cells' current numbers.
     - check_cell_row, check_cell_col, check_cell_box: Supporting methods for `find_candidates` that respectively
       eliminate candidates in the same row, column, and subgrid.
     - apply_mono_candidates: Sets the number for a cell if it has exactly one candidate, confirming it as the
       final value for that cell.
+    - remove_candidates: Removes candidates from a cell, queueing it for `propagate` if one or none are left.
+    - apply_techniques: Runs the registered techniques, cheapest first, until none of them makes progress.
+    - to_digits: Returns the board's numbers as a flat list of integers, with 0 for empty cells.
+    - solve: Completes the board with the logical techniques and then one of the engines registered in the
+      `solver` module (depth-first search by default, dancing links or bitboards), or reports that it has no
+      solution.
+      Given a `stats.SolveStats`, the techniques and the engine add their counters and timers to it.
+    - count_solutions: Counts the board's solutions up to a limit, stopping as soon as it is reached.
+    - is_unique: Checks whether the board has exactly one solution.
 
 Usage:
     - Initialize a `Board` instance with an 81-character string to represent the starting state of the board.
     - Call `find_candidates()` to calculate possible candidates for each empty cell.
-    - Use `apply_mono_candidates()` to fill in cells with a single candidate.
+    - Use `apply_mono_candidates()` to fill in cells with a single candidate, or `propagate()` to keep placing
+      single candidates until no more can be found.
+    - Or call `bitboard.propagate_board()` to do both, along with hidden singles and box/line interactions, on
+      bitboards.
+    - Call `apply_techniques()` to make every logical deduction the registered techniques can find.
+    - Call `solve()` to fill in every remaining cell.
+    - Pass a `variants.Variant` to solve diagonal, windoku or killer puzzles under their extra rules.
     - Use `output()` to display the current state of the board.
 
 Example:
@@ -33,49 +72,200 @@ Example:
     init_nums = "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7"
     board = Board(init_nums)
     board.find_candidates()
-    board.apply_mono_candidates()
+    board.propagate()
     board.output()
+
+    solution = solve_puzzle(init_nums)
     ```
 
 Dependencies:
     - cell: Contains the `Cell` class, which represents individual cells on the board, with attributes
-      for the cell's number and potential candidates.
+      for the cell's number and potential candidates, and the characters used for numbers above 9.
+    - solver: Contains the registry of solving engines used by `solve`.
+    - units: Contains the precomputed peer, unit and cell-to-unit tables of each board size that every
+      candidate elimination on the board goes through.
 """
 
 
 
-from cell import Cell
+import time
+from itertools import combinations
+
+from cell import Cell, DIGIT_CHARS, mask_digits
+from solver import Grid, count_solutions, get_engine
+from units import geometry, geometry_for_cells
+
+
+BLANKS = ' .0'
+
+_CHAR_DIGITS = {char: 0 for char in BLANKS}
+for _digit, _char in enumerate(DIGIT_CHARS, 1):
+    _CHAR_DIGITS[_char] = _CHAR_DIGITS[_char.lower()] = _digit
+
+TECHNIQUES = []
+
+def parse_puzzle(init_nums: str, box_size=None):
+    """
+    Converts a puzzle string into the flat list of numbers used by the solving engines.
+
+    Args:
+        init_nums (str): A string with one character per cell: '1'-'9', then 'A'-'P' (or 'a'-'p') for the
+                         numbers 10-25, and a space (' '), '.' or '0' for empty cells. A 9x9 board has 81
+                         characters, a 16x16 board 256 and a 25x25 board 625.
+        box_size (int or None): The box size of the board, or None to tell it from the length of the string.
+
+    Returns:
+        list of int: The numbers in row-major order, with 0 for empty cells.
+
+    Raises:
+        ValueError: If the input string has the wrong length for the board or holds a character that
+                    is neither a number of the board nor a blank.
+    """
+    tables = geometry_for_cells(len(init_nums)) if box_size is None else geometry(box_size)
+    if len(init_nums) != tables.cells:
+        raise ValueError(f'init_nums isn\'t {tables.cells} characters.')
+
+    try:
+        digits = [_CHAR_DIGITS[char] for char in init_nums]
+    except KeyError as error:
+        raise ValueError('Puzzle holds a character that is not a number or blank.') from error
+    if tables.size < len(DIGIT_CHARS) and max(digits) > tables.size:
+        raise ValueError('Puzzle holds a number that is too large for the board.')
+
+    return digits
+
+
+def register_technique(name: str, cost: int):
+    """
+    Registers a logical technique for `Board.apply_techniques`.
+
+    A technique is a function that takes a `Board` whose candidates have been found, removes
+    candidates or places numbers, and returns the number of changes it made. It should remove
+    candidates with `Board.remove_candidates` so cells left with one candidate are placed by
+    `Board.propagate`.
+
+    Args:
+        name (str): Name of the technique.
+        cost (int): Relative cost; cheaper techniques are tried first.
+
+    Returns:
+        function: Decorator that registers the technique and returns it unchanged.
+    """
+    def decorator(function):
+        TECHNIQUES.append((cost, name, function))
+        TECHNIQUES.sort(key=lambda technique: technique[0])
+        return function
+
+    return decorator
+
+
+def format_digits(digits, blank: str = ' '):
+    """
+    Converts a flat list of numbers into a puzzle string, writing 'A'-'P' for the numbers 10-25.
+
+    Args:
+        digits (list of int): The numbers in row-major order, with 0 for empty cells.
+        blank (str): The character written for empty cells.
+
+    Returns:
+        str: The puzzle string, one character per cell.
+    """
+    return ''.join(DIGIT_CHARS[digit - 1] if digit else blank for digit in digits)
 
 
 class Board:
     """
-    Represents a 9x9 Sudoku board with methods to manage cell numbers and candidate lists.
+    Represents a Sudoku board, 9x9 by default or 4x4, 16x16 or 25x25, with methods to manage cell numbers
+    and candidate lists.
 
     Attributes:
+        geometry (Geometry): The index tables of the board size, from `units.geometry()`, or those of the
+                             variant, whose extra units and cages every placement and technique goes through.
+        variant (Variant or None): The extra rules of a variant puzzle, or None for the classic rules.
         board (list of lists of Cell): A 2D list of Cell objects representing the board.
+        cells (list of Cell): The same Cell objects in row-major order, indexed like the `geometry` tables.
+        row_masks (list of int): Bitmask of the numbers used in each row.
+        col_masks (list of int): Bitmask of the numbers used in each column.
+        box_masks (list of int): Bitmask of the numbers used in each box, numbered left to right,
+                                 top to bottom.
+        _singles (list of int): Indices of empty cells left with a single candidate, waiting to be
+                                placed by `propagate`.
     """
 
-    def __init__(self, init_nums: str):
+    def __init__(self, init_nums: str, box_size=None, variant=None):
         """
         Initializes the board using a string representing the initial numbers on the Sudoku board.
 
         Args:
-            init_nums (str): An 81-character string where each character represents a cell's number,
-                             with a space (' ') for empty cells.
+            init_nums (str): A string where each character represents a cell's number, in the format
+                             read by `parse_puzzle`: 81 characters for a 9x9 board, with a space (' '),
+                             '.' or '0' for empty cells.
+            box_size (int or None): The box size of the board, or None to tell it from the length of
+                                    `init_nums`.
+            variant (Variant or None): The extra rules of a variant puzzle (see the `variants` module), or
+                                       None for the classic rules.
+        Raises:
+            ValueError: If the input string has the wrong length for the board or holds a character that
+                        is neither a number nor a blank.
+        """
+        if variant is not None:
+            box_size = variant.geometry.box_size
+        self._load(parse_puzzle(init_nums, box_size), variant)
+
+    @classmethod
+    def from_digits(cls, digits, variant=None):
+        """
+        Builds a board straight from the numbers of a puzzle, without going through a puzzle string.
+
+        Args:
+            digits (sequence of int): The numbers in row-major order, with 0 for empty cells. Their count
+                                      gives the board size.
+            variant (Variant or None): The extra rules of a variant puzzle, or None for the classic rules.
+
+        Returns:
+            Board: The board.
+
         Raises:
-            ValueError: If the input string is not exactly 81 characters.
+            ValueError: If no supported board has that many cells, the variant is for another size or a
+                        number is too large for the board.
+        """
+        tables = geometry_for_cells(len(digits))
+        if max(digits) > tables.size:
+            raise ValueError('Puzzle holds a number that is too large for the board.')
+        if variant is not None and variant.geometry.cells != tables.cells:
+            raise ValueError(f'The variant is for {variant.geometry.cells} cells, not {tables.cells}.')
+
+        board = cls.__new__(cls)
+        board._load(digits, variant)
+        return board
+
+    def _load(self, digits, variant=None):
         """
-        if len(init_nums) != 81:
-            raise ValueError('init_nums isn\'t 81 characters.')
+        Builds the cells and unit masks from the numbers of a puzzle.
 
-        self.board = [[None] * 9 for _ in range(9)]
-        for row in range(9):
-            for col in range(9):
-                curr_num = init_nums[row * 9 + col]
-                if curr_num == ' ':
+        Args:
+            digits (sequence of int): The numbers in row-major order, with 0 for empty cells.
+            variant (Variant or None): The extra rules of a variant puzzle, or None for the classic rules.
+        """
+        self.variant = variant
+        self.geometry = geometry_for_cells(len(digits)) if variant is None else variant.geometry
+        size = self.geometry.size
+
+        self.board = [[None] * size for _ in range(size)]
+        for row in range(size):
+            for col in range(size):
+                curr_num = digits[row * size + col]
+                if curr_num == 0:
                     self.board[row][col] = Cell()
                 else:
-                    self.board[row][col] = Cell(int(curr_num))
+                    self.board[row][col] = Cell(curr_num)
+        self.cells = [cell for row in self.board for cell in row]
+
+        self.row_masks = [0] * size
+        self.col_masks = [0] * size
+        self.box_masks = [0] * size
+        self.update_unit_masks()
+        self._singles = []
 
     def add_cell_num(self, row, col, cell_num: int):
         """
@@ -88,6 +278,81 @@ class Board:
         """
         self.board[row][col].number = cell_num
 
+    def place(self, row: int, col: int, cell_num: int):
+        """
+        Sets a cell's number and removes it from the candidates of the cell's row, column and box peers.
+        Peers left with a single candidate are queued for `propagate`.
+
+        Candidates must already have been found with `find_candidates`.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+            cell_num (int): The number to place in the cell.
+
+        Returns:
+            bool: False if a peer was left without any candidate, True otherwise.
+        """
+        return self._place(row * self.geometry.size + col, cell_num)
+
+    def _place(self, index: int, cell_num: int):
+        """
+        Implements `place` for a cell given by its row-major index.
+
+        Args:
+            index (int): Index of the cell in `cells`.
+            cell_num (int): The number to place in the cell.
+
+        Returns:
+            bool: False if a peer was left without any candidate, True otherwise. Such a peer is
+                  also queued, so `propagate` reports the contradiction.
+        """
+        cells = self.cells
+        tables = self.geometry
+        cell = cells[index]
+        cell.number = cell_num
+        cell.mask = 0
+
+        bit = 1 << (cell_num - 1)
+        self.row_masks[tables.row_of[index]] |= bit
+        self.col_masks[tables.col_of[index]] |= bit
+        self.box_masks[tables.box_of[index]] |= bit
+
+        consistent = True
+        for peer_index in tables.peers[index]:
+            peer = cells[peer_index]
+            if peer.number is not None or not peer.mask & bit:
+                continue
+
+            peer.mask ^= bit
+            if not peer.mask:
+                consistent = False
+            if not peer.mask & (peer.mask - 1):
+                self._singles.append(peer_index)
+
+        return consistent
+
+    def propagate(self):
+        """
+        Places queued single candidates, and the singles they create in turn, until none remain.
+
+        Returns:
+            bool: False if a placement left some cell without any candidate, True otherwise.
+        """
+        singles = self._singles
+        cells = self.cells
+        while singles:
+            index = singles.pop()
+            cell = cells[index]
+            if cell.number is not None:
+                continue
+
+            if not cell.mask or not self._place(index, cell.mask.bit_length()):
+                singles.clear()
+                return False
+
+        return True
+
     def output(self):
         """
         Prints the current state of the board in a readable format,
@@ -96,31 +361,65 @@ class Board:
         for b in self.board:
             print('[', end='')
             for cell in b:
-                n = ' ' if cell.number is None else cell.number
+                n = ' ' if cell.number is None else DIGIT_CHARS[int(cell.number) - 1]
                 print(n, end='')
                 if cell != b[-1]:
                     print(', ', end='')
             print(']')
 
+    def update_unit_masks(self):
+        """
+        Rebuilds the used-number masks of every row, column and box from the cells' numbers.
+        """
+        tables = self.geometry
+        row_masks = [0] * tables.size
+        col_masks = [0] * tables.size
+        box_masks = [0] * tables.size
+        for index, cell in enumerate(self.cells):
+            if cell.number is not None:
+                bit = 1 << (int(cell.number) - 1)
+                row_masks[tables.row_of[index]] |= bit
+                col_masks[tables.col_of[index]] |= bit
+                box_masks[tables.box_of[index]] |= bit
+
+        self.row_masks = row_masks
+        self.col_masks = col_masks
+        self.box_masks = box_masks
+
     def find_candidates(self):
         """
         Finds all possible candidate numbers for each empty cell on the board by checking
         rows, columns, and 3x3 subgrids for conflicts.
-        """
-        for row in range(9):
-            for col in range(9):
-                cell = self.board[row][col]
-                if cell.number is not None:
-                    continue
 
-                if cell.candidates == []:
-                    for n in range(1, 10):
-                        cell.add_candidate(n)
-
-                self.check_cell_row(row, col, cell)
-                self.check_cell_col(row, col, cell)
-                self.check_cell_box(row, col, cell)
+        Candidates already eliminated from a cell stay eliminated; a cell with no candidates
+        starts from every number. Cells left with a single candidate are queued for `propagate`.
+        On a variant board the numbers of the cell's other peers, from extra units and cages, are
+        eliminated too; cage sums are only enforced by `solve`.
+        """
+        self.update_unit_masks()
+        singles = self._singles
+        singles.clear()
+        row_masks = self.row_masks
+        col_masks = self.col_masks
+        box_masks = self.box_masks
+        tables = self.geometry
+        row_of, col_of, box_of = tables.row_of, tables.col_of, tables.box_of
+        all_candidates = tables.all_candidates
+        cells = self.cells
+        peers = None if self.variant is None else tables.peers
+        for index, cell in enumerate(cells):
+            if cell.number is not None:
+                continue
 
+            used = row_masks[row_of[index]] | col_masks[col_of[index]] | box_masks[box_of[index]]
+            if peers is not None:
+                for peer in peers[index]:
+                    if cells[peer].number is not None:
+                        used |= 1 << (int(cells[peer].number) - 1)
+            mask = (cell.mask or all_candidates) & ~used
+            cell.mask = mask
+            if mask and not mask & (mask - 1):
+                singles.append(index)
 
     def check_cell_row(self, row_of_cell: int, col_of_cell: int, cell: Cell):
         """
@@ -131,13 +430,7 @@ class Board:
             col_of_cell (int): Column index of the cell being checked.
             cell (Cell): The cell whose candidates are being modified.
         """
-        for col in range(9):
-            if col == col_of_cell:
-                continue
-
-            curr_num = self.board[row_of_cell][col].number
-            if curr_num is not None:
-                cell.remove_candidate(curr_num)
+        self._eliminate(cell, self._unit_used(row_of_cell, row_of_cell * self.geometry.size + col_of_cell))
 
     def check_cell_col(self, row_of_cell: int, col_of_cell: int, cell: Cell):
         """
@@ -148,34 +441,54 @@ class Board:
             col_of_cell (int): Column index of the cell being checked.
             cell (Cell): The cell whose candidates are being modified.
         """
-        for row in range(9):
-            if row == row_of_cell:
-                continue
-
-            curr_num = self.board[row][col_of_cell].number
-            if curr_num is not None:
-                cell.remove_candidate(curr_num)
+        size = self.geometry.size
+        self._eliminate(cell, self._unit_used(size + col_of_cell, row_of_cell * size + col_of_cell))
 
     def check_cell_box(self, row_of_cell: int, col_of_cell: int, cell: Cell):
         """
         Eliminates candidates for a cell based on numbers
-        found in the 3x3 subgrid containing the cell.
+        found in the box containing the cell.
 
         Args:
             row_of_cell (int): Row index of the cell being checked.
             col_of_cell (int): Column index of the cell being checked.
             cell (Cell): The cell whose candidates are being modified.
         """
-        row_start = row_of_cell // 3 * 3
-        col_start = col_of_cell // 3 * 3
-        for row in range(row_start, row_start + 3):
-            for col in range(col_start, col_start + 3):
-                if row == row_of_cell and col == col_of_cell:
-                    continue
+        size = self.geometry.size
+        index = row_of_cell * size + col_of_cell
+        self._eliminate(cell, self._unit_used(2 * size + self.geometry.box_of[index], index))
+
+    def _unit_used(self, unit: int, skip_index: int):
+        """
+        Collects the numbers used in a unit, leaving out one cell.
+
+        Args:
+            unit (int): Index of the unit in `geometry.units`.
+            skip_index (int): Index of the cell to leave out.
+
+        Returns:
+            int: Bitmask of the numbers found.
+        """
+        cells = self.cells
+        used = 0
+        for index in self.geometry.units[unit]:
+            curr_num = cells[index].number
+            if index != skip_index and curr_num is not None:
+                used |= 1 << (int(curr_num) - 1)
+
+        return used
 
-                curr_num = self.board[row][col].number
-                if curr_num is not None:
-                    cell.remove_candidate(curr_num)
+    @staticmethod
+    def _eliminate(cell: Cell, used: int):
+        """
+        Removes every number in `used` from an empty cell's candidates.
+
+        Args:
+            cell (Cell): The cell whose candidates are being modified.
+            used (int): Bitmask of the numbers to remove.
+        """
+        if cell.number is None:
+            cell.mask &= ~used
 
     def apply_mono_candidates(self):
         """
@@ -183,5 +496,466 @@ class Board:
         """
         for row in self.board:
             for cell in row:
-                if cell.number is None and len(cell.candidates) == 1:
-                    cell.number = cell.candidates[0]
+                mask = cell.mask
+                if cell.number is None and mask and not mask & (mask - 1):
+                    cell.number = mask.bit_length()
+
+    def remove_candidates(self, index: int, mask: int):
+        """
+        Removes candidates from an empty cell. A cell left with one candidate, or none, is queued
+        for `propagate`.
+
+        Args:
+            index (int): Index of the cell in `cells`.
+            mask (int): Bitmask of the candidates to remove.
+
+        Returns:
+            bool: True if any candidate was removed, False otherwise.
+        """
+        cell = self.cells[index]
+        removed = cell.mask & mask
+        if not removed:
+            return False
+
+        cell.mask ^= removed
+        if not cell.mask & (cell.mask - 1):
+            self._singles.append(index)
+        return True
+
+    def apply_techniques(self, trace=None, stats=None):
+        """
+        Finds the candidates, then applies the registered techniques in order of cost. Whenever one makes
+        progress, its single candidates are placed and the pipeline starts again from the cheapest technique.
+        It stops once the board is complete or every technique stalls.
+
+        Args:
+            trace (list or None): If given, a `(name, changes)` tuple is appended for every step that made
+                                  progress, with 'naked_single' for the cells placed by `propagate`.
+            stats (SolveStats or None): If given, the time, eliminations and placements of every step are
+                                        added to it.
+
+        Returns:
+            bool: False if a contradiction was found, True otherwise.
+        """
+        self._run_step('find_candidates', self.find_candidates, stats)
+        if not self._traced_propagate(trace, stats):
+            return False
+
+        while any(cell.number is None for cell in self.cells):
+            for _, name, technique in TECHNIQUES:
+                changes = self._run_step(name, lambda technique=technique: technique(self), stats)
+                if changes:
+                    if trace is not None:
+                        trace.append((name, changes))
+                    break
+            else:
+                return True
+
+            if not self._traced_propagate(trace, stats):
+                return False
+
+        return True
+
+    def _traced_propagate(self, trace, stats=None):
+        """
+        Runs `propagate`, recording the number of cells it placed in `trace` when one is given.
+
+        Args:
+            trace (list or None): The trace of `apply_techniques`.
+            stats (SolveStats or None): The statistics of `apply_techniques`.
+
+        Returns:
+            bool: The result of `propagate`.
+        """
+        if trace is None:
+            return self._run_step('naked_single', self.propagate, stats)
+
+        empty = sum(cell.number is None for cell in self.cells)
+        consistent = self._run_step('naked_single', self.propagate, stats)
+        placed = empty - sum(cell.number is None for cell in self.cells)
+        if placed:
+            trace.append(('naked_single', placed))
+        return consistent
+
+    def _run_step(self, name: str, step, stats):
+        """
+        Runs one step of `apply_techniques`, adding its time, eliminations and placements to `stats`
+        when it is given. An empty cell's candidates count as all nine until they are first found.
+
+        Args:
+            name (str): The name the step's time is recorded under.
+            step (function): The step, called without arguments.
+            stats (SolveStats or None): The statistics to add to.
+
+        Returns:
+            The result of `step`.
+        """
+        if stats is None:
+            return step()
+
+        all_candidates = self.geometry.all_candidates
+        before = [None if cell.number is not None else cell.mask or all_candidates for cell in self.cells]
+        start = time.perf_counter()
+        result = step()
+        stats.add_time(name, time.perf_counter() - start)
+        for cell, mask in zip(self.cells, before):
+            if mask is None:
+                continue
+            if cell.number is not None:
+                stats.singles += 1
+            else:
+                stats.eliminated += mask.bit_count() - cell.mask.bit_count()
+
+        return result
+
+    def to_digits(self):
+        """
+        Returns the board's numbers in row-major order.
+
+        Returns:
+            list of int: The numbers, with 0 for empty cells.
+        """
+        return [0 if cell.number is None else int(cell.number) for cell in self.cells]
+
+    def solve(self, engine: str = 'backtracking', use_techniques: bool = True, stats=None, deadline=None):
+        """
+        Fills in every empty cell so the board is a complete solution. The logical techniques run
+        first, on a copy of the board, and the engine only searches what they leave.
+
+        Args:
+            engine (str): Name of the solving engine in `solver.ENGINES`. Variant boards are solved by
+                          their variant's own search, which is the backtracking engine's.
+            use_techniques (bool): Whether to run `apply_techniques` before the engine.
+            stats (SolveStats or None): If given, the techniques and the engine add their counters and
+                                        timers to it.
+            deadline (float or None): The `time.monotonic()` value at which the engine gives up, or None
+                                      to search without a time limit.
+
+        Returns:
+            bool: True if the board was solved, False if it has no solution. An unsolvable
+                  board is left unchanged.
+
+        Raises:
+            ValueError: If the engine name is unknown, or is not 'backtracking' on a variant board.
+            TimeoutError: If the deadline passes before the engine finishes; the board is left unchanged.
+        """
+        solve = get_engine(engine)
+        if self.variant is not None and not self.variant.classic:
+            if engine != 'backtracking':
+                raise ValueError(f'The {engine!r} engine cannot solve variant puzzles.')
+            solve = self.variant.solve
+
+        digits = self.to_digits()
+        if use_techniques:
+            scratch = Board.from_digits(digits, self.variant)
+            if not scratch.apply_techniques(stats=stats):
+                return False
+            digits = scratch.to_digits()
+
+        if stats is None:
+            solution = solve(digits, deadline=deadline)
+        else:
+            start = time.perf_counter()
+            try:
+                solution = solve(digits, stats, deadline)
+            finally:
+                stats.search_time += time.perf_counter() - start
+        if solution is None:
+            return False
+
+        for index, cell in enumerate(self.cells):
+            if cell.number is None:
+                cell.number = solution[index]
+                cell.mask = 0
+
+        self.update_unit_masks()
+        return True
+
+    def count_solutions(self, limit=2):
+        """
+        Counts the solutions of the board without changing it, stopping as soon as `limit`
+        solutions have been found.
+
+        Args:
+            limit (int or None): The count at which to stop, or None to count every solution.
+
+        Returns:
+            int: The number of solutions found, at most `limit`.
+        """
+        if self.variant is not None:
+            return self.variant.count_solutions(self.to_digits(), limit)
+
+        grid = Grid.from_board(self)
+        if grid is None:
+            return 0
+        return count_solutions(grid, limit)
+
+    def is_unique(self):
+        """
+        Checks whether the board has exactly one solution.
+
+        Returns:
+            bool: True if the board has one solution, False if it has none or several.
+        """
+        return self.count_solutions(limit=2) == 1
+
+
+def solve_puzzle(puzzle: str, engine: str = 'backtracking', use_techniques: bool = True, timeout=None):
+    """
+    Solves a puzzle string, without printing anything.
+
+    Args:
+        puzzle (str): The puzzle string, with ' ', '.' or '0' for empty cells.
+        engine (str): Name of the solving engine in `solver.ENGINES`.
+        use_techniques (bool): Whether to run the logical techniques before the engine.
+        timeout (float or None): Seconds the engine may search, or None for no limit.
+
+    Returns:
+        str or None: The solution string, or None if the puzzle has no solution.
+
+    Raises:
+        ValueError: If the puzzle cannot be parsed or the engine is unknown.
+        TimeoutError: If the time runs out before the engine finishes.
+    """
+    board = Board(puzzle)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    if not board.solve(engine, use_techniques, deadline=deadline):
+        return None
+    return format_digits(board.to_digits())
+
+
+def _unit_positions(cells, unit):
+    """
+    Maps each candidate number of a unit to the positions within the unit where it can go.
+
+    Args:
+        cells (list of Cell): The board's cells.
+        unit (tuple of int): Cell indices of the unit.
+
+    Returns:
+        list of int: For each number (at index number - 1), a mask of positions.
+    """
+    positions = [0] * len(unit)
+    for position, index in enumerate(unit):
+        for digit in mask_digits(cells[index].mask):
+            positions[digit - 1] |= 1 << position
+
+    return positions
+
+
+@register_technique('hidden_single', 10)
+def hidden_singles(board: Board):
+    """
+    Places every number that has only one possible cell left in a row, column or box.
+
+    Args:
+        board (Board): The board to work on.
+
+    Returns:
+        int: The number of cells placed.
+    """
+    cells = board.cells
+    placed = 0
+    for unit in board.geometry.units:
+        once = 0
+        more = 0
+        for index in unit:
+            mask = cells[index].mask
+            more |= once & mask
+            once |= mask
+
+        for digit in mask_digits(once & ~more):
+            bit = 1 << (digit - 1)
+            for index in unit:
+                if cells[index].mask & bit:
+                    board._place(index, digit)  # pylint: disable=protected-access
+                    placed += 1
+                    break
+
+    return placed
+
+
+def _naked_subsets(board: Board, size: int):
+    """
+    Finds `size` cells of a unit whose candidates together hold only `size` numbers, and removes
+    those numbers from the rest of the unit.
+
+    Args:
+        board (Board): The board to work on.
+        size (int): The number of cells in the subset.
+
+    Returns:
+        int: The number of cells whose candidates changed.
+    """
+    cells = board.cells
+    changed = 0
+    for unit in board.geometry.units:
+        open_cells = [index for index in unit if 2 <= cells[index].mask.bit_count() <= size]
+        for subset in combinations(open_cells, size):
+            union = 0
+            for index in subset:
+                union |= cells[index].mask
+            if union.bit_count() != size:
+                continue
+
+            for index in unit:
+                if index not in subset and cells[index].number is None:
+                    changed += board.remove_candidates(index, union)
+
+    return changed
+
+
+def _hidden_subsets(board: Board, size: int):
+    """
+    Finds `size` numbers whose possible cells in a unit are the same `size` cells, and removes every
+    other candidate from those cells.
+
+    Args:
+        board (Board): The board to work on.
+        size (int): The number of numbers in the subset.
+
+    Returns:
+        int: The number of cells whose candidates changed.
+    """
+    cells = board.cells
+    changed = 0
+    all_candidates = board.geometry.all_candidates
+    for unit in board.geometry.units:
+        positions = _unit_positions(cells, unit)
+        open_digits = [digit for digit in range(len(unit)) if 2 <= positions[digit].bit_count() <= size]
+        for subset in combinations(open_digits, size):
+            union = 0
+            keep = 0
+            for digit in subset:
+                union |= positions[digit]
+                keep |= 1 << digit
+            if union.bit_count() != size:
+                continue
+
+            for position in mask_digits(union):
+                changed += board.remove_candidates(unit[position - 1], all_candidates & ~keep)
+
+    return changed
+
+
+def _locked_candidates(board: Board, units, cross_units, cross_of):
+    """
+    Finds numbers whose possible cells in one of `units` all lie in a single unit of `cross_units`,
+    and removes them from the rest of that unit.
+
+    Args:
+        board (Board): The board to work on.
+        units (tuple of tuple): The units to look for locked numbers in.
+        cross_units (tuple of tuple): The units the numbers are locked into.
+        cross_of (tuple of int): Maps a cell index to its unit in `cross_units`.
+
+    Returns:
+        int: The number of cells whose candidates changed.
+    """
+    cells = board.cells
+    changed = 0
+    for unit in units:
+        positions = _unit_positions(cells, unit)
+        for digit in range(len(unit)):
+            if not positions[digit]:
+                continue
+
+            crossing = {cross_of[unit[position - 1]] for position in mask_digits(positions[digit])}
+            if len(crossing) != 1:
+                continue
+
+            for index in cross_units[crossing.pop()]:
+                if index not in unit:
+                    changed += board.remove_candidates(index, 1 << digit)
+
+    return changed
+
+
+@register_technique('naked_pair', 20)
+def naked_pairs(board: Board):
+    """
+    Removes the numbers of a naked pair from the other cells of its unit.
+
+    Args:
+        board (Board): The board to work on.
+
+    Returns:
+        int: The number of cells whose candidates changed.
+    """
+    return _naked_subsets(board, 2)
+
+
+@register_technique('pointing_pair', 30)
+def pointing_pairs(board: Board):
+    """
+    Removes a number from a row or column outside a box when, within the box, the number can only
+    go in that row or column.
+
+    Args:
+        board (Board): The board to work on.
+
+    Returns:
+        int: The number of cells whose candidates changed.
+    """
+    tables = board.geometry
+    return (_locked_candidates(board, tables.box_units, tables.row_units, tables.row_of)
+            + _locked_candidates(board, tables.box_units, tables.col_units, tables.col_of))
+
+
+@register_technique('box_line_reduction', 40)
+def box_line_reduction(board: Board):
+    """
+    Removes a number from a box outside a row or column when, within the row or column, the number
+    can only go in that box.
+
+    Args:
+        board (Board): The board to work on.
+
+    Returns:
+        int: The number of cells whose candidates changed.
+    """
+    tables = board.geometry
+    return (_locked_candidates(board, tables.row_units, tables.box_units, tables.box_of)
+            + _locked_candidates(board, tables.col_units, tables.box_units, tables.box_of))
+
+
+@register_technique('hidden_pair', 50)
+def hidden_pairs(board: Board):
+    """
+    Removes every other candidate from the two cells of a hidden pair.
+
+    Args:
+        board (Board): The board to work on.
+
+    Returns:
+        int: The number of cells whose candidates changed.
+    """
+    return _hidden_subsets(board, 2)
+
+
+@register_technique('naked_triple', 60)
+def naked_triples(board: Board):
+    """
+    Removes the numbers of a naked triple from the other cells of its unit.
+
+    Args:
+        board (Board): The board to work on.
+
+    Returns:
+        int: The number of cells whose candidates changed.
+    """
+    return _naked_subsets(board, 3)
+
+
+@register_technique('hidden_triple', 70)
+def hidden_triples(board: Board):
+    """
+    Removes every other candidate from the three cells of a hidden triple.
+
+    Args:
+        board (Board): The board to work on.
+
+    Returns:
+        int: The number of cells whose candidates changed.
+    """
+    return _hidden_subsets(board, 3)
@@ -0,0 +1,407 @@
+"""
+budget.py - Budgeted and Resumable Search Module
+
+This module runs the search under a budget of nodes and/or seconds, so a puzzle built to make backtracking
+explode pauses instead of stalling a worker. When the budget runs out the search unwinds and records what is
+left to explore as a frontier: a list of subproblems, each the numbers of the grid at one level of the search
+with one untried guess placed, in the order the search would have visited them. Together they cover every
+solution the search had not ruled out, and each is an ordinary puzzle, so a paused solve can be saved as
+JSON and resumed later, in another process or with another engine.
+
+Resuming with the backtracking engine charges the same node budget; the other engines solve one subproblem
+at a time within the time budget, and a subproblem they run out of time on stays at the front of the frontier.
+
+Classes:
+    - SolveState: The frontier, the solution once found and the statistics of a budgeted solve.
+
+Functions:
+    - resume: Continues a solve within a new budget.
+    - solve_with_budget: Starts a solve of a puzzle string within a budget.
+    - count_with_budget: Counts the solutions of a list of subproblems within a budget, returning what is
+      left to explore.
+
+Example:
+    ```python
+    state = solve_with_budget(puzzle, max_nodes=10000)
+    if not state.finished:
+        state.save('paused.json')
+        ...
+        state = resume(SolveState.load('paused.json'), engine='dlx', timeout=5.0)
+    ```
+
+Dependencies:
+    - board: Provides puzzle parsing and formatting.
+    - cell: Provides the numbers of a candidate mask.
+    - solver: Provides `Grid` and the engines.
+    - stats: Provides `SolveStats`.
+"""
+
+
+import json
+import time
+
+from board import format_digits, parse_puzzle
+from cell import mask_digits
+from solver import Grid, count_guess, get_engine
+from stats import SolveStats
+
+
+class _OutOfBudget(Exception):
+    """
+    Raised inside the search when the budget runs out, after the current grid was added to the frontier.
+    """
+
+
+class _Budget:
+    """
+    Holds what is left of a budget.
+
+    Attributes:
+        nodes (int or None): Search nodes left, or None for no limit.
+        deadline (float or None): The `time.monotonic()` value at which to stop, or None for no limit.
+    """
+
+    __slots__ = ('nodes', 'deadline')
+
+    def __init__(self, max_nodes=None, timeout=None):
+        self.nodes = max_nodes
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+
+    def spent(self):
+        """
+        Charges one node against the budget.
+
+        Returns:
+            bool: True if the budget had already run out, in which case nothing is charged.
+        """
+        if self.nodes is not None:
+            if self.nodes <= 0:
+                return True
+            self.nodes -= 1
+        return self.deadline is not None and time.monotonic() > self.deadline
+
+
+def _search(grid: Grid, budget: _Budget, frontier, stats: SolveStats, depth: int = 0):
+    """
+    Solves a grid in place like `solver.search`, adding the unexplored subproblems to `frontier` if the
+    budget runs out.
+
+    Args:
+        grid (Grid): The grid to solve.
+        budget (_Budget): What is left of the budget.
+        frontier (list of list of int): Receives the subproblems left, deepest first.
+        stats (SolveStats): The statistics to add to.
+        depth (int): The depth of this node, for `stats.max_depth`.
+
+    Returns:
+        bool: True if the grid was solved, False if it has no solution.
+
+    Raises:
+        _OutOfBudget: If the budget ran out; the grid is then back as it was.
+    """
+    if budget.spent():
+        frontier.append(grid.digits.tolist())
+        raise _OutOfBudget
+
+    stats.nodes += 1
+    stats.max_depth = max(stats.max_depth, depth)
+    index = grid.best_cell()
+    if index < 0:
+        return True
+
+    trail = grid.trail
+    digits = mask_digits(grid.masks[index])
+    for position, digit in enumerate(digits):
+        mark = len(trail)
+        consistent = grid.guess(index, digit)
+        count_guess(stats, trail, mark)
+        try:
+            if consistent and _search(grid, budget, frontier, stats, depth + 1):
+                return True
+        except _OutOfBudget:
+            grid.undo(mark)
+            for other in digits[position + 1:]:
+                subproblem = grid.digits.tolist()
+                subproblem[index] = other
+                frontier.append(subproblem)
+            raise
+
+        stats.backtracks += 1
+        grid.undo(mark)
+
+    return False
+
+
+def _count(grid: Grid, budget: _Budget, frontier, found, limit):
+    """
+    Counts the solutions of a grid like `solver.count_solutions`, adding the unexplored subproblems to
+    `frontier` if the budget runs out or the limit is reached. The grid is left as it was.
+
+    Args:
+        grid (Grid): The grid to count solutions for.
+        budget (_Budget): What is left of the budget.
+        frontier (list of list of int): Receives the subproblems left, deepest first.
+        found (list of int): A one-item list holding the number of solutions found so far.
+        limit (int or float): The count at which to stop.
+
+    Raises:
+        _OutOfBudget: If the budget ran out; the solutions counted so far stay in `found`.
+    """
+    if budget.spent():
+        frontier.append(grid.digits.tolist())
+        raise _OutOfBudget
+
+    index = grid.best_cell()
+    if index < 0:
+        found[0] += 1
+        return
+
+    digits = mask_digits(grid.masks[index])
+    for position, digit in enumerate(digits):
+        mark = len(grid.trail)
+        try:
+            if grid.guess(index, digit):
+                _count(grid, budget, frontier, found, limit)
+        except _OutOfBudget:
+            grid.undo(mark)
+            for other in digits[position + 1:]:
+                subproblem = grid.digits.tolist()
+                subproblem[index] = other
+                frontier.append(subproblem)
+            raise
+
+        grid.undo(mark)
+        if found[0] >= limit:
+            for other in digits[position + 1:]:
+                subproblem = grid.digits.tolist()
+                subproblem[index] = other
+                frontier.append(subproblem)
+            return
+
+
+class SolveState:
+    """
+    Represents a solve that may have been paused.
+
+    Attributes:
+        frontier (list of list of int): The subproblems left to explore, next first, as the numbers of
+                                        each in row-major order with 0 for empty cells.
+        solution (list of int or None): The numbers of the solution once found.
+        stats (SolveStats): The statistics of every run of the solve so far.
+    """
+
+    def __init__(self, frontier, solution=None, stats=None):
+        """
+        Initializes the state.
+
+        Args:
+            frontier (list of list of int): The subproblems left to explore, next first.
+            solution (list of int or None): The numbers of the solution, if found.
+            stats (SolveStats or None): The statistics so far, or None to start from zero.
+        """
+        self.frontier = frontier
+        self.solution = solution
+        self.stats = SolveStats() if stats is None else stats
+
+    @classmethod
+    def start(cls, puzzle: str):
+        """
+        Builds the state of a solve that has not run yet.
+
+        Args:
+            puzzle (str): The puzzle string, in the format read by `board.parse_puzzle`.
+
+        Returns:
+            SolveState: The state, with the whole puzzle as its only subproblem.
+
+        Raises:
+            ValueError: If the puzzle cannot be parsed.
+        """
+        return cls([parse_puzzle(puzzle)])
+
+    @property
+    def solved(self):
+        """
+        bool: Whether a solution was found.
+        """
+        return self.solution is not None
+
+    @property
+    def finished(self):
+        """
+        bool: Whether the solve is over, either solved or with nothing left to explore.
+        """
+        return self.solved or not self.frontier
+
+    def candidates(self):
+        """
+        Finds the candidates of the subproblem the solve would explore next, the deepest point it reached.
+
+        Returns:
+            list of int or None: The candidate mask of each cell, 0 for filled cells, or None if the solve
+                                 is finished or that subproblem's numbers conflict.
+        """
+        if self.finished:
+            return None
+        grid = Grid.from_digits(self.frontier[0])
+        return None if grid is None else grid.masks.tolist()
+
+    def to_dict(self):
+        """
+        Returns the state as a dictionary of strings, numbers and lists, ready for JSON.
+
+        Returns:
+            dict: The frontier as puzzle strings with '.' for empty cells, the solution string or None, and
+                  the statistics.
+        """
+        return {
+            'frontier': [format_digits(digits, '.') for digits in self.frontier],
+            'solution': None if self.solution is None else format_digits(self.solution),
+            'stats': self.stats.as_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """
+        Rebuilds a state from the dictionary `to_dict()` returns.
+
+        Args:
+            state (dict): The dictionary.
+
+        Returns:
+            SolveState: The state.
+
+        Raises:
+            ValueError: If a puzzle string of the frontier or the solution cannot be parsed.
+        """
+        solution = state.get('solution')
+        return cls([parse_puzzle(puzzle) for puzzle in state['frontier']],
+                   None if solution is None else parse_puzzle(solution),
+                   SolveStats.from_dict(state.get('stats', {})))
+
+    def save(self, path):
+        """
+        Saves the state to a JSON file.
+
+        Args:
+            path (str or os.PathLike): The file to write.
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a state saved by `save()`.
+
+        Args:
+            path (str or os.PathLike): The file to read.
+
+        Returns:
+            SolveState: The state.
+        """
+        with open(path, encoding='utf-8') as file:
+            return cls.from_dict(json.load(file))
+
+
+def resume(state: SolveState, engine: str = 'backtracking', max_nodes=None, timeout=None):
+    """
+    Continues a solve, exploring the frontier in order until a solution is found, the frontier is empty or
+    the budget runs out.
+
+    Args:
+        state (SolveState): The state to continue; it is updated in place.
+        engine (str): Name of the solving engine in `solver.ENGINES`.
+        max_nodes (int or None): Search nodes this run may visit, or None for no limit. Only the
+                                 backtracking engine can stop part way through a subproblem, so the other
+                                 engines do not take a node budget.
+        timeout (float or None): Seconds this run may take, or None for no limit.
+
+    Returns:
+        SolveState: `state`, which is `finished` unless the budget ran out.
+
+    Raises:
+        ValueError: If the engine is unknown, or a node budget is given for an engine other than
+                    backtracking.
+    """
+    solve = get_engine(engine)
+    if max_nodes is not None and engine != 'backtracking':
+        raise ValueError(f'The {engine!r} engine cannot stop after a number of nodes.')
+
+    budget = _Budget(max_nodes, timeout)
+    while not state.finished:
+        subproblem = state.frontier.pop(0)
+        if engine == 'backtracking':
+            grid = Grid.from_digits(subproblem)
+            if grid is None:
+                continue
+
+            left = []
+            try:
+                if _search(grid, budget, left, state.stats):
+                    state.solution = grid.digits.tolist()
+            except _OutOfBudget:
+                state.frontier[:0] = left
+                break
+        else:
+            try:
+                state.solution = solve(subproblem, state.stats, budget.deadline)
+            except TimeoutError:
+                state.frontier.insert(0, subproblem)
+                break
+
+    return state
+
+
+def count_with_budget(frontier, limit=None, max_nodes=None, timeout=None):
+    """
+    Counts the solutions of a list of subproblems, stopping once `limit` of them have been found or the
+    budget runs out.
+
+    Args:
+        frontier (list of list of int): The subproblems, as the numbers of each with 0 for empty cells.
+        limit (int or None): The count at which to stop, or None to count every solution.
+        max_nodes (int or None): Search nodes the count may visit, or None for no limit.
+        timeout (float or None): Seconds the count may take, or None for no limit.
+
+    Returns:
+        tuple: The number of solutions found, and the list of subproblems left unexplored, which is empty
+               unless the budget ran out or the limit was reached.
+    """
+    limit = float('inf') if limit is None else limit
+    budget = _Budget(max_nodes, timeout)
+    found = [0]
+    frontier = list(frontier)
+    while frontier and found[0] < limit:
+        grid = Grid.from_digits(frontier.pop(0))
+        if grid is None:
+            continue
+
+        left = []
+        try:
+            _count(grid, budget, left, found, limit)
+        except _OutOfBudget:
+            frontier[:0] = left
+            break
+        frontier[:0] = left
+
+    return found[0], frontier
+
+
+def solve_with_budget(puzzle: str, max_nodes=None, timeout=None, engine: str = 'backtracking'):
+    """
+    Solves a puzzle within a budget of search nodes and/or seconds.
+
+    Args:
+        puzzle (str): The puzzle string, in the format read by `board.parse_puzzle`.
+        max_nodes (int or None): Search nodes the solve may visit, or None for no limit.
+        timeout (float or None): Seconds the solve may take, or None for no limit.
+        engine (str): Name of the solving engine in `solver.ENGINES`.
+
+    Returns:
+        SolveState: The state of the solve; if it is not `finished`, pass it to `resume()` to go on.
+
+    Raises:
+        ValueError: If the puzzle cannot be parsed or the engine is unknown.
+    """
+    return resume(SolveState.start(puzzle), engine, max_nodes, timeout)
@@ -0,0 +1,308 @@
+"""
+cache.py - Canonical Form and Solution Cache Module
+
+This module maps equivalent puzzles onto one canonical form so a solution found once can be reused for
+every puzzle that differs from it only by relabeling the numbers, transposing the grid, or permuting bands,
+rows within a band, stacks or columns within a stack. Each of these changes keeps a puzzle valid and maps
+its solution the same way.
+
+`canonicalize()` orders the bands, rows, stacks and columns by keys that do not change under any of those
+permutations or under relabeling (how many givens a row holds, how they spread over the stacks and columns,
+and how often their numbers occur), relabels the numbers in the order they first appear and keeps the
+smallest result. Rows or bands whose keys tie are tried in every order, up to `ORDER_LIMIT` orders per axis;
+past that they keep their original order, so a few equivalent puzzles still get different forms. Every form
+is reached through a real `Transform`, so a cached solution mapped back with it is always correct.
+
+Classes:
+    - Transform: A relabeling plus a row and column layout that maps a puzzle onto its canonical form.
+    - SolutionCache: A bounded LRU cache of solutions keyed by canonical form.
+
+Functions:
+    - canonicalize: Finds the canonical form of a puzzle and the transform that produces it.
+    - apply_transform: Maps a grid onto its canonical form.
+    - invert_transform: Maps a grid in canonical form back onto the original layout.
+
+Constants:
+    - ORDER_LIMIT: The most row or column orders tried when keys tie.
+
+Example:
+    ```python
+    cache = SolutionCache(maxsize=10000)
+    solution = cache.solve(puzzle)
+    print(cache.hits, cache.misses)
+    cache.save('solutions.json')
+    ```
+
+Dependencies:
+    - board: Provides puzzle parsing and formatting.
+    - solver: Provides the solving engines used on a cache miss.
+"""
+
+
+import json
+from collections import Counter, OrderedDict, namedtuple
+from itertools import chain, groupby, permutations, product
+
+from board import format_digits, parse_puzzle
+from solver import get_engine
+
+
+Transform = namedtuple('Transform', ['transpose', 'rows', 'cols', 'labels'])
+Transform.__doc__ = """
+Represents the mapping of a puzzle onto its canonical form.
+
+Attributes:
+    transpose (bool): Whether the grid is transposed before `rows` and `cols` are applied.
+    rows (tuple of int): The source row of each canonical row.
+    cols (tuple of int): The source column of each canonical column.
+    labels (tuple of int): The canonical number of each source number, indexed 0-9 with 0 mapped to 0.
+"""
+
+ORDER_LIMIT = 8
+
+_IDENTITY = tuple(range(10))
+_MISSING = object()
+
+
+def _tied_orders(items, key):
+    """
+    Sorts items by a key, largest first, in every order that only differs among items whose keys tie.
+
+    Args:
+        items (iterable): The items to sort.
+        key (function): The sort key.
+
+    Returns:
+        list of tuple: Every such order.
+    """
+    ranked = sorted(items, key=key, reverse=True)
+    groups = [list(group) for _, group in groupby(ranked, key=key)]
+    return [tuple(chain.from_iterable(choice)) for choice in product(*(permutations(group) for group in groups))]
+
+
+def _line_orders(digits):
+    """
+    Orders the rows of a grid by keys that do not change under relabeling or under permutations of bands,
+    rows within a band, stacks or columns within a stack.
+
+    Args:
+        digits (list of int): The 81 numbers in row-major order, with 0 for empty cells.
+
+    Returns:
+        list of tuple of int: The source row of each ordered row, for every order that only differs among
+                              rows or bands whose keys tie, or just the first such order if there are more
+                              than `ORDER_LIMIT`.
+    """
+    frequency = Counter(digit for digit in digits if digit)
+    col_counts = [sum(digits[row * 9 + col] != 0 for row in range(9)) for col in range(9)]
+    keys = []
+    for row in range(9):
+        line = digits[row * 9:row * 9 + 9]
+        keys.append((
+            sum(digit != 0 for digit in line),
+            tuple(sorted(sum(digit != 0 for digit in line[stack * 3:stack * 3 + 3]) for stack in range(3))),
+            tuple(sorted(col_counts[col] for col in range(9) if line[col])),
+            tuple(sorted(frequency[digit] for digit in line if digit)),
+        ))
+
+    within = [_tied_orders(range(band * 3, band * 3 + 3), keys.__getitem__) for band in range(3)]
+    band_keys = [sorted((keys[row] for row in range(band * 3, band * 3 + 3)), reverse=True) for band in range(3)]
+    bands = _tied_orders(range(3), band_keys.__getitem__)
+
+    orders = []
+    for band_order in bands:
+        for choice in product(*(within[band] for band in band_order)):
+            orders.append(tuple(chain.from_iterable(choice)))
+            if len(orders) > ORDER_LIMIT:
+                return orders[:1]
+
+    return orders
+
+
+def apply_transform(digits, transform: Transform):
+    """
+    Maps a grid onto its canonical form.
+
+    Args:
+        digits (list of int): The 81 numbers in row-major order, with 0 for empty cells.
+        transform (Transform): The transform to apply.
+
+    Returns:
+        list of int: The 81 numbers of the transformed grid.
+    """
+    labels = transform.labels
+    if transform.transpose:
+        return [labels[digits[col * 9 + row]] for row in transform.rows for col in transform.cols]
+    return [labels[digits[row * 9 + col]] for row in transform.rows for col in transform.cols]
+
+
+def invert_transform(digits, transform: Transform):
+    """
+    Maps a grid in canonical form back onto the layout and numbers of the original puzzle.
+
+    Args:
+        digits (list of int): The 81 numbers of the canonical grid in row-major order.
+        transform (Transform): The transform that produced the canonical form.
+
+    Returns:
+        list of int: The 81 numbers in the original layout.
+    """
+    sources = [0] * 10
+    for source, label in enumerate(transform.labels):
+        sources[label] = source
+
+    original = [0] * 81
+    index = 0
+    for row in transform.rows:
+        for col in transform.cols:
+            original[col * 9 + row if transform.transpose else row * 9 + col] = sources[digits[index]]
+            index += 1
+
+    return original
+
+
+def canonicalize(digits):
+    """
+    Finds the canonical form of a puzzle.
+
+    Args:
+        digits (list of int): The 81 numbers in row-major order, with 0 for empty cells.
+
+    Returns:
+        tuple: The canonical numbers (list of int) and the `Transform` mapping `digits` onto them.
+    """
+    transposed = [digits[col * 9 + row] for row in range(9) for col in range(9)]
+    row_orders, col_orders = _line_orders(digits), _line_orders(transposed)
+    layouts = [(False, rows, cols) for rows in row_orders for cols in col_orders]
+    layouts += [(True, cols, rows) for rows in row_orders for cols in col_orders]
+
+    best = None
+    for transpose, rows, cols in layouts:
+        placed = apply_transform(digits, Transform(transpose, rows, cols, _IDENTITY))
+        labels = [0] * 10
+        unused = list(range(9, 0, -1))
+        for digit in placed:
+            if digit and not labels[digit]:
+                labels[digit] = unused.pop()
+        for digit in range(1, 10):
+            if not labels[digit]:
+                labels[digit] = unused.pop()
+
+        canonical = [labels[digit] for digit in placed]
+        if best is None or canonical < best[0]:
+            best = (canonical, Transform(transpose, rows, cols, tuple(labels)))
+
+    return best
+
+
+class SolutionCache:
+    """
+    Represents a bounded least-recently-used cache of solutions keyed by canonical form.
+
+    Solutions are stored in canonical form, so one entry serves every puzzle equivalent to it. Puzzles
+    without a solution are cached too.
+
+    Attributes:
+        maxsize (int): The most entries kept; the least recently used entry is dropped beyond it.
+        engine (str): Name of the solving engine in `solver.ENGINES` used on a miss.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that needed solving.
+    """
+
+    def __init__(self, maxsize: int = 1024, engine: str = 'backtracking'):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): The most entries to keep.
+            engine (str): Name of the solving engine used on a miss.
+
+        Raises:
+            ValueError: If the engine is unknown.
+        """
+        self.maxsize = maxsize
+        self.engine = engine
+        self.hits = 0
+        self.misses = 0
+        self._solve = get_engine(engine)
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        """
+        Returns the number of cached entries.
+        """
+        return len(self._entries)
+
+    def _store(self, key: str, solution):
+        """
+        Adds an entry as the most recently used, dropping the least recently used one if the cache is full.
+        """
+        self._entries[key] = solution
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def solve(self, puzzle: str):
+        """
+        Solves a puzzle, reusing the cached solution of any equivalent puzzle.
+
+        Args:
+            puzzle (str): An 81-character puzzle string, with ' ', '.' or '0' for empty cells.
+
+        Returns:
+            str or None: The 81-character solution, or None if the puzzle has no solution.
+
+        Raises:
+            ValueError: If the puzzle cannot be parsed as a 9x9 puzzle.
+        """
+        canonical, transform = canonicalize(parse_puzzle(puzzle, box_size=3))
+        key = format_digits(canonical, '.')
+        solution = self._entries.get(key, _MISSING)
+        if solution is _MISSING:
+            self.misses += 1
+            solved = self._solve(canonical)
+            solution = None if solved is None else format_digits(solved)
+            self._store(key, solution)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+        if solution is None:
+            return None
+        return format_digits(invert_transform(parse_puzzle(solution), transform))
+
+    def clear(self):
+        """
+        Removes every entry and resets the hit and miss counts.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path: str):
+        """
+        Writes the entries to a JSON file, least recently used first.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(list(self._entries.items()), file)
+
+    def load(self, path: str):
+        """
+        Adds the entries of a file written by `save()` as the most recently used ones.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            int: The number of entries read.
+        """
+        with open(path, encoding='utf-8') as file:
+            entries = json.load(file)
+
+        for key, solution in entries:
+            self._store(key, solution)
+
+        return len(entries)
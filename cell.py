@@ -2,8 +2,11 @@
 cell.py - Sudoku Cell Representation Module
 
 This module defines the `Cell` class, which represents an individual cell in a Sudoku puzzle grid. Each
-cell can contain a set number (if already determined) or a list of candidate numbers if the cell is empty.
-The class provides methods for managing candidate numbers, allowing the addition or removal of possible values.
+cell can contain a set number (if already determined) or a set of candidate numbers if the cell is empty.
+Candidates are stored as an integer mask (bit `n - 1` set means `n` is a candidate) so that adding,
+removing and intersecting candidates are single bitwise operations. A 9x9 board needs 9 bits; larger boards
+use as many bits as they have numbers, up to 25. Cells use `__slots__`, so a cell is just
+its number and its mask.
 
 Classes:
     - Cell: Represents a single cell on the Sudoku board, managing its value and potential candidates
@@ -11,13 +14,22 @@ Classes:
 
 Key Attributes:
     - number: Stores the fixed value of the cell, if known; otherwise, remains `None`.
-    - candidates: A list of potential numbers that may be valid for the cell, useful when deducing cell values.
+    - mask: The candidate bitmask of the cell.
+    - candidates: A sorted list view of `mask`, useful when deducing cell values. Assigning a list to it
+      replaces the mask.
+
+Functions:
+    - mask_digits: Returns the numbers in a candidate mask of any width.
+
+Constants:
+    - ALL_CANDIDATES: Mask with all nine candidate bits set.
+    - MASK_DIGITS: Lookup table from a 9-bit mask to the tuple of digits it contains.
+    - DIGIT_CHARS: The characters used for the numbers 1-25 in puzzle strings.
 
 Key Methods:
-    - __init__: Initializes the cell with an optional number. If no number is provided, initializes an empty
-      list for candidate numbers.
-    - add_candidate: Adds a new candidate number to the cell's list if it’s not already present.
-    - remove_candidate: Removes a specified candidate from the cell's list if it’s present.
+    - __init__: Initializes the cell with an optional number and an empty candidate mask.
+    - add_candidate: Adds a new candidate number to the cell's mask if it’s not already present.
+    - remove_candidate: Removes a specified candidate from the cell's mask if it’s present.
 
 Usage:
     - Initialize a `Cell` with or without a starting number.
@@ -39,44 +51,111 @@ Dependencies:
 """
 
 
+ALL_CANDIDATES = 0x1FF
+
+
+
+def _mask_digits_table(count: int):
+    """
+    Builds the table of the numbers in every mask of `count` bits, doubling it one bit at a time so it
+    costs one tuple per mask at import.
+
+    Args:
+        count (int): The number of bits.
+
+    Returns:
+        tuple of tuple: The sorted numbers of each mask, indexed by the mask.
+    """
+    table = [()]
+    for n in range(1, count + 1):
+        table += [digits + (n,) for digits in table]
+    return tuple(table)
+
+
+MASK_DIGITS = _mask_digits_table(9)
+
+DIGIT_CHARS = '123456789ABCDEFGHIJKLMNOP'
+
+
+def mask_digits(mask: int):
+    """
+    Returns the numbers in a candidate mask, using `MASK_DIGITS` for 9-bit masks.
+
+    Args:
+        mask (int): The candidate mask.
+
+    Returns:
+        tuple of int: The numbers, in ascending order.
+    """
+    if mask <= ALL_CANDIDATES:
+        return MASK_DIGITS[mask]
+    return tuple(n for n in range(1, mask.bit_length() + 1) if mask >> (n - 1) & 1)
+
+
 class Cell:
     """
     Represents an individual cell in a Sudoku board. Each cell can have a number (if already set) or
-    a list of possible candidates (if the cell is empty).
+    a set of possible candidates (if the cell is empty).
 
     Attributes:
         number (int or None): The current number in the cell, or None if the cell is empty.
-        candidates (list of int): Potential numbers that could be valid for this cell.
+        mask (int): Bitmask of potential numbers; bit `n - 1` is set when `n` is a candidate.
+        candidates (list of int): Potential numbers that could be valid for this cell, in ascending order.
     """
 
+    __slots__ = ('number', 'mask')
+
     def __init__(self, number: int=None):
         """
-        Initializes a cell with an optional number. If the cell is empty,
-        it initializes an empty list for candidates.
+        Initializes a cell with an optional number and no candidates.
 
         Args:
             number (int or None): The initial number for the cell, or None if the cell is empty.
         """
-        self.number = number  # TODO: add_number() that removes candidates
-        self.candidates = []  # TODO: change to set
+        self.number = number  # placing a number on a board goes through Board.place()
+        self.mask = 0
+
+    @property
+    def candidates(self):
+        """
+        Returns the candidates encoded in `mask` as a new ascending list.
+
+        Returns:
+            list of int: The candidate numbers of the cell.
+        """
+        return list(mask_digits(self.mask))
+
+    @candidates.setter
+    def candidates(self, new_candidates):
+        """
+        Replaces the candidate mask with the numbers in `new_candidates`.
+
+        Args:
+            new_candidates (iterable of int): The candidate numbers to store.
+        """
+        mask = 0
+        for n in new_candidates:
+            mask |= 1 << (n - 1)
+        self.mask = mask
 
     def add_candidate(self, new_candidate: int):
         """
-        Adds a candidate number to the cell if it's not already in the list.
+        Adds a candidate number to the cell if it's not already in the mask.
 
         Args:
             new_candidate (int): A candidate number to add to the cell.
         """
+        bit = 1 << (new_candidate - 1)
         if self.number:  # TODO: document this addition
             print('Cell already has number.')
-        elif new_candidate not in self.candidates:
-            self.candidates.append(new_candidate)
+        elif not self.mask & bit:
+            self.mask |= bit
         else:
             print(f'Candidate {new_candidate} already in list.')
 
     def remove_candidate(self, candidate: int):
         """
-        Removes a candidate number from the cell if it exists in the list.
+        Removes a candidate number from the cell if it exists in the mask.
 
         Args:
             candidate (int): The candidate number to remove.
@@ -84,5 +163,5 @@ class Cell:
 
         if self.number:  # TODO: document this addition
             print('Cell already has number.')
-        elif candidate in self.candidates:
-            self.candidates.remove(candidate)
+        else:
+            self.mask &= ~(1 << (candidate - 1))
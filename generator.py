@@ -0,0 +1,164 @@
+"""
+generator.py - Puzzle Generator Module
+
+This module generates puzzles with a unique solution, 9x9 by default or of any size in `units.BOX_SIZES`. A
+random complete grid is built by filling the boxes on the diagonal with random permutations (they never
+constrain each other) and letting the search finish the rest. Clues are then removed one symmetric group at a
+time, in random order, as long as the puzzle stays unique.
+
+The generator never parses strings or builds `Board` objects while removing clues: it edits a flat list of
+numbers in place and builds a `Grid` from it for each check. Since the solution is already known, a removal
+keeps the puzzle unique exactly when no solution puts a different number in one of the removed cells, so each
+check bans the removed number from one cell at a time and searches for a single solution, stopping at the
+first one.
+
+Functions:
+    - random_solution: Builds a random complete grid.
+    - reduce_clues: Removes clues from a complete grid while the puzzle stays unique.
+    - generate: Builds a random puzzle and its solution.
+
+Constants:
+    - SYMMETRIES: Maps each symmetry name to the function giving the cells removed together with a cell, given
+      the cell and the board's size.
+
+Example:
+    ```python
+    puzzle, solution = generate(clues=26, symmetry='rotational', seed=1)
+    ```
+
+Dependencies:
+    - board: Provides the conversion of numbers to puzzle strings.
+    - solver: Provides `Grid`, `search` and `count_solutions`.
+    - units: Provides the tables of each board size.
+"""
+
+
+import random
+
+from board import format_digits
+from solver import Grid, count_solutions, search
+from units import geometry, geometry_for_cells
+
+
+SYMMETRIES = {
+    'none': lambda index, size: (index,),
+    'rotational': lambda index, size: tuple(sorted({index, size * size - 1 - index})),
+    'mirror': lambda index, size: tuple(sorted({index, index // size * size + size - 1 - index % size})),
+    'diagonal': lambda index, size: tuple(sorted({index, index % size * size + index // size})),
+}
+
+
+def random_solution(rng: random.Random, box_size: int = 3):
+    """
+    Builds a random complete grid.
+
+    Args:
+        rng (random.Random): The random number generator to use.
+        box_size (int): The box size of the board, such as 3 for 9x9 or 4 for 16x16.
+
+    Returns:
+        list of int: The numbers of the grid in row-major order.
+    """
+    tables = geometry(box_size)
+    grid = Grid(geometry=tables)
+    for band in range(box_size):
+        digits = rng.sample(range(1, tables.size + 1), tables.size)
+        for index, digit in zip(tables.box_units[band * box_size + band], digits):
+            grid.assign(index, digit)
+
+    search(grid)
+    return grid.digits.tolist()
+
+
+def _still_unique(clues, removed, solution):
+    """
+    Checks whether a puzzle stays unique once some clues are removed.
+
+    Args:
+        clues (list of int): The numbers of the puzzle with the clues already removed.
+        removed (tuple of int): Indices of the removed clues.
+        solution (list of int): The puzzle's solution.
+
+    Returns:
+        bool: True if the only solution still is `solution`.
+    """
+    grid = Grid.from_digits(clues)
+    for index in removed:
+        mask = grid.masks[index]
+        others = mask & ~(1 << (solution[index] - 1))
+        if not others:
+            continue
+
+        grid.masks[index] = others
+        found = count_solutions(grid, limit=1)
+        grid.masks[index] = mask
+        if found:
+            return False
+
+    return True
+
+
+def reduce_clues(solution, rng: random.Random, clues=None, symmetry: str = 'none'):
+    """
+    Removes clues from a complete grid, in random order, while the puzzle stays unique.
+
+    Args:
+        solution (list of int): The numbers of the complete grid; their count gives the board size.
+        rng (random.Random): The random number generator to use.
+        clues (int or None): Stop once at most this many clues are left, or None to remove every
+                             clue that can go.
+        symmetry (str): A key of `SYMMETRIES`; symmetric clues are removed together.
+
+    Returns:
+        list of int: The numbers of the puzzle, with 0 for empty cells.
+
+    Raises:
+        ValueError: If the symmetry is unknown.
+    """
+    if symmetry not in SYMMETRIES:
+        raise ValueError(f'Unknown symmetry {symmetry!r}.')
+
+    group_of = SYMMETRIES[symmetry]
+    size = geometry_for_cells(len(solution)).size
+    groups = sorted({group_of(index, size) for index in range(len(solution))})
+    rng.shuffle(groups)
+
+    puzzle = list(solution)
+    remaining = len(solution)
+    for group in groups:
+        if clues is not None and remaining <= clues:
+            break
+
+        for index in group:
+            puzzle[index] = 0
+        if _still_unique(puzzle, group, solution):
+            remaining -= len(group)
+        else:
+            for index in group:
+                puzzle[index] = solution[index]
+
+    return puzzle
+
+
+def generate(clues=None, symmetry: str = 'rotational', seed=None, blank: str = '.', box_size: int = 3):
+    """
+    Generates a random puzzle with a unique solution.
+
+    Args:
+        clues (int or None): Target number of clues. Clues are removed until at most this many are left
+                             or no more can go; None removes every clue that can go.
+        symmetry (str): A key of `SYMMETRIES`.
+        seed (int or None): Seed for the random number generator, for reproducible puzzles.
+        blank (str): The character written for empty cells.
+        box_size (int): The box size of the board, such as 3 for 9x9 or 4 for 16x16.
+
+    Returns:
+        tuple of str: The puzzle and its solution.
+
+    Raises:
+        ValueError: If the symmetry is unknown.
+    """
+    rng = random.Random(seed)
+    solution = random_solution(rng, box_size)
+    puzzle = reduce_clues(solution, rng, clues, symmetry)
+    return format_digits(puzzle, blank), format_digits(solution)
@@ -0,0 +1,107 @@
+"""
+grading.py - Puzzle Difficulty Grading Module
+
+This module grades puzzles by the logical techniques a human would need to solve them. `grade()` runs the
+techniques registered in `board.TECHNIQUES` in order of cost, records every step that made progress and
+derives a difficulty score and level from that trace. Puzzles the techniques cannot finish are graded as
+needing search.
+
+Classes:
+    - Grade: The result of grading one puzzle.
+
+Functions:
+    - technique_costs: Maps each technique name to its cost.
+    - grade: Grades one puzzle string.
+
+Constants:
+    - NAKED_SINGLE_COST: Cost of the naked singles placed between techniques.
+    - SEARCH_COST: Cost added to the score of puzzles the techniques cannot finish.
+    - LEVELS: Difficulty levels by the highest cost of technique they allow; anything costlier is 'expert'.
+
+Example:
+    ```python
+    result = grade("  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7")
+    print(result.level, result.score, result.counts)
+    ```
+
+Dependencies:
+    - board: Provides the `Board` class and the registered techniques.
+    - solver: Provides `Grid`, used to reject puzzles whose givens conflict.
+"""
+
+
+from collections import Counter, namedtuple
+
+from board import Board, TECHNIQUES
+from solver import Grid
+
+
+NAKED_SINGLE_COST = 1
+SEARCH_COST = 1000
+
+LEVELS = (
+    (10, 'easy'),
+    (30, 'medium'),
+    (50, 'hard'),
+)
+
+
+Grade = namedtuple('Grade', ['score', 'level', 'hardest', 'solved', 'counts', 'trace'])
+Grade.__doc__ = """
+Represents the grade of a puzzle.
+
+Attributes:
+    score (int): The sum of the costs of every step, plus `SEARCH_COST` if search is needed.
+    level (str): 'easy', 'medium', 'hard', 'expert', 'search' if the techniques cannot finish the puzzle,
+                 or 'invalid' if they find a contradiction.
+    hardest (str or None): Name of the most expensive technique used, or None if no step was needed.
+    solved (bool): Whether the techniques alone solved the puzzle.
+    counts (dict): Maps each technique name to the number of steps it made.
+    trace (tuple of tuple): The `(name, changes)` steps in the order they were made.
+"""
+
+
+def technique_costs():
+    """
+    Maps each technique name to its cost, including naked singles.
+
+    Returns:
+        dict: The cost of each technique.
+    """
+    costs = {name: cost for cost, name, _ in TECHNIQUES}
+    costs['naked_single'] = NAKED_SINGLE_COST
+    return costs
+
+
+def grade(puzzle: str):
+    """
+    Grades a puzzle by the logical techniques needed to solve it.
+
+    Args:
+        puzzle (str): An 81-character puzzle string, with ' ', '.' or '0' for empty cells.
+
+    Returns:
+        Grade: The grade of the puzzle.
+
+    Raises:
+        ValueError: If the puzzle cannot be parsed.
+    """
+    board = Board(puzzle)
+    trace = []
+    consistent = Grid.from_board(board) is not None and board.apply_techniques(trace)
+    solved = consistent and all(cell.number is not None for cell in board.cells)
+
+    costs = technique_costs()
+    hardest = max((name for name, _ in trace), key=costs.__getitem__, default=None)
+    score = sum(costs[name] for name, _ in trace)
+
+    if not consistent:
+        level = 'invalid'
+    elif not solved:
+        level = 'search'
+        score += SEARCH_COST
+    else:
+        hardest_cost = 0 if hardest is None else costs[hardest]
+        level = next((name for limit, name in LEVELS if hardest_cost <= limit), 'expert')
+
+    return Grade(score, level, hardest, solved, dict(Counter(name for name, _ in trace)), tuple(trace))
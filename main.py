@@ -2,46 +2,112 @@
 main.py - Sudoku Solver Main Execution File
 
 This file provides the entry point for running the Sudoku puzzle solver. It initializes the Sudoku board
-using the `Board` class (imported from the `board` module) and applies logical deduction methods to solve
-the puzzle progressively. <methods have not been completed>
+using the `Board` class (imported from the `board` module) and solves the puzzle, placing single candidates
+first and searching for the remaining numbers.
 
 Modules:
     - board: Contains the `Board` class, which represents the 9x9 Sudoku board and includes methods
       to manage cell values, find candidates, and apply solving techniques.
+    - puzzle_io: Contains the streaming reader/writer pipeline that solves puzzle files line by line
+      across a process pool.
 
 Functions:
-    - main(): Initializes the board from a given puzzle string, iteratively finds possible values
-      for empty cells.
+    - main(): Initializes the board from a given puzzle string and solves it, or solves every puzzle
+      in a file or on standard input when one is given.
 
 Usage:
     - Run this file to execute the solver. The initial puzzle configuration is represented by the
       `init_nums` string within `main()`, where each character corresponds to a cell, with spaces
       (' ') for empty cells.
+    - Run `python main.py PUZZLE_FILE [-o OUTPUT_FILE] [--workers N] [--chunksize K] [--unordered]
+      [--engine NAME]` to solve a file with one 81-character puzzle per line, using ' ', '.' or '0' for
+      empty cells. Use `-` as the file name to read from standard input. Each solution is written on its
+      own line as soon as it is found, or `No solution.` for puzzles without one, to the output file or
+      standard output.
 
 Example:
     Input: A predefined string with 81 characters representing the initial Sudoku puzzle layout.
-    Output: Console output of the board state after having found every number.
+    Output: Console output of the board state after having found every number, or a message if the
+            puzzle has no solution.
 """
 
 
+import sys
+
 from board import Board
+from puzzle_io import solve_stream
+from solver import ENGINES
+
+
+def parse_args(argv=None):
+    """
+    Parses the command-line arguments.
 
+    Args:
+        argv (list of str or None): The arguments, or None to read them from `sys.argv`.
 
-def main():
+    Returns:
+        argparse.Namespace: The parsed arguments.
     """
-    Initializes Sudoku board. Loops through methods to find values until board is completed.
+    # Imported here so importing this module as a library does not pay for argparse
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Solve Sudoku puzzles.')
+    parser.add_argument('puzzle_file', nargs='?',
+                        help='file with one 81-character puzzle per line, or - for standard input; '
+                             'solves a sample puzzle if omitted')
+    parser.add_argument('-o', '--output',
+                        help='file to write the solutions to (default: standard output)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--chunksize', type=int, default=256,
+                        help='number of puzzles sent to a worker at a time')
+    parser.add_argument('--unordered', action='store_true',
+                        help='print solutions as they are found instead of in input order')
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='backtracking',
+                        help='solving engine')
+    return parser.parse_args(argv)
+
+
+def solve_file(args):
     """
+    Solves every puzzle in a file or on standard input and writes one solution per line.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    in_stream = sys.stdin if args.puzzle_file == '-' else open(args.puzzle_file, encoding='utf-8')
+    out_stream = sys.stdout if args.output is None else open(args.output, 'w', encoding='utf-8')
+    try:
+        solve_stream(in_stream, out_stream, workers=args.workers, chunksize=args.chunksize,
+                     ordered=not args.unordered, engine=args.engine)
+    finally:
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+
+
+def main(argv=None):
+    """
+    Initializes Sudoku board and solves it, or solves a file of puzzles when one is given.
+
+    Args:
+        argv (list of str or None): The command-line arguments, or None to read them from `sys.argv`.
+    """
+    args = parse_args(argv)
+    if args.puzzle_file:
+        solve_file(args)
+        return
+
     init_nums = "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7"
     board = Board(init_nums)
 
-    # go through methods of finding cell numbers until the board is completed
-    while True:
-        board.find_candidates()
-        print()
-        board.apply_mono_candidates()
+    if not board.solve():
+        print('Puzzle has no solution.')
 
-        board.output()
-        break  # temporary code
+    board.output()
 
 
-main()
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+"""
+packed.py - Packed Binary Puzzle Format Module
+
+This module stores 9x9 puzzles in a compact binary format and reads them back through a memory map. Each
+cell's number (0 for empty) takes 4 bits, two cells to a byte with the first cell in the high nibble, so a
+puzzle is 41 bytes instead of an 82-byte text line, and every record sits at a fixed offset. A file is the
+4-byte `MAGIC` header followed by the records.
+
+`PackedCorpus` maps a file read-only, so processes that open the same file share its pages, and any puzzle
+can be reached by index without reading the ones before it. Records are unpacked from slices of the map,
+without copying the file, straight into the lists of numbers the engines and `Board.from_digits()` take, so
+no puzzle string is ever built or parsed. A batch worker can be handed a path and an index range and solve its
+shard on its own.
+
+Classes:
+    - PackedCorpus: Random access to the puzzles of a packed file through a memory map.
+
+Functions:
+    - pack_digits: Packs the numbers of one puzzle into a record.
+    - unpack_digits: Unpacks a record into the numbers of a puzzle.
+    - write_packed: Writes puzzle strings to a binary stream as a packed file.
+    - solve_shard: Solves a range of the puzzles of a packed file in the current process.
+
+Constants:
+    - MAGIC: The header every packed file starts with.
+    - RECORD_SIZE: The number of bytes per puzzle.
+
+Example:
+    ```python
+    with open('puzzles.bin', 'wb') as file:
+        write_packed(puzzles, file)
+
+    with PackedCorpus('puzzles.bin') as corpus:
+        board = corpus.board(1000)
+        board.solve()
+    ```
+
+Dependencies:
+    - board: Provides puzzle parsing and formatting, and `Board.from_digits()`.
+    - solver: Provides the solving engines.
+"""
+
+
+import mmap
+
+from board import Board, format_digits, parse_puzzle
+from solver import get_engine
+
+
+MAGIC = b'SDK4'
+RECORD_SIZE = 41
+
+_CELLS = 81
+
+# Maps the hex digits of a record, one per nibble, to the numbers they stand for
+_HEX_DIGITS = bytes.maketrans(b'0123456789abcdef', bytes(range(16)))
+
+
+def pack_digits(digits):
+    """
+    Packs the numbers of a 9x9 puzzle into a record.
+
+    Args:
+        digits (sequence of int): The 81 numbers in row-major order, with 0 for empty cells.
+
+    Returns:
+        bytes: The 41-byte record.
+
+    Raises:
+        ValueError: If there are not 81 numbers.
+    """
+    if len(digits) != _CELLS:
+        raise ValueError(f'A packed puzzle holds {_CELLS} numbers, not {len(digits)}.')
+
+    record = bytearray(RECORD_SIZE)
+    for index in range(0, _CELLS - 1, 2):
+        record[index >> 1] = digits[index] << 4 | digits[index + 1]
+    record[-1] = digits[-1] << 4
+    return bytes(record)
+
+
+def unpack_digits(record):
+    """
+    Unpacks a record into the numbers of a 9x9 puzzle. The record is spelled out in hex, one character per
+    nibble, and translated to numbers in a single pass, which is much faster than splitting it byte by byte.
+
+    Args:
+        record (bytes-like): The 41-byte record, such as a slice of a memory map.
+
+    Returns:
+        list of int: The 81 numbers in row-major order, with 0 for empty cells.
+    """
+    digits = list(record.hex().encode().translate(_HEX_DIGITS))
+    digits.pop()
+    return digits
+
+
+def write_packed(puzzles, stream):
+    """
+    Writes puzzles to a binary stream as a packed file, header included.
+
+    Args:
+        puzzles (iterable of str): The 81-character puzzle strings, in the format read by `parse_puzzle`.
+        stream (file): The binary stream to write to.
+
+    Returns:
+        int: The number of puzzles written.
+
+    Raises:
+        ValueError: If a puzzle is not a valid 9x9 puzzle string.
+    """
+    stream.write(MAGIC)
+    count = 0
+    for puzzle in puzzles:
+        stream.write(pack_digits(parse_puzzle(puzzle, box_size=3)))
+        count += 1
+
+    return count
+
+
+class PackedCorpus:
+    """
+    Represents a packed file mapped into memory, read one record at a time.
+
+    Attributes:
+        path (str): The path of the file.
+    """
+
+    def __init__(self, path):
+        """
+        Opens and maps a packed file.
+
+        Args:
+            path (str or os.PathLike): The path of the file.
+
+        Raises:
+            ValueError: If the file does not start with `MAGIC` or ends in the middle of a record.
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        if self._view[:len(MAGIC)] != MAGIC or (len(self._view) - len(MAGIC)) % RECORD_SIZE:
+            self.close()
+            raise ValueError(f'{path} is not a packed puzzle file.')
+
+        self._count = (len(self._view) - len(MAGIC)) // RECORD_SIZE
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Unmaps the file. Records returned by `record()` must be released first.
+        """
+        self._view.release()
+        self._map.close()
+
+    def record(self, index: int):
+        """
+        Returns the bytes of one puzzle without copying them.
+
+        Args:
+            index (int): The index of the puzzle; negative indices count from the end.
+
+        Returns:
+            memoryview: The 41-byte record, a slice of the memory map.
+
+        Raises:
+            IndexError: If there is no puzzle at that index.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('Packed puzzle index out of range.')
+
+        start = len(MAGIC) + index * RECORD_SIZE
+        return self._view[start:start + RECORD_SIZE]
+
+    def __getitem__(self, index: int):
+        """
+        Returns the numbers of one puzzle.
+
+        Args:
+            index (int): The index of the puzzle; negative indices count from the end.
+
+        Returns:
+            list of int: The 81 numbers in row-major order, with 0 for empty cells.
+
+        Raises:
+            IndexError: If there is no puzzle at that index.
+        """
+        with self.record(index) as record:
+            return unpack_digits(record)
+
+    def __iter__(self):
+        return self.shard(0, self._count)
+
+    def shard(self, start: int, stop: int):
+        """
+        Reads a range of puzzles, touching only the pages that hold them.
+
+        Args:
+            start (int): The index of the first puzzle.
+            stop (int): The index past the last puzzle; clipped to the number of puzzles.
+
+        Yields:
+            list of int: The numbers of each puzzle in the range.
+        """
+        for index in range(max(start, 0), min(stop, self._count)):
+            yield self[index]
+
+    def board(self, index: int):
+        """
+        Builds the board of one puzzle.
+
+        Args:
+            index (int): The index of the puzzle; negative indices count from the end.
+
+        Returns:
+            Board: The board.
+
+        Raises:
+            IndexError: If there is no puzzle at that index.
+            ValueError: If the record holds a number larger than 9.
+        """
+        return Board.from_digits(self[index])
+
+    def puzzle(self, index: int, blank: str = '.'):
+        """
+        Returns one puzzle as a puzzle string.
+
+        Args:
+            index (int): The index of the puzzle; negative indices count from the end.
+            blank (str): The character written for empty cells.
+
+        Returns:
+            str: The 81-character puzzle string.
+        """
+        return format_digits(self[index], blank)
+
+
+def solve_shard(path, start: int, stop: int, engine: str = 'backtracking'):
+    """
+    Solves a range of the puzzles of a packed file in the current process, so pool workers can each be
+    sent a path and a range instead of the puzzles themselves.
+
+    Args:
+        path (str or os.PathLike): The path of the packed file.
+        start (int): The index of the first puzzle.
+        stop (int): The index past the last puzzle.
+        engine (str): Name of the solving engine in `solver.ENGINES`.
+
+    Returns:
+        list of str or None: The 81-character solution of each puzzle, or None if it has no solution.
+    """
+    solve = get_engine(engine)
+    with PackedCorpus(path) as corpus:
+        solutions = []
+        for digits in corpus.shard(start, stop):
+            solution = solve(digits)
+            solutions.append(None if solution is None else format_digits(solution))
+
+    return solutions
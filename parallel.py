@@ -0,0 +1,219 @@
+"""
+parallel.py - Parallel Search Tree Splitting Module
+
+This module spreads the search for one puzzle across a pool of worker processes. The top levels of the search
+tree are expanded in the parent: each subproblem is branched on its empty cell with the fewest candidates, one
+child per candidate, until there are enough subproblems to keep every worker busy. The children of a cell
+split its solutions between them, so the answers of the subproblems merge back into the answer of the puzzle:
+the first solution any of them finds, or the sum of their solution counts.
+
+Some subproblems are far harder than others, so splitting once is not enough to balance the load. Each task
+runs under a node budget (see the `budget` module); a subproblem that does not finish within it returns the
+frontier it has left, and every part of that frontier goes back into the pool as a task of its own, where idle
+workers pick it up. Hard regions of the tree keep being split for as long as they take, without any worker
+sitting on a long task while others are idle.
+
+Functions:
+    - split: Expands the top levels of the search tree of a puzzle into subproblems.
+    - solve_parallel: Finds a solution of a puzzle with a process pool.
+    - count_parallel: Counts the solutions of a puzzle with a process pool.
+
+Usage:
+    - Call `solve_parallel()` for a single very hard puzzle, or `count_parallel()` to count the solutions
+      of a sparse grid. `workers=1` runs the same tasks in the current process.
+
+Example:
+    ```python
+    count = count_parallel('1' + '.' * 80, limit=10 ** 6, workers=8)
+    ```
+
+Dependencies:
+    - board: Provides puzzle parsing and formatting.
+    - budget: Provides the budgeted search and count that return what they left unexplored.
+    - cell: Provides the numbers of a candidate mask.
+    - solver: Provides `Grid`.
+"""
+
+
+from collections import deque
+from functools import partial
+import os
+
+from board import format_digits, parse_puzzle
+from budget import SolveState, count_with_budget, resume
+from cell import mask_digits
+from solver import Grid
+
+
+def split(digits, parts: int):
+    """
+    Expands the top levels of the search tree of a puzzle, one level at a time, until there are at least
+    `parts` subproblems or none of them can be split further. Subproblems whose givens conflict are dropped.
+
+    Args:
+        digits (list of int): The numbers of the puzzle in row-major order, with 0 for empty cells.
+        parts (int): The number of subproblems to aim for.
+
+    Returns:
+        list of list of int: The subproblems, in the order the search would visit them.
+
+    Raises:
+        ValueError: If no supported board has that many cells.
+    """
+    frontier = [list(digits)]
+    while len(frontier) < parts:
+        expanded = []
+        grew = False
+        for subproblem in frontier:
+            grid = Grid.from_digits(subproblem)
+            if grid is None:
+                continue
+
+            index = grid.best_cell()
+            if index < 0:
+                expanded.append(subproblem)
+                continue
+
+            grew = True
+            for digit in mask_digits(grid.masks[index]):
+                mark = len(grid.trail)
+                if grid.guess(index, digit):
+                    expanded.append(grid.digits.tolist())
+                grid.undo(mark)
+
+        frontier = expanded
+        if not grew:
+            break
+
+    return frontier
+
+
+def _solve_part(subproblem, max_nodes: int):
+    """
+    Searches one subproblem for a solution within a node budget; this is the task the workers run.
+
+    Args:
+        subproblem (list of int): The numbers of the subproblem.
+        max_nodes (int): Search nodes the task may visit.
+
+    Returns:
+        tuple: The numbers of a solution or None, and the subproblems left unexplored.
+    """
+    state = resume(SolveState([subproblem]), max_nodes=max_nodes)
+    return state.solution, [] if state.solved else state.frontier
+
+
+def _count_part(subproblem, max_nodes: int, limit):
+    """
+    Counts the solutions of one subproblem within a node budget; this is the task the workers run.
+
+    Args:
+        subproblem (list of int): The numbers of the subproblem.
+        max_nodes (int): Search nodes the task may visit.
+        limit (int or None): The count at which the task may stop.
+
+    Returns:
+        tuple: The number of solutions found, and the subproblems left unexplored.
+    """
+    return count_with_budget([subproblem], limit, max_nodes)
+
+
+def _schedule(task, subproblems, workers: int, merge):
+    """
+    Runs a task on every subproblem and on every subproblem the tasks hand back, until none are left or
+    `merge` asks to stop.
+
+    Args:
+        task (callable): Takes a subproblem and returns a result and a list of subproblems left.
+        subproblems (list of list of int): The subproblems to start with.
+        workers (int): Number of worker processes; 1 runs the tasks in the current process.
+        merge (callable): Takes each result and returns True once no more results are needed.
+    """
+    if workers == 1:
+        queue = deque(subproblems)
+        while queue:
+            result, left = task(queue.popleft())
+            if merge(result):
+                return
+            queue.extendleft(reversed(left))
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    executor = ProcessPoolExecutor(workers)
+    try:
+        pending = {executor.submit(task, subproblem) for subproblem in subproblems}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result, left = future.result()
+                if merge(result):
+                    return
+                pending.update(executor.submit(task, subproblem) for subproblem in left)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def solve_parallel(puzzle: str, workers=None, parts=None, max_nodes: int = 20000):
+    """
+    Finds a solution of a puzzle by searching the subproblems of its top search levels in parallel. If the
+    puzzle has several solutions, any one of them may be returned.
+
+    Args:
+        puzzle (str): The puzzle string, in the format read by `board.parse_puzzle`.
+        workers (int or None): Number of worker processes; None uses every CPU, and 1 searches in the
+                               current process.
+        parts (int or None): The number of subproblems to split the puzzle into up front; None uses eight
+                             per worker.
+        max_nodes (int): Search nodes per task before its remaining subproblems are handed back to the pool.
+
+    Returns:
+        str or None: The solution string, or None if the puzzle has no solution.
+
+    Raises:
+        ValueError: If the puzzle cannot be parsed.
+    """
+    workers = workers or os.cpu_count() or 1
+    solutions = []
+
+    def merge(solution):
+        if solution is not None:
+            solutions.append(solution)
+        return bool(solutions)
+
+    subproblems = split(parse_puzzle(puzzle), parts or workers * 8)
+    _schedule(partial(_solve_part, max_nodes=max_nodes), subproblems, workers, merge)
+    return format_digits(solutions[0]) if solutions else None
+
+
+def count_parallel(puzzle: str, limit=None, workers=None, parts=None, max_nodes: int = 20000):
+    """
+    Counts the solutions of a puzzle by counting those of the subproblems of its top search levels in
+    parallel.
+
+    Args:
+        puzzle (str): The puzzle string, in the format read by `board.parse_puzzle`.
+        limit (int or None): Stop once at least this many solutions are found, or None to count them all.
+        workers (int or None): Number of worker processes; None uses every CPU, and 1 counts in the
+                               current process.
+        parts (int or None): The number of subproblems to split the puzzle into up front; None uses eight
+                             per worker.
+        max_nodes (int): Search nodes per task before its remaining subproblems are handed back to the pool.
+
+    Returns:
+        int: The number of solutions, or, when `limit` is reached, the number found by then, which is at
+             least `limit`.
+
+    Raises:
+        ValueError: If the puzzle cannot be parsed.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = [0]
+
+    def merge(count):
+        total[0] += count
+        return limit is not None and total[0] >= limit
+
+    subproblems = split(parse_puzzle(puzzle), parts or workers * 8)
+    _schedule(partial(_count_part, max_nodes=max_nodes, limit=limit), subproblems, workers, merge)
+    return total[0]
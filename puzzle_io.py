@@ -0,0 +1,110 @@
+"""
+puzzle_io.py - Streaming Puzzle Reader and Writer Module
+
+This module reads and writes puzzle files with one 81-character puzzle per line, using a space (' '), '.' or
+'0' for empty cells. Reading and writing are generator based: puzzles are read one line at a time, handed on to
+the solver lazily and each solution is written as soon as it arrives, so memory use stays bounded however large
+the file is.
+
+Functions:
+    - read_puzzles: Yields the puzzles of a text stream, skipping blank lines.
+    - format_result: Formats one solution as an output line.
+    - write_solutions: Writes `(puzzle, solution)` pairs to a text stream as they are produced.
+    - solve_stream: Connects a reader, `batch.solve_many` and a writer into one pipeline.
+
+Constants:
+    - NO_SOLUTION: The line written for a puzzle that has no solution.
+    - ERROR: The prefix of the line written for a line that is not a valid puzzle.
+
+Usage:
+    - Open the input and output files (or use `sys.stdin`/`sys.stdout`) and call `solve_stream()`.
+
+Example:
+    ```python
+    with open('puzzles.txt', encoding='utf-8') as puzzles, open('solutions.txt', 'w', encoding='utf-8') as out:
+        solve_stream(puzzles, out, workers=4)
+    ```
+
+Dependencies:
+    - batch: Provides `solve_many`, which solves the puzzles across a process pool.
+"""
+
+
+from batch import solve_many
+
+
+NO_SOLUTION = 'No solution.'
+ERROR = 'Error:'
+
+
+def read_puzzles(stream):
+    """
+    Reads puzzles from a text stream one line at a time.
+
+    Only the line ending is stripped, since trailing spaces may be empty cells. Lines holding
+    nothing but whitespace are skipped.
+
+    Args:
+        stream (iterable of str): The text stream, such as an open file or `sys.stdin`.
+
+    Yields:
+        str: The next puzzle line.
+    """
+    for line in stream:
+        line = line.rstrip('\r\n')
+        if line.strip():
+            yield line
+
+
+def format_result(solution):
+    """
+    Formats a solution as an output line.
+
+    Args:
+        solution (str, None or ValueError): The 81-character solution, None if the puzzle has no solution,
+                                            or the error raised for a line that is not a valid puzzle.
+
+    Returns:
+        str: The solution, `No solution.` or an `ERROR` line, without a line ending.
+    """
+    if solution is None:
+        return NO_SOLUTION
+    if isinstance(solution, ValueError):
+        return f'{ERROR} {solution}'
+    return solution
+
+
+def write_solutions(results, stream):
+    """
+    Writes each solution to a text stream as soon as it is produced.
+
+    Args:
+        results (iterable of tuple): `(puzzle, solution)` pairs, as yielded by `batch.solve_many`.
+        stream (file): The text stream to write to.
+
+    Returns:
+        int: The number of solutions written.
+    """
+    count = 0
+    for _, solution in results:
+        stream.write(format_result(solution))
+        stream.write('\n')
+        count += 1
+
+    return count
+
+
+def solve_stream(in_stream, out_stream, **solve_options):
+    """
+    Reads puzzles from one stream, solves them and writes the solutions to another, one line each.
+
+    Args:
+        in_stream (iterable of str): The text stream to read puzzles from.
+        out_stream (file): The text stream to write solutions to.
+        **solve_options: Keyword arguments passed on to `batch.solve_many`, such as `workers`,
+                         `chunksize`, `ordered` and `engine`.
+
+    Returns:
+        int: The number of puzzles processed.
+    """
+    return write_solutions(solve_many(read_puzzles(in_stream), **solve_options), out_stream)
@@ -0,0 +1,331 @@
+"""
+service.py - Asynchronous Solving Service Module
+
+This module runs the solver as a long-lived asyncio service, so callers send puzzle strings to a warm pool of
+worker processes instead of starting an interpreter per puzzle. Requests are parsed and validated with
+`validate.validate_puzzle` in the event loop, so malformed input and conflicting givens are rejected without
+reaching a worker, and only then dispatched to a `ProcessPoolExecutor` whose workers run `board.solve_puzzle`.
+
+Load is bounded in two places. The service holds at most `workers` puzzles in the pool and `max_queue` more
+waiting for a worker; past that, requests are refused with `ServiceBusy` instead of piling up. Each
+connection of the line protocol also has at most that many replies outstanding, after which the service
+stops reading from it, so a client that sends faster than the pool solves is slowed down by TCP itself.
+
+Every request has a timeout covering both the wait for a worker and the solve. A worker process cannot be
+interrupted from outside, so the remaining time is handed to the engine as a deadline and the search gives
+up by itself once it passes; a worker's place in the pool is only given back when its solve has actually
+stopped. Cancelling a request that is still waiting removes it from the pool's queue.
+
+Classes:
+    - ServiceBusy: Raised when a request arrives while the queue is full.
+    - SolverService: Solves puzzles in a process pool and serves them over a line protocol.
+
+Functions:
+    - main: Runs the service from the command line.
+
+Constants:
+    - TIMEOUT: The reply sent for a request that ran out of time.
+    - BUSY: The reply sent for a request refused because the queue is full.
+    - ERROR: The prefix of the reply sent for a puzzle that cannot be parsed.
+
+Usage:
+    - Run `python service.py [--host HOST] [--port PORT] [--workers N] [--max-queue K] [--timeout SECONDS]
+      [--engine NAME]` and send one puzzle per line, using ' ', '.' or '0' for empty cells. Each line gets
+      one reply line, in order: the solution, `No solution.`, `Timeout.`, `Busy.` or `Error: ...`.
+    - From asyncio code, use `SolverService` as an async context manager and await `solve()`.
+
+Example:
+    ```python
+    async with SolverService(workers=4, timeout=2.0) as service:
+        solution = await service.solve(puzzle)
+    ```
+
+Dependencies:
+    - board: Provides `solve_puzzle`, which the workers run.
+    - puzzle_io: Provides the formatting of solutions as reply lines and the `ERROR` prefix.
+    - solver: Provides the engine names.
+    - validate: Provides the checks run on every puzzle before it is dispatched.
+"""
+
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+
+from board import solve_puzzle
+from puzzle_io import ERROR, format_result
+from solver import ENGINES, get_engine
+from validate import validate_puzzle
+
+
+TIMEOUT = 'Timeout.'
+BUSY = 'Busy.'
+
+# Extra seconds to wait for a worker past the deadline, for the engine to notice it
+_GRACE = 0.5
+
+
+class ServiceBusy(Exception):
+    """
+    Raised when a request arrives while every worker is busy and the queue is full.
+    """
+
+
+class SolverService:
+    """
+    Represents a pool of solver processes shared by every request of an event loop.
+
+    Attributes:
+        workers (int): Number of worker processes.
+        max_queue (int): Number of requests that may wait for a worker before new ones are refused.
+        timeout (float or None): Seconds each request may take, waiting included, or None for no limit.
+        engine (str): Name of the solving engine in `solver.ENGINES`.
+        use_techniques (bool): Whether to run the logical techniques before the engine.
+    """
+
+    def __init__(self, workers=None, max_queue: int = 64, timeout=10.0, engine: str = 'backtracking',
+                 use_techniques: bool = True):
+        """
+        Initializes the service. The worker processes are started by `start()` or on the first request.
+
+        Args:
+            workers (int or None): Number of worker processes; None uses every CPU.
+            max_queue (int): Number of requests that may wait for a worker.
+            timeout (float or None): Seconds each request may take, or None for no limit.
+            engine (str): Name of the solving engine in `solver.ENGINES`.
+            use_techniques (bool): Whether to run the logical techniques before the engine.
+
+        Raises:
+            ValueError: If the engine name is unknown or `max_queue` is negative.
+        """
+        get_engine(engine)
+        if max_queue < 0:
+            raise ValueError('max_queue must not be negative.')
+
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.engine = engine
+        self.use_techniques = use_techniques
+        self._executor = None
+        self._slots = asyncio.Semaphore(self.workers)
+        self._pending = 0
+
+    @property
+    def pending(self):
+        """
+        int: The number of requests being solved or waiting for a worker.
+        """
+        return self._pending
+
+    def start(self):
+        """
+        Starts the pool of worker processes, if it is not running yet.
+        """
+        if self._executor is None:
+            # Workers forked from the serving process would inherit its open connections and keep them
+            # alive after the service closes them, so they are forked from a clean server process instead
+            self._executor = ProcessPoolExecutor(self.workers, multiprocessing.get_context('forkserver'))
+
+    def close(self):
+        """
+        Shuts the pool down, dropping the requests that are still waiting for a worker.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def _release(self, loop):
+        """
+        Gives a worker's place back once its solve has stopped; called from the pool's thread.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The event loop the request came from.
+        """
+        def release():
+            self._pending -= 1
+            self._slots.release()
+
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(release)
+
+    async def solve(self, puzzle: str):
+        """
+        Solves a puzzle in the pool.
+
+        Args:
+            puzzle (str): The puzzle string, with ' ', '.' or '0' for empty cells.
+
+        Returns:
+            str or None: The solution string, or None if the puzzle has no solution.
+
+        Raises:
+            ValueError: If the puzzle cannot be parsed or its givens conflict (`validate.ConflictError`).
+            ServiceBusy: If every worker is busy and the queue is full.
+            TimeoutError: If the request takes longer than `timeout`.
+        """
+        validate_puzzle(puzzle)
+        if self._pending >= self.workers + self.max_queue:
+            raise ServiceBusy(f'{self._pending} requests are already pending.')
+
+        self.start()
+        loop = asyncio.get_running_loop()
+        deadline = None if self.timeout is None else loop.time() + self.timeout
+        self._pending += 1
+        submitted = False
+        try:
+            async with asyncio.timeout_at(deadline):
+                await self._slots.acquire()
+
+            remaining = None if deadline is None else max(deadline - loop.time(), 0.0)
+            future = self._executor.submit(solve_puzzle, puzzle, self.engine, self.use_techniques, remaining)
+            future.add_done_callback(lambda _: self._release(loop))
+            submitted = True
+
+            async with asyncio.timeout_at(None if deadline is None else deadline + _GRACE):
+                return await asyncio.wrap_future(future)
+        finally:
+            if not submitted:
+                self._pending -= 1
+
+    async def reply(self, puzzle: str):
+        """
+        Solves a puzzle and formats the outcome as a reply line.
+
+        Args:
+            puzzle (str): The puzzle string.
+
+        Returns:
+            str: The solution, `No solution.`, `TIMEOUT`, `BUSY` or an `ERROR` line, without a line ending.
+        """
+        try:
+            return format_result(await self.solve(puzzle))
+        except ValueError as error:
+            return f'{ERROR} {error}'
+        except TimeoutError:
+            return TIMEOUT
+        except ServiceBusy:
+            return BUSY
+
+    async def _send_replies(self, replies, writer):
+        """
+        Writes the replies of a connection in request order as they complete.
+
+        Args:
+            replies (asyncio.Queue): The reply tasks, ending with None.
+            writer (asyncio.StreamWriter): The connection to write to.
+        """
+        while (task := await replies.get()) is not None:
+            writer.write((await task + '\n').encode('utf-8'))
+            await writer.drain()
+
+    async def handle(self, reader, writer):
+        """
+        Serves one connection of the line protocol: one puzzle per line in, one reply per line out.
+
+        Puzzles are solved concurrently, but once `workers + max_queue` replies are outstanding the
+        connection is not read from until the oldest one has been sent.
+
+        Args:
+            reader (asyncio.StreamReader): The connection to read puzzles from.
+            writer (asyncio.StreamWriter): The connection to write replies to.
+        """
+        replies = asyncio.Queue(self.workers + self.max_queue)
+        sender = asyncio.create_task(self._send_replies(replies, writer))
+        try:
+            while line := await reader.readline():
+                puzzle = line.decode('utf-8', 'replace').rstrip('\r\n')
+                if puzzle.strip():
+                    await replies.put(asyncio.create_task(self.reply(puzzle)))
+            await replies.put(None)
+            await sender
+        except ConnectionError:
+            pass
+        finally:
+            sender.cancel()
+            while not replies.empty():
+                task = replies.get_nowait()
+                if task is not None:
+                    task.cancel()
+            writer.close()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765):
+        """
+        Starts listening for line protocol connections.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The port to listen on; 0 picks a free one.
+
+        Returns:
+            asyncio.Server: The server, already accepting connections.
+        """
+        self.start()
+        return await asyncio.start_server(self.handle, host, port)
+
+
+def parse_args(argv=None):
+    """
+    Parses the command-line arguments.
+
+    Args:
+        argv (list of str or None): The arguments, or None to read them from `sys.argv`.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description='Serve the Sudoku solver over a line protocol.')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='address to listen on')
+    parser.add_argument('--port', type=int, default=8765,
+                        help='port to listen on')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--max-queue', type=int, default=64,
+                        help='requests that may wait for a worker before new ones are refused')
+    parser.add_argument('--timeout', type=float, default=10.0,
+                        help='seconds each request may take')
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='backtracking',
+                        help='solving engine')
+    return parser.parse_args(argv)
+
+
+async def _serve_forever(args):
+    """
+    Runs the service until it is interrupted.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    async with SolverService(args.workers, args.max_queue, args.timeout, args.engine) as service:
+        server = await service.serve(args.host, args.port)
+        async with server:
+            for sock in server.sockets:
+                print(f'Serving on {sock.getsockname()}')
+            await server.serve_forever()
+
+
+def main(argv=None):
+    """
+    Runs the service from the command line until it is interrupted.
+
+    Args:
+        argv (list of str or None): The command-line arguments, or None to read them from `sys.argv`.
+    """
+    try:
+        asyncio.run(_serve_forever(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
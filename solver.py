@@ -0,0 +1,466 @@
+"""
+solver.py - Sudoku Search Module
+
+This module defines the depth-first search used to finish a Sudoku board once logical deduction runs out.
+The search works on a `Grid`, a compact copy of a board's numbers and candidate masks indexed in row-major
+order. A 9x9 grid stores them in an `array('B')` and an `array('H')`, about 400 bytes in all, so large
+batches of grids can be held in memory and copied cheaply without any `Cell` objects. Grids of 16x16 and
+25x25 boards use the tables of their `units.Geometry` and, for 25 numbers, an `array('L')` of masks. Placing a
+number removes it from the candidates of the cell's peers and places any peer left with a single candidate,
+so every branch is followed by constraint propagation. Changes are recorded on a trail so a failed branch is
+undone in place instead of copying the grid.
+
+The module also keeps the registry of solving engines. Every engine takes the numbers of a puzzle in
+row-major order (0 for empty cells), 81 for a 9x9 board, and returns the numbers of a solution, or None when
+there is none, so engines can be swapped per workload and compared on the same inputs. Engines also take an
+optional `stats.SolveStats` that they add their search counters to, and an optional deadline on the
+`time.monotonic()` clock past which they raise `TimeoutError`, so a runaway search can be cut short.
+
+Classes:
+    - Grid: Holds the numbers and candidate masks of the cells in flat arrays, along with the trail of
+      changes.
+
+Functions:
+    - search: Solves a grid by always branching on the empty cell with the fewest candidates.
+    - count_solutions: Counts a grid's solutions with the same search, stopping once a limit is reached.
+    - count_guess: Adds one guess of a search to a `stats.SolveStats`.
+    - solve_backtracking: The engine wrapping `Grid` and `search`.
+    - get_engine: Looks up an engine by name.
+
+Constants:
+    - ENGINES: Maps engine names ('backtracking', 'dlx', 'bitboard') to engine functions.
+
+Usage:
+    - Build a `Grid` from a `Board` with `Grid.from_board()`.
+    - Call `search()` on it, then read the numbers back from `grid.digits`.
+    - Most callers use `Board.solve()`, which picks an engine from `ENGINES` and does both steps.
+
+Example:
+    ```python
+    grid = Grid.from_board(board)
+    if grid is not None and search(grid):
+        print(grid.digits)
+
+    solution = get_engine('dlx')(board.to_digits())
+    ```
+
+Dependencies:
+    - cell: Provides the candidate mask tables shared with `Cell` and the number characters.
+    - bitboard: Provides the bitboard engine.
+    - dlx: Provides the dancing links engine.
+    - units: Provides the peer tables used when placing numbers.
+"""
+
+
+from array import array
+import time
+
+from bitboard import solve_bitboard
+from cell import DIGIT_CHARS, MASK_DIGITS, mask_digits
+from dlx import solve_dlx
+from units import CLASSIC, geometry_for_cells
+
+
+_MASK_SIZE = tuple(len(digits) for digits in MASK_DIGITS)
+
+_EMPTY = {}
+
+
+def _empty_arrays(tables):
+    """
+    Returns the digit and mask arrays of an empty grid, building them once per board size.
+
+    Args:
+        tables (Geometry): The tables of the board size.
+
+    Returns:
+        tuple of array: The digits, all 0, and the masks, all `tables.all_candidates`.
+    """
+    empty = _EMPTY.get(tables.box_size)
+    if empty is None:
+        typecode = 'H' if tables.size <= 16 else 'L'
+        empty = _EMPTY[tables.box_size] = (array('B', bytes(tables.cells)),
+                                           array(typecode, [tables.all_candidates] * tables.cells))
+    return empty
+
+
+class Grid:
+    """
+    Represents the search state of a board as flat arrays.
+
+    Attributes:
+        digits (array of int): `array('B')` of the number in each cell, or 0 for empty cells.
+        masks (array of int): `array('H')`, or `array('L')` for 25x25 boards, of the candidate mask of each
+                              cell; 0 for filled cells.
+        trail (list of int): Flat (index, old mask) pairs recording every change since the last reset. A
+                             negative index `~index` records a placement in cell `index`.
+        geometry (Geometry): The tables of the board size.
+    """
+
+    __slots__ = ('digits', 'masks', 'trail', 'geometry')
+
+    def __init__(self, digits=None, masks=None, geometry=CLASSIC):
+        """
+        Initializes a grid from existing arrays, or an empty grid where every cell has every candidate.
+
+        Args:
+            digits (array of int or None): `array('B')` of numbers to use without copying.
+            masks (array of int or None): Array of candidate masks to use without copying.
+            geometry (Geometry): The tables of the board size.
+        """
+        empty_digits, empty_masks = _empty_arrays(geometry)
+        self.digits = empty_digits[:] if digits is None else digits
+        self.masks = empty_masks[:] if masks is None else masks
+        self.trail = []
+        self.geometry = geometry
+
+    @classmethod
+    def from_digits(cls, digits, geometry=None):
+        """
+        Builds a grid from the numbers of a puzzle.
+
+        Args:
+            digits (list of int): The numbers in row-major order, with 0 for empty cells. Their count
+                                  gives the board size.
+            geometry (Geometry or None): The tables to use, such as those of a variant from
+                                         `units.with_units()`, or None for the tables of the board size.
+
+        Returns:
+            Grid or None: The grid with every given number placed, or None if the givens conflict.
+
+        Raises:
+            ValueError: If no supported board has that many cells.
+        """
+        grid = cls(geometry=geometry or geometry_for_cells(len(digits)))
+        for index, digit in enumerate(digits):
+            if digit and not grid.assign(index, digit):
+                return None
+
+        grid.trail.clear()
+        return grid
+
+    @classmethod
+    def from_board(cls, board):
+        """
+        Builds a grid from the numbers on a board.
+
+        Args:
+            board (Board): The board to copy.
+
+        Returns:
+            Grid or None: The grid with every given number placed, or None if the givens conflict.
+        """
+        return cls.from_digits(board.to_digits())
+
+    def copy(self):
+        """
+        Copies the grid's numbers and candidates, without the trail.
+
+        Returns:
+            Grid: The copy.
+        """
+        return Grid(self.digits[:], self.masks[:], self.geometry)
+
+    def to_string(self, blank: str = ' '):
+        """
+        Converts the grid's numbers into a puzzle string.
+
+        Args:
+            blank (str): The character written for empty cells.
+
+        Returns:
+            str: The puzzle string, one character per cell.
+        """
+        return ''.join(DIGIT_CHARS[digit - 1] if digit else blank for digit in self.digits)
+
+    def assign(self, index: int, digit: int):
+        """
+        Places a number in a cell, removes it from the peers' candidates and places any peer
+        left with a single candidate, recording every change on the trail.
+
+        Args:
+            index (int): Flat index of the cell.
+            digit (int): The number to place.
+
+        Returns:
+            bool: False if the placement leads to a contradiction, True otherwise.
+        """
+        digits = self.digits
+        masks = self.masks
+        trail = self.trail
+        peers = self.geometry.peers
+        pending = [(index, digit)]
+        while pending:
+            index, digit = pending.pop()
+            if digits[index]:
+                if digits[index] != digit:
+                    return False
+                continue
+
+            bit = 1 << (digit - 1)
+            if not masks[index] & bit:
+                return False
+
+            trail.append(~index)
+            trail.append(masks[index])
+            digits[index] = digit
+            masks[index] = 0
+
+            for peer in peers[index]:
+                mask = masks[peer]
+                if not mask & bit:
+                    continue
+
+                trail.append(peer)
+                trail.append(mask)
+                mask ^= bit
+                masks[peer] = mask
+                if not mask:
+                    return False
+                if not mask & (mask - 1):
+                    pending.append((peer, mask.bit_length()))
+
+        return True
+
+    def guess(self, index: int, digit: int):
+        """
+        Places a number chosen by the search. On boards larger than 9x9, where naked singles alone
+        propagate too little, hidden singles are placed as well.
+
+        Args:
+            index (int): Flat index of the cell.
+            digit (int): The number to place.
+
+        Returns:
+            bool: False if the placement leads to a contradiction, True otherwise.
+        """
+        if not self.assign(index, digit):
+            return False
+        return self.geometry.size <= 9 or self.assign_hidden_singles()
+
+    def assign_hidden_singles(self):
+        """
+        Places every number that has only one possible cell left in a unit, repeating until none are left,
+        and recording every change on the trail.
+
+        Returns:
+            bool: False if some unit has a number with no possible cell, or a placement leads to a
+                  contradiction; True otherwise.
+        """
+        digits = self.digits
+        masks = self.masks
+        tables = self.geometry
+        all_candidates = tables.all_candidates
+        changed = True
+        while changed:
+            changed = False
+            for unit in tables.units:
+                once = 0
+                more = 0
+                placed = 0
+                for index in unit:
+                    mask = masks[index]
+                    more |= once & mask
+                    once |= mask
+                    if digits[index]:
+                        placed |= 1 << (digits[index] - 1)
+
+                if once | placed != all_candidates:
+                    return False
+
+                singles = once & ~more
+                while singles:
+                    bit = singles & -singles
+                    singles ^= bit
+                    for index in unit:
+                        if masks[index] & bit:
+                            if not self.assign(index, bit.bit_length()):
+                                return False
+                            changed = True
+                            break
+
+        return True
+
+    def undo(self, mark: int):
+        """
+        Reverts every change recorded on the trail after `mark`.
+
+        Args:
+            mark (int): The trail length to go back to.
+        """
+        digits = self.digits
+        masks = self.masks
+        trail = self.trail
+        while len(trail) > mark:
+            mask = trail.pop()
+            index = trail.pop()
+            if index < 0:
+                index = ~index
+                digits[index] = 0
+            masks[index] = mask
+
+    def best_cell(self):
+        """
+        Finds the empty cell with the fewest candidates.
+
+        Returns:
+            int: Flat index of the cell, or -1 if the grid is full.
+        """
+        best = -1
+        best_size = self.geometry.size + 1
+        if best_size > 10:
+            for index, mask in enumerate(self.masks):
+                if mask and mask.bit_count() < best_size:
+                    best = index
+                    best_size = mask.bit_count()
+                    if best_size == 2:
+                        break
+            return best
+
+        for index, mask in enumerate(self.masks):
+            if mask and _MASK_SIZE[mask] < best_size:
+                best = index
+                best_size = _MASK_SIZE[mask]
+                if best_size == 2:
+                    break
+
+        return best
+
+
+def count_guess(stats, trail, mark: int):
+    """
+    Adds a guess, and the placements and eliminations it caused, to the statistics of a search.
+
+    Args:
+        stats (SolveStats): The statistics to add to.
+        trail (list of int): The grid's trail.
+        mark (int): The trail length before the guess.
+    """
+    placed = sum(trail[entry] < 0 for entry in range(mark, len(trail), 2))
+    stats.guesses += 1
+    stats.singles += placed - 1
+    stats.eliminated += (len(trail) - mark) // 2 - placed
+
+
+def search(grid: Grid, stats=None, depth: int = 0, deadline=None):
+    """
+    Solves a grid in place with depth-first search, branching on the empty cell with the fewest candidates.
+
+    Args:
+        grid (Grid): The grid to solve.
+        stats (SolveStats or None): If given, the nodes, guesses, backtracks, depth, eliminations and
+                                    singles of the search are added to it, read off the trail.
+        depth (int): The depth of this node, for `stats.max_depth`.
+        deadline (float or None): The `time.monotonic()` value at which to give up, or None to search
+                                  without a time limit.
+
+    Returns:
+        bool: True if the grid was solved, False if it has no solution. An unsolvable grid is
+              left as it was.
+
+    Raises:
+        TimeoutError: If the deadline passes. The grid is then left part way through the search.
+    """
+    if stats is not None:
+        stats.nodes += 1
+        stats.max_depth = max(stats.max_depth, depth)
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError('The search ran past its deadline.')
+
+    index = grid.best_cell()
+    if index < 0:
+        return True
+
+    trail = grid.trail
+    for digit in mask_digits(grid.masks[index]):
+        mark = len(trail)
+        consistent = grid.guess(index, digit)
+        if stats is not None:
+            count_guess(stats, trail, mark)
+
+        if consistent and search(grid, stats, depth + 1, deadline):
+            return True
+        if stats is not None:
+            stats.backtracks += 1
+        grid.undo(mark)
+
+    return False
+
+
+def count_solutions(grid: Grid, limit=2):
+    """
+    Counts the solutions of a grid, stopping as soon as `limit` of them have been found.
+    The grid is left as it was.
+
+    Args:
+        grid (Grid): The grid to count solutions for.
+        limit (int or None): The count at which to stop, or None to count every solution.
+
+    Returns:
+        int: The number of solutions found, at most `limit`.
+    """
+    if limit is None:
+        limit = float('inf')
+
+    index = grid.best_cell()
+    if index < 0:
+        return 1
+
+    count = 0
+    for digit in mask_digits(grid.masks[index]):
+        mark = len(grid.trail)
+        if grid.guess(index, digit):
+            count += count_solutions(grid, limit - count)
+        grid.undo(mark)
+        if count >= limit:
+            break
+
+    return count
+
+
+def solve_backtracking(digits, stats=None, deadline=None):
+    """
+    Solves a puzzle with candidate propagation and depth-first search.
+
+    Args:
+        digits (list of int): The numbers of the puzzle in row-major order, with 0 for empty cells.
+        stats (SolveStats or None): If given, the search adds its counters to it.
+        deadline (float or None): The `time.monotonic()` value at which to give up, or None to search
+                                  without a time limit.
+
+    Returns:
+        list of int or None: The numbers of the solution, or None if the puzzle has no solution.
+
+    Raises:
+        ValueError: If no supported board has that many cells.
+        TimeoutError: If the deadline passes before the search ends.
+    """
+    grid = Grid.from_digits(digits)
+    if grid is None or not search(grid, stats, deadline=deadline):
+        return None
+    return grid.digits.tolist()
+
+
+ENGINES = {
+    'backtracking': solve_backtracking,
+    'dlx': solve_dlx,
+    'bitboard': solve_bitboard,
+}
+
+
+def get_engine(name: str):
+    """
+    Looks up a solving engine by name.
+
+    Args:
+        name (str): A key of `ENGINES`.
+
+    Returns:
+        function: The engine.
+
+    Raises:
+        ValueError: If no engine has that name.
+    """
+    if name not in ENGINES:
+        raise ValueError(f'Unknown engine {name!r}.')
+    return ENGINES[name]
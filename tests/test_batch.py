@@ -0,0 +1,51 @@
+import pytest
+from batch import solve_chunk, solve_many
+
+
+PUZZLE = "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7"
+SOLUTION = "791324586385176429426985713963258174214793865857641932542837691179562348638419257"
+UNSOLVABLE = "11" + " " * 79
+
+
+def test_solve_chunk():
+    solutions = solve_chunk([PUZZLE, UNSOLVABLE, "123"])
+
+    assert solutions[:2] == [SOLUTION, None]
+    assert isinstance(solutions[2], ValueError)
+
+
+def test_solve_many_pool_reports_bad_lines():
+    results = list(solve_many([PUZZLE, "123", UNSOLVABLE], workers=2, chunksize=1))
+
+    assert [results[0], results[2]] == [(PUZZLE, SOLUTION), (UNSOLVABLE, None)]
+    assert results[1][0] == "123" and isinstance(results[1][1], ValueError)
+
+
+def test_solve_many_in_process():
+    results = list(solve_many(iter([PUZZLE, UNSOLVABLE]), workers=1, chunksize=1, engine='dlx'))
+
+    assert results == [(PUZZLE, SOLUTION), (UNSOLVABLE, None)]
+
+
+def test_solve_many_pool_keeps_input_order():
+    puzzles = [PUZZLE, UNSOLVABLE] * 5
+
+    results = list(solve_many(puzzles, workers=2, chunksize=1))
+
+    assert [puzzle for puzzle, _ in results] == puzzles
+    assert [solution for _, solution in results] == [SOLUTION, None] * 5
+
+
+def test_solve_many_pool_unordered():
+    puzzles = [PUZZLE, UNSOLVABLE] * 5
+
+    results = list(solve_many(puzzles, workers=2, chunksize=3, ordered=False))
+
+    assert sorted(results, key=str) == sorted(zip(puzzles, [SOLUTION, None] * 5), key=str)
+
+
+def test_solve_many_invalid_arguments():
+    with pytest.raises(ValueError):
+        list(solve_many([PUZZLE], engine='brute force'))
+    with pytest.raises(ValueError):
+        list(solve_many([PUZZLE], chunksize=0))
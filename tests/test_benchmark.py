@@ -0,0 +1,48 @@
+import pytest
+
+from benchmark import CORPORA, compare, count_search, load_corpus, main, run_corpus
+from board import Board
+
+
+SINGLES_PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+
+
+@pytest.mark.parametrize("name", CORPORA)
+def test_corpus_puzzles_are_unique(name):
+    puzzles = load_corpus(name)
+
+    assert puzzles
+    assert all(Board(puzzle).is_unique() for puzzle in puzzles)
+
+
+def test_count_search():
+    assert (count_search(SINGLES_PUZZLE).nodes, count_search(SINGLES_PUZZLE).guesses) == (1, 0)
+    assert count_search("11" + "." * 79).nodes == 0
+    assert count_search(load_corpus('hard')[0]).guesses > 0
+
+
+def test_run_corpus():
+    result = run_corpus([SINGLES_PUZZLE, "11" + "." * 79], repeat=2)
+
+    assert result['puzzles'] == 2
+    assert result['unsolved'] == 1
+    assert result['puzzles_per_sec'] > 0
+    assert result['p50_ms'] <= result['p99_ms']
+    assert result['nodes'] == [1, 0]
+
+
+def test_compare_flags_regressions():
+    baseline = {'corpora': {'easy': {'puzzles_per_sec': 100.0, 'p99_ms': 2.0, 'nodes': [5], 'guesses': [4]}}}
+    same = {'corpora': {'easy': {'puzzles_per_sec': 90.0, 'p99_ms': 2.2, 'nodes': [5], 'guesses': [4]}}}
+    slower = {'corpora': {'easy': {'puzzles_per_sec': 50.0, 'p99_ms': 4.0, 'nodes': [6], 'guesses': [4]}}}
+
+    assert compare(same, baseline) == []
+    assert len(compare(slower, baseline)) == 3
+
+
+def test_main_saves_and_checks_baseline(tmp_path, capsys):
+    path = tmp_path / 'baseline.json'
+
+    assert main(['--corpus', 'easy', '--repeat', '1', '-o', str(path)]) == 0
+    assert main(['--corpus', 'easy', '--repeat', '1', '--baseline', str(path), '--tolerance', '100']) == 0
+    assert 'easy' in capsys.readouterr().out
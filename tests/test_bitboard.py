@@ -0,0 +1,132 @@
+import random
+import time
+
+import pytest
+
+from bitboard import BitBoard, propagate_board, solve_bitboard
+from board import Board, parse_puzzle
+from generator import random_solution
+from solver import solve_backtracking
+from units import CLASSIC, geometry
+
+
+HARD_17_CLUE = ("..............3.85..1.2.......5.7.....4...1...9......."
+                "5......73..2.1........4...9")
+SINGLES_PUZZLE = ("53..7....6..195....98....6.8...6...34..8.3..17...2...6"
+                  ".6....28....419..5....8..79")
+
+
+def test_from_digits_places_givens():
+    board = BitBoard.from_digits(parse_puzzle(SINGLES_PUZZLE))
+
+    assert board.placed.bit_count() == 81 - SINGLES_PUZZLE.count('.')
+    assert board.to_digits() == parse_puzzle(SINGLES_PUZZLE)
+    # 5 is given in r1c1, so it is gone from the rest of the first row, column and box
+    assert board.positions[4] & 1
+    assert not board.positions[4] & (1 << 1 | 1 << 9 | 1 << 10)
+
+
+def test_from_digits_conflicting_givens():
+    assert BitBoard.from_digits(parse_puzzle("11" + "." * 79)) is None
+    assert BitBoard.from_digits(parse_puzzle("1" + "." * 9 + "1" + "." * 70)) is None
+
+
+def test_assign_all_rejects_clashes():
+    board = BitBoard()
+
+    assert not board.assign_all([1 << 0 | 1 << 1] + [0] * 8)  # 1 twice in a row
+    assert not board.assign_all([1 << 0, 1 << 0] + [0] * 7)  # 1 and 2 in one cell
+    assert board.placed == 0
+    assert board.assign_all([1 << 0, 1 << 40] + [0] * 7)
+    assert board.to_digits()[0] == 1 and board.to_digits()[40] == 2
+
+
+def test_hidden_single():
+    board = BitBoard()
+    # Remove 9 from every cell of the first row but the last one
+    for index in range(8):
+        board.positions[8] &= ~(1 << index)
+
+    assert board._hidden_singles()
+    assert board.to_digits()[8] == 9
+
+
+def test_box_line():
+    board = BitBoard()
+    # Confine 1 in the first box to its first row: it is then gone from the rest of that row
+    board.positions[0] &= ~(0b111 << 9 | 0b111 << 18)
+
+    assert board._box_line()
+    assert board.positions[0] & 0x1FF == 0b111
+    # Confined to the first box, 1 in the first row leaves nothing to claim from the box
+    assert not board._box_line()
+
+
+def test_propagate_matches_board():
+    digits = parse_puzzle(SINGLES_PUZZLE)
+    board = BitBoard.from_digits(digits)
+
+    assert board.propagate()
+    assert board.to_digits() == solve_backtracking(digits)
+
+
+def test_cell_masks_match_board_candidates():
+    board = Board(HARD_17_CLUE)
+    board.find_candidates()
+    board.propagate()
+    bits = BitBoard.from_digits(board.to_digits())
+    bits.propagate()
+
+    # The bitboard deductions go further, never elsewhere
+    for cell, digit, mask in zip(board.cells, bits.to_digits(), bits.cell_masks()):
+        if cell.number is None:
+            assert not (mask or 1 << (digit - 1)) & ~cell.mask
+        else:
+            assert digit == cell.number
+
+
+def test_propagate_board():
+    board = Board(SINGLES_PUZZLE)
+
+    assert propagate_board(board)
+    assert board.to_digits() == solve_backtracking(parse_puzzle(SINGLES_PUZZLE))
+    assert board.row_masks == [CLASSIC.all_candidates] * 9
+
+    conflicting = Board("12345678." + "." * 8 + "9" + "." * 63)
+    assert not propagate_board(conflicting)
+    assert conflicting.to_digits()[8] == 0
+
+
+def test_solve_bitboard_matches_backtracking():
+    digits = parse_puzzle(HARD_17_CLUE)
+
+    assert solve_bitboard(digits) == solve_backtracking(digits)
+
+
+def test_solve_bitboard_empty_grid():
+    solution = solve_bitboard([0] * 81)
+
+    assert all(sorted(solution[index] for index in unit) == list(range(1, 10)) for unit in CLASSIC.units)
+
+
+def test_solve_bitboard_unsolvable():
+    assert solve_bitboard(parse_puzzle("11" + "." * 79)) is None
+    assert solve_bitboard(parse_puzzle("12345678." + "." * 8 + "9" + "." * 63)) is None
+
+
+@pytest.mark.parametrize("box_size", [2, 4, 5])
+def test_solve_bitboard_other_sizes(box_size):
+    solution = random_solution(random.Random(box_size), box_size)
+    puzzle = [digit if index % 2 else 0 for index, digit in enumerate(solution)]
+
+    solved = solve_bitboard(puzzle)
+
+    assert solved is not None
+    assert all(solved[index] == digit for index, digit in enumerate(puzzle) if digit)
+    tables = geometry(box_size)
+    assert all(len({solved[index] for index in unit}) == tables.size for unit in tables.units)
+
+
+def test_solve_bitboard_deadline():
+    with pytest.raises(TimeoutError):
+        solve_bitboard(parse_puzzle(HARD_17_CLUE), deadline=time.monotonic() - 1)
@@ -1,5 +1,7 @@
 import pytest
-from board import Board
+from board import (Board, TECHNIQUES, box_line_reduction, format_digits, hidden_pairs, hidden_singles,
+                   hidden_triples, naked_pairs, naked_triples, parse_puzzle, pointing_pairs, register_technique,
+                   solve_puzzle)
 from cell import Cell
 
 
@@ -292,3 +294,314 @@ def test_apply_mono_candidates_full_board():
     for row in board.board:
         for cell in row:
             assert cell.number == 5
+
+
+def test_unit_masks():
+    init_nums = "12" + " " * 7 + "3" + " " * 71
+    board = Board(init_nums)
+
+    assert board.row_masks[0] == 0b011
+    assert board.row_masks[1] == 0b100
+    assert board.col_masks[0] == 0b101
+    assert board.col_masks[1] == 0b010
+    assert board.box_masks[0] == 0b111
+    assert board.box_masks[1] == 0
+
+
+def test_find_candidates_keeps_eliminations():
+    board = Board(' ' * 81)
+    board.board[4][4].candidates = [2, 6]
+    board.add_cell_num(4, 0, 6)
+
+    board.find_candidates()
+
+    assert board.board[4][4].candidates == [2]
+    assert board.board[0][0].candidates == [1, 2, 3, 4, 5, 7, 8, 9]
+
+
+def test_place_removes_peer_candidates():
+    board = Board(' ' * 81)
+    board.find_candidates()
+
+    assert board.place(4, 4, 5)
+
+    assert board.board[4][4].number == 5
+    assert board.board[4][4].candidates == []
+    assert 5 not in board.board[4][0].candidates  # row
+    assert 5 not in board.board[0][4].candidates  # column
+    assert 5 not in board.board[3][3].candidates  # box
+    assert 5 in board.board[0][0].candidates
+    assert board.row_masks[4] == board.col_masks[4] == board.box_masks[4] == 1 << 4
+
+
+def test_place_reports_contradiction():
+    board = Board(' ' * 81)
+    board.find_candidates()
+    board.board[0][8].candidates = [3]
+
+    assert not board.place(0, 0, 3)
+
+
+def test_propagate_solves_singles_puzzle():
+    init_nums = "53  7    6  195    98    6 8   6   34  8 3  17   2   6 6    28    419  5    8  79"
+    board = Board(init_nums)
+    board.find_candidates()
+
+    assert board.propagate()
+
+    solution = "".join(str(cell.number) for row in board.board for cell in row)
+    assert solution == ("534678912672195348198342567859761423426853791"
+                        "713924856961537284287419635345286179")
+
+
+def test_propagate_reports_contradiction():
+    # (0, 7) and (0, 8) can both only be 8
+    board = Board("1234567  " + " " * 18 + " " * 7 + "9 " + " " * 8 + "9" + " " * 36)
+    board.find_candidates()
+
+    assert not board.propagate()
+
+
+def test_solve():
+    init_nums = "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7"
+    board = Board(init_nums)
+
+    assert board.solve()
+
+    solution = "".join(str(cell.number) for row in board.board for cell in row)
+    assert solution == ("791324586385176429426985713963258174214793865857641932"
+                        "542837691179562348638419257")
+    assert all(cell.candidates == [] for row in board.board for cell in row)
+
+
+def test_solve_unsolvable():
+    init_nums = "1234567 8" + " " * 8 + "9" + " " * 63
+    board = Board(init_nums)
+
+    assert not board.solve()
+    assert board.board[0][7].number is None
+
+
+def test_solve_with_dlx():
+    init_nums = "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7"
+    board = Board(init_nums)
+
+    assert board.solve(engine='dlx')
+
+    solution = "".join(str(cell.number) for row in board.board for cell in row)
+    assert solution == ("791324586385176429426985713963258174214793865857641932"
+                        "542837691179562348638419257")
+
+
+def test_to_digits():
+    board = Board("5 3" + " " * 78)
+
+    assert board.to_digits()[:4] == [5, 0, 3, 0]
+    assert len(board.to_digits()) == 81
+
+
+def test_count_solutions():
+    assert Board(" " * 81).count_solutions() == 2
+    assert Board(" " * 81).count_solutions(limit=10) == 10
+    assert Board("11" + " " * 79).count_solutions() == 0
+
+
+def test_is_unique():
+    init_nums = "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7"
+    assert Board(init_nums).is_unique()
+    assert not Board(" " * 81).is_unique()
+    assert not Board("11" + " " * 79).is_unique()
+
+
+def test_parse_puzzle_and_format_digits():
+    digits = parse_puzzle("5 3" + " " * 78)
+
+    assert digits[:3] == [5, 0, 3]
+    assert format_digits(digits) == "5 3" + " " * 78
+    assert format_digits(digits, blank='.') == "5.3" + "." * 78
+
+    with pytest.raises(ValueError):
+        parse_puzzle("x" * 81)
+
+
+def empty_board_with_candidates():
+    board = Board(' ' * 81)
+    board.find_candidates()
+    return board
+
+
+def test_hidden_singles():
+    board = empty_board_with_candidates()
+    for col in range(9):
+        if col != 3:
+            board.board[0][col].remove_candidate(5)
+
+    assert hidden_singles(board) == 1
+    assert board.board[0][3].number == 5
+    assert 5 not in board.board[8][3].candidates
+
+
+def test_naked_pairs():
+    board = empty_board_with_candidates()
+    board.board[0][0].candidates = [1, 2]
+    board.board[0][1].candidates = [1, 2]
+
+    assert naked_pairs(board) == 7 + 6
+    assert board.board[0][5].candidates == [3, 4, 5, 6, 7, 8, 9]
+    assert board.board[2][2].candidates == [3, 4, 5, 6, 7, 8, 9]
+    assert board.board[0][0].candidates == [1, 2]
+    assert 1 in board.board[4][0].candidates
+
+
+def test_pointing_pairs():
+    board = empty_board_with_candidates()
+    for row in (1, 2):
+        for col in range(3):
+            board.board[row][col].remove_candidate(7)
+
+    assert pointing_pairs(board) == 6
+    assert 7 not in board.board[0][8].candidates
+    assert 7 in board.board[0][0].candidates
+    assert 7 in board.board[3][0].candidates
+
+
+def test_box_line_reduction():
+    board = empty_board_with_candidates()
+    for col in range(3, 9):
+        board.board[0][col].remove_candidate(7)
+
+    assert box_line_reduction(board) == 6
+    assert 7 not in board.board[2][2].candidates
+    assert 7 in board.board[0][2].candidates
+    assert 7 in board.board[3][0].candidates
+
+
+def test_hidden_pairs():
+    board = empty_board_with_candidates()
+    for col in range(2, 9):
+        board.board[0][col].candidates = [3, 4, 5, 6, 7, 8, 9]
+
+    assert hidden_pairs(board) == 2
+    assert board.board[0][0].candidates == [1, 2]
+    assert board.board[0][1].candidates == [1, 2]
+
+
+def test_naked_and_hidden_triples():
+    board = empty_board_with_candidates()
+    board.board[0][0].candidates = [1, 2]
+    board.board[0][4].candidates = [2, 3]
+    board.board[0][8].candidates = [1, 3]
+
+    assert naked_triples(board) == 6
+    assert board.board[0][1].candidates == [4, 5, 6, 7, 8, 9]
+
+    board = empty_board_with_candidates()
+    for col in range(3, 9):
+        board.board[0][col].candidates = [4, 5, 6, 7, 8, 9]
+
+    assert hidden_triples(board) == 3
+    assert board.board[0][2].candidates == [1, 2, 3]
+
+
+def test_techniques_registered_by_cost():
+    costs = [cost for cost, _, _ in TECHNIQUES]
+    names = [name for _, name, _ in TECHNIQUES]
+
+    assert costs == sorted(costs)
+    assert names[:2] == ['hidden_single', 'naked_pair']
+    assert {'pointing_pair', 'box_line_reduction', 'hidden_pair', 'naked_triple', 'hidden_triple'} <= set(names)
+
+
+def test_register_technique():
+    calls = []
+
+    @register_technique('test_only', 1)
+    def record(board):
+        calls.append(board)
+        return 0
+
+    try:
+        assert TECHNIQUES[0] == (1, 'test_only', record)
+        board = Board("  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7")
+        board.apply_techniques()
+        assert calls and calls[0] is board
+    finally:
+        TECHNIQUES.remove((1, 'test_only', record))
+
+
+def test_apply_techniques():
+    # solved by hidden singles without any search
+    init_nums = "              3 85  1 2       5 7     4   1   9       5      73  2 1        4   9"
+    board = Board(init_nums)
+
+    assert board.apply_techniques()
+    assert "".join(map(str, board.to_digits())) == ("987654321246173985351928746128537694634892157"
+                                                     "795461832519286473472319568863745219")
+
+
+def test_apply_techniques_contradiction():
+    assert not Board("1234567  " + " " * 18 + " " * 7 + "9 " + " " * 8 + "9" + " " * 36).apply_techniques()
+
+
+def test_solve_without_techniques():
+    init_nums = "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7"
+    board = Board(init_nums)
+
+    assert board.solve(use_techniques=False)
+    assert board.is_unique()
+
+
+def test_parse_and_format_letters():
+    puzzle = "G" + "." * 254 + "a"
+
+    digits = parse_puzzle(puzzle)
+    assert len(digits) == 256
+    assert (digits[0], digits[-1]) == (16, 10)
+    assert format_digits(digits, ".") == "G" + "." * 254 + "A"
+
+
+def test_parse_rejects_digit_too_large():
+    with pytest.raises(ValueError):
+        parse_puzzle("5" + "." * 15)
+    with pytest.raises(ValueError):
+        parse_puzzle("." * 80 + "A")
+
+
+def test_solve_4x4():
+    board = Board("1..." "..1." ".2.." "...3")
+
+    assert board.geometry.size == 4
+    assert board.solve()
+    assert format_digits(board.to_digits()) == "1432" "2314" "3241" "4123"
+
+
+@pytest.mark.parametrize("engine", ["backtracking", "dlx", "bitboard"])
+def test_solve_16x16(engine):
+    # A valid 16x16 grid by the usual shifted-row pattern
+    solution = [(row * 4 + row // 4 + col) % 16 + 1 for row in range(16) for col in range(16)]
+    puzzle = [0 if index % 3 else digit for index, digit in enumerate(solution)]
+    board = Board(format_digits(puzzle))
+
+    assert board.solve(engine)
+    solved = board.to_digits()
+    assert all(solved[index] == digit for index, digit in enumerate(puzzle) if digit)
+    assert all(sorted(solved[index] for index in unit) == list(range(1, 17)) for unit in board.geometry.units)
+
+
+def test_solve_puzzle():
+    puzzle = "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7"
+
+    assert solve_puzzle(puzzle) == "791324586385176429426985713963258174214793865857641932542837691179562348638419257"
+    assert solve_puzzle("11" + " " * 79, engine='dlx') is None
+    with pytest.raises(TimeoutError):
+        solve_puzzle("4" + "." * 80, use_techniques=False, timeout=0.0)
+    with pytest.raises(ValueError):
+        solve_puzzle("123")
+
+
+def test_board_from_digits():
+    digits = [int(char) for char in "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7".replace(" ", "0")]
+
+    assert Board.from_digits(digits).to_digits() == digits
+    with pytest.raises(ValueError):
+        Board.from_digits([10] + digits[1:])
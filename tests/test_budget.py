@@ -0,0 +1,119 @@
+import pytest
+from board import parse_puzzle
+from budget import SolveState, count_with_budget, resume, solve_with_budget
+from solver import Grid, count_solutions, solve_backtracking
+
+
+HARD_17_CLUE = ("000000010400000000020000000000050407008000300001090000"
+                "300400200050100000000806000")
+HARD_17_CLUE_SOLUTION = ("693784512487512936125963874932651487568247391741398625"
+                         "319475268856129743274836159")
+MANY_SOLUTIONS = "1" + "." * 80
+UNSOLVABLE = "12345678." "........9" + "." * 63
+
+
+def test_solve_without_budget():
+    state = solve_with_budget(HARD_17_CLUE)
+
+    assert state.solved and state.finished
+    assert state.solution == parse_puzzle(HARD_17_CLUE_SOLUTION)
+    assert state.stats.nodes > 0
+
+
+def test_budget_pauses_and_resumes():
+    state = solve_with_budget(HARD_17_CLUE, max_nodes=10)
+
+    assert not state.finished
+    assert state.stats.nodes == 10
+    assert len(state.candidates()) == 81
+
+    runs = 1
+    while not state.finished:
+        resume(state, max_nodes=10)
+        runs += 1
+
+    assert runs > 2
+    assert state.solution == parse_puzzle(HARD_17_CLUE_SOLUTION)
+    assert state.candidates() is None
+
+
+@pytest.mark.parametrize("max_nodes", [1, 2, 3, 7, 20])
+def test_paused_solve_finds_the_same_first_solution(max_nodes):
+    state = solve_with_budget(MANY_SOLUTIONS, max_nodes=max_nodes)
+    while not state.finished:
+        resume(state, max_nodes=max_nodes)
+
+    assert state.solution == solve_backtracking(parse_puzzle(MANY_SOLUTIONS))
+
+
+def test_resume_with_other_engine(tmp_path):
+    path = tmp_path / "state.json"
+    solve_with_budget(HARD_17_CLUE, max_nodes=5).save(path)
+
+    state = resume(SolveState.load(path), engine="dlx")
+
+    assert state.solution == parse_puzzle(HARD_17_CLUE_SOLUTION)
+    assert state.stats.nodes > 5
+
+
+def test_timeout_keeps_frontier():
+    state = solve_with_budget(HARD_17_CLUE, timeout=0.0)
+
+    assert len(state.frontier) == 1
+    assert solve_backtracking(state.frontier[0]) == parse_puzzle(HARD_17_CLUE_SOLUTION)
+    frontier = list(state.frontier)
+    assert resume(state, engine="dlx", timeout=0.0).frontier == frontier
+
+
+def test_unsolvable():
+    state = solve_with_budget(UNSOLVABLE, max_nodes=1000)
+
+    assert state.finished and not state.solved
+    assert SolveState.from_dict(state.to_dict()).finished
+
+
+def test_state_round_trip():
+    state = solve_with_budget(HARD_17_CLUE, max_nodes=3)
+    data = state.to_dict()
+
+    assert all(len(puzzle) == 81 for puzzle in data["frontier"])
+    copy = SolveState.from_dict(data)
+    assert copy.frontier == state.frontier
+    assert copy.stats.as_dict() == state.stats.as_dict()
+
+
+def test_node_budget_needs_backtracking():
+    with pytest.raises(ValueError):
+        solve_with_budget(HARD_17_CLUE, max_nodes=10, engine="dlx")
+
+
+def test_count_with_budget():
+    # The first three rows and every third cell emptied: 276 solutions
+    puzzle = [0 if index < 27 or index % 3 == 0 else digit
+              for index, digit in enumerate(parse_puzzle(HARD_17_CLUE_SOLUTION))]
+    total = count_solutions(Grid.from_digits(puzzle), None)
+
+    count, left = count_with_budget([puzzle], max_nodes=5)
+    assert left
+    while left:
+        more, left = count_with_budget(left, max_nodes=5)
+        count += more
+
+    assert count == total
+    assert count_with_budget([puzzle]) == (total, [])
+    assert count_with_budget([parse_puzzle(MANY_SOLUTIONS)], limit=3)[0] == 3
+
+
+def test_count_with_limit_resumes():
+    puzzle = [0 if index < 27 or index % 3 == 0 else digit
+              for index, digit in enumerate(parse_puzzle(HARD_17_CLUE_SOLUTION))]
+    total = count_solutions(Grid.from_digits(puzzle), None)
+
+    count, left = count_with_budget([puzzle], limit=5)
+    assert count == 5
+    assert left
+    while left:
+        more, left = count_with_budget(left, limit=50)
+        count += more
+
+    assert count == total
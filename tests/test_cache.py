@@ -0,0 +1,71 @@
+import random
+
+from board import format_digits, parse_puzzle
+from cache import SolutionCache, Transform, apply_transform, canonicalize, invert_transform
+
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+
+def random_transform(rng):
+    rows = tuple(band * 3 + row for band in rng.sample(range(3), 3) for row in rng.sample(range(3), 3))
+    cols = tuple(stack * 3 + col for stack in rng.sample(range(3), 3) for col in rng.sample(range(3), 3))
+    return Transform(rng.random() < 0.5, rows, cols, tuple([0] + rng.sample(range(1, 10), 9)))
+
+
+def test_transform_round_trip():
+    digits = parse_puzzle(PUZZLE)
+    transform = random_transform(random.Random(0))
+
+    assert invert_transform(apply_transform(digits, transform), transform) == digits
+
+
+def test_canonicalize_maps_equivalent_puzzles_together():
+    digits = parse_puzzle(PUZZLE)
+    canonical, transform = canonicalize(digits)
+    rng = random.Random(1)
+
+    assert apply_transform(digits, transform) == canonical
+    for _ in range(20):
+        assert canonicalize(apply_transform(digits, random_transform(rng)))[0] == canonical
+
+
+def test_cache_hits_on_equivalent_puzzle():
+    cache = SolutionCache(maxsize=4)
+    transform = random_transform(random.Random(2))
+    equivalent = format_digits(apply_transform(parse_puzzle(PUZZLE), transform), '.')
+
+    assert cache.solve(PUZZLE) == SOLUTION
+    assert cache.solve(equivalent) == format_digits(apply_transform(parse_puzzle(SOLUTION), transform))
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+def test_cache_unsolvable_puzzle():
+    cache = SolutionCache()
+    puzzle = "11" + "." * 79
+
+    assert cache.solve(puzzle) is None
+    assert cache.solve(puzzle) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = SolutionCache(maxsize=1)
+    cache.solve(PUZZLE)
+    cache.solve("8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..")
+    cache.solve(PUZZLE)
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 3, 1)
+
+
+def test_cache_save_and_load(tmp_path):
+    path = tmp_path / 'cache.json'
+    cache = SolutionCache()
+    cache.solve(PUZZLE)
+    cache.save(path)
+
+    loaded = SolutionCache()
+    assert loaded.load(path) == 1
+    assert loaded.solve(PUZZLE) == SOLUTION
+    assert (loaded.hits, loaded.misses) == (1, 0)
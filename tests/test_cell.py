@@ -1,5 +1,5 @@
 import pytest
-from cell import Cell
+from cell import MASK_DIGITS, Cell, mask_digits
 
 
 def test_cell_initialization_with_number():
@@ -102,3 +102,48 @@ def test_remove_all_candidates():
     for candidate in candidates:
         cell.remove_candidate(candidate)
     assert cell.candidates == []
+
+
+def test_candidates_stored_as_mask():
+    """
+    Test that candidates are kept as a bitmask with bit n - 1 for number n.
+    """
+    cell = Cell()
+    cell.add_candidate(1)
+    cell.add_candidate(9)
+    assert cell.mask == 0b100000001
+    assert cell.candidates == [1, 9]
+
+
+def test_assign_candidates_list():
+    """
+    Test that assigning a list of candidates replaces the mask.
+    """
+    cell = Cell()
+    cell.candidates = [7, 3, 3]
+    assert cell.mask == 0b001000100
+    assert cell.candidates == [3, 7]
+
+
+def test_cell_has_no_instance_dict():
+    """
+    Test that cells only store their number and mask.
+    """
+    cell = Cell(3)
+    assert not hasattr(cell, '__dict__')
+    with pytest.raises(AttributeError):
+        cell.notes = []
+
+
+def test_wide_candidate_mask():
+    cell = Cell()
+    cell.candidates = [1, 10, 16, 25]
+
+    assert cell.mask == 1 | 1 << 9 | 1 << 15 | 1 << 24
+    assert cell.candidates == [1, 10, 16, 25]
+    assert mask_digits(0x1FF) == MASK_DIGITS[0x1FF]
+
+
+def test_mask_digits_table():
+    assert len(MASK_DIGITS) == 512
+    assert all(MASK_DIGITS[mask] == tuple(n for n in range(1, 10) if mask >> (n - 1) & 1) for mask in range(512))
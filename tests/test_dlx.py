@@ -0,0 +1,82 @@
+import random
+import time
+
+import pytest
+
+from dlx import DancingLinks, solve_dlx
+from generator import random_solution
+from solver import solve_backtracking
+from units import geometry
+
+
+ANTI_BACKTRACKING = ("..............3.85..1.2.......5.7.....4...1...9......."
+                     "5......73..2.1........4...9")
+
+
+def to_digits(puzzle):
+    return [0 if char == '.' else int(char) for char in puzzle]
+
+
+def test_matrix_size():
+    links = DancingLinks()
+
+    assert len(links.size) == 325  # root + 324 constraint columns
+    assert all(size == 9 for size in links.size[1:])
+    assert len(links.column) == 325 + 729 * 4
+
+
+def test_cover_and_uncover_restore_links():
+    links = DancingLinks()
+    before = (list(links.left), list(links.right), list(links.up), list(links.down), list(links.size))
+
+    links.cover(1)
+    links.cover(100)
+    assert links.size[82] == 8
+    links.uncover(100)
+    links.uncover(1)
+
+    assert (links.left, links.right, links.up, links.down, links.size) == before
+
+
+def test_select_conflicting_givens():
+    links = DancingLinks()
+
+    assert links.select(0)  # 1 in cell 0
+    assert not links.select(9)  # 1 in cell 1, same row
+
+
+def test_solve_dlx_matches_backtracking():
+    digits = to_digits(ANTI_BACKTRACKING)
+
+    solution = solve_dlx(digits)
+
+    assert solution == solve_backtracking(digits)
+    assert all(solution[i] == digit for i, digit in enumerate(digits) if digit)
+
+
+def test_solve_dlx_empty_grid():
+    solution = solve_dlx([0] * 81)
+
+    for row in range(9):
+        assert sorted(solution[row * 9:row * 9 + 9]) == list(range(1, 10))
+
+
+def test_solve_dlx_unsolvable():
+    assert solve_dlx(to_digits("11" + "." * 79)) is None
+    assert solve_dlx(to_digits("12345678." + "." * 8 + "9" + "." * 63)) is None
+
+
+def test_solve_dlx_16x16():
+    solution = random_solution(random.Random(5), box_size=4)
+    puzzle = [digit if index % 2 else 0 for index, digit in enumerate(solution)]
+
+    solved = solve_dlx(puzzle)
+
+    assert solved is not None
+    assert all(solved[index] == digit for index, digit in enumerate(puzzle) if digit)
+    assert DancingLinks(geometry(4)).geometry.size == 16
+
+
+def test_solve_dlx_deadline():
+    with pytest.raises(TimeoutError):
+        solve_dlx(to_digits(ANTI_BACKTRACKING), deadline=time.monotonic() - 1)
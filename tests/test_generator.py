@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from board import Board, format_digits
+from generator import SYMMETRIES, generate, random_solution, reduce_clues
+
+
+def test_random_solution_is_complete_and_valid():
+    solution = random_solution(random.Random(0))
+    board = Board(''.join(map(str, solution)))
+
+    assert 0 not in solution
+    assert board.is_unique()
+    assert all(mask == 0x1FF for mask in board.row_masks + board.col_masks + board.box_masks)
+
+
+@pytest.mark.parametrize("symmetry", sorted(SYMMETRIES))
+def test_generate_unique_and_symmetric(symmetry):
+    puzzle, solution = generate(symmetry=symmetry, seed=3)
+    group_of = SYMMETRIES[symmetry]
+
+    assert Board(puzzle).is_unique()
+    assert all(given in '.' + digit for given, digit in zip(puzzle, solution))
+    for index in range(81):
+        assert all((puzzle[index] == '.') == (puzzle[other] == '.') for other in group_of(index, 9))
+
+
+def test_generate_solution_matches_solver():
+    puzzle, solution = generate(seed=7)
+    board = Board(puzzle)
+    board.solve()
+
+    assert ''.join(map(str, board.to_digits())) == solution
+
+
+def test_generate_target_clues():
+    puzzle, _ = generate(clues=35, symmetry='none', seed=5)
+
+    assert 81 - puzzle.count('.') == 35
+
+
+def test_generate_is_reproducible():
+    assert generate(seed=11) == generate(seed=11)
+    assert generate(seed=11, blank='0')[0] == generate(seed=11)[0].replace('.', '0')
+
+
+def test_reduce_clues_unknown_symmetry():
+    with pytest.raises(ValueError):
+        reduce_clues(random_solution(random.Random(0)), random.Random(0), symmetry='spiral')
+
+
+@pytest.mark.parametrize("box_size", [2, 4])
+def test_generate_other_sizes(box_size):
+    clues = {2: None, 4: 160}[box_size]
+    puzzle, solution = generate(clues=clues, seed=2, box_size=box_size)
+    size = box_size * box_size
+
+    assert len(puzzle) == len(solution) == size ** 2
+    board = Board(puzzle)
+    assert board.solve()
+    assert format_digits(board.to_digits()) == solution
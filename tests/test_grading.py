@@ -0,0 +1,52 @@
+from board import TECHNIQUES
+from grading import SEARCH_COST, grade, technique_costs
+
+
+SINGLES_PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+PAIRS_PUZZLE = "..1...5........4....6.8..139.......4.....3.6.8.7..1....42..76.1...5.2......41...7"
+SEARCH_PUZZLE = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+
+
+def test_technique_costs():
+    costs = technique_costs()
+
+    assert costs['naked_single'] == 1
+    assert all(costs[name] == cost for cost, name, _ in TECHNIQUES)
+
+
+def test_grade_naked_singles():
+    result = grade(SINGLES_PUZZLE)
+
+    assert result.solved
+    assert result.level == 'easy'
+    assert result.hardest == 'naked_single'
+    assert result.counts == {'naked_single': 1}
+    assert result.trace == (('naked_single', 51),)
+    assert result.score == 1
+
+
+def test_grade_records_every_step():
+    result = grade(PAIRS_PUZZLE)
+
+    assert result.solved
+    assert result.level == 'hard'
+    assert result.hardest == 'hidden_pair'
+    assert sum(result.counts.values()) == len(result.trace)
+    placed = sum(changes for name, changes in result.trace if name in ('naked_single', 'hidden_single'))
+    assert placed == PAIRS_PUZZLE.count('.')
+    assert result.score == sum(technique_costs()[name] for name, _ in result.trace)
+
+
+def test_grade_needs_search():
+    result = grade(SEARCH_PUZZLE)
+
+    assert not result.solved
+    assert result.level == 'search'
+    assert result.score >= SEARCH_COST
+
+
+def test_grade_invalid():
+    result = grade("11" + "." * 79)
+
+    assert result.level == 'invalid'
+    assert not result.solved
@@ -0,0 +1,75 @@
+import io
+
+import pytest
+from board import Board
+from packed import MAGIC, RECORD_SIZE, PackedCorpus, pack_digits, solve_shard, unpack_digits, write_packed
+
+
+PUZZLE = "..1...5........4....6.8..139.......4.....3.6.8.7..1....42..76.1...5.2......41...7"
+SOLUTION = "791324586385176429426985713963258174214793865857641932542837691179562348638419257"
+UNSOLVABLE = "11" + "." * 79
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    path = tmp_path / "puzzles.bin"
+    with open(path, "wb") as file:
+        write_packed([PUZZLE, SOLUTION, UNSOLVABLE], file)
+    return path
+
+
+def test_pack_round_trip():
+    digits = [int(char) for char in SOLUTION]
+
+    record = pack_digits(digits)
+
+    assert len(record) == RECORD_SIZE
+    assert record[0] == 0x79
+    assert unpack_digits(record) == digits
+    with pytest.raises(ValueError):
+        pack_digits(digits[:80])
+
+
+def test_write_packed_size():
+    stream = io.BytesIO()
+
+    assert write_packed([PUZZLE, SOLUTION], stream) == 2
+    assert stream.getvalue().startswith(MAGIC)
+    assert len(stream.getvalue()) == len(MAGIC) + 2 * RECORD_SIZE
+    with pytest.raises(ValueError):
+        write_packed(["1" * 16], io.BytesIO())
+
+
+def test_corpus_random_access(corpus_path):
+    with PackedCorpus(corpus_path) as corpus:
+        assert len(corpus) == 3
+        assert corpus.puzzle(0) == PUZZLE
+        assert corpus.puzzle(-2) == SOLUTION
+        assert [corpus.puzzle(index) for index in range(3)] == [PUZZLE, SOLUTION, UNSOLVABLE]
+        assert list(corpus.shard(1, 10)) == [corpus[1], corpus[2]]
+        with corpus.record(1) as record:
+            assert bytes(record) == pack_digits([int(char) for char in SOLUTION])
+        with pytest.raises(IndexError):
+            corpus[3]
+
+
+def test_corpus_board(corpus_path):
+    with PackedCorpus(corpus_path) as corpus:
+        board = corpus.board(0)
+
+    assert board.to_digits() == Board(PUZZLE).to_digits()
+    assert board.solve()
+
+
+def test_corpus_rejects_other_files(tmp_path):
+    path = tmp_path / "puzzles.txt"
+    path.write_text(PUZZLE + "\n")
+
+    with pytest.raises(ValueError):
+        PackedCorpus(path)
+
+
+def test_solve_shard(corpus_path):
+    assert solve_shard(corpus_path, 0, 3) == [SOLUTION, SOLUTION, None]
+    assert solve_shard(corpus_path, 2, 3, engine='dlx') == [None]
+
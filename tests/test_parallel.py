@@ -0,0 +1,42 @@
+import pytest
+from board import parse_puzzle
+from parallel import count_parallel, solve_parallel, split
+from solver import Grid, count_solutions
+
+
+HARD_17_CLUE = ("000000010400000000020000000000050407008000300001090000"
+                "300400200050100000000806000")
+HARD_17_CLUE_SOLUTION = ("693784512487512936125963874932651487568247391741398625"
+                         "319475268856129743274836159")
+# The first three rows and every third cell of HARD_17_CLUE_SOLUTION emptied
+SPARSE = "".join("." if index < 27 or index % 3 == 0 else digit
+                 for index, digit in enumerate(HARD_17_CLUE_SOLUTION))
+
+
+def test_split_partitions_solutions():
+    digits = parse_puzzle(SPARSE)
+
+    subproblems = split(digits, 20)
+
+    assert len(subproblems) >= 20
+    total = count_solutions(Grid.from_digits(digits), None)
+    assert sum(count_solutions(Grid.from_digits(part), None) for part in subproblems) == total
+
+
+def test_split_stops_when_solved():
+    assert split(parse_puzzle(HARD_17_CLUE_SOLUTION), 8) == [parse_puzzle(HARD_17_CLUE_SOLUTION)]
+    assert split(parse_puzzle("11" + "." * 79), 8) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_parallel(workers):
+    assert solve_parallel(HARD_17_CLUE, workers=workers, max_nodes=50) == HARD_17_CLUE_SOLUTION
+    assert solve_parallel("12345678." "........9" + "." * 63, workers=workers) is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_count_parallel(workers):
+    total = count_solutions(Grid.from_digits(parse_puzzle(SPARSE)), None)
+
+    assert count_parallel(SPARSE, workers=workers, parts=4, max_nodes=20) == total
+    assert count_parallel(SPARSE, limit=10, workers=workers, parts=4, max_nodes=20) >= 10
@@ -0,0 +1,51 @@
+import io
+from puzzle_io import ERROR, NO_SOLUTION, format_result, read_puzzles, solve_stream, write_solutions
+
+
+PUZZLE = "..1...5........4....6.8..139.......4.....3.6.8.7..1....42..76.1...5.2......41...7"
+SOLUTION = "791324586385176429426985713963258174214793865857641932542837691179562348638419257"
+
+
+def test_read_puzzles_skips_blank_lines():
+    stream = io.StringIO(f"{PUZZLE}\n\n   \n{PUZZLE.replace('.', ' ')}\r\n")
+
+    assert list(read_puzzles(stream)) == [PUZZLE, PUZZLE.replace('.', ' ')]
+
+
+def test_read_puzzles_is_lazy():
+    def lines():
+        yield PUZZLE + "\n"
+        raise AssertionError("read past the first puzzle")
+
+    assert next(read_puzzles(lines())) == PUZZLE
+
+
+def test_write_solutions():
+    stream = io.StringIO()
+
+    assert write_solutions([(PUZZLE, SOLUTION), ("11", None)], stream) == 2
+    assert stream.getvalue() == f"{SOLUTION}\n{NO_SOLUTION}\n"
+
+
+def test_format_result():
+    assert format_result(SOLUTION) == SOLUTION
+    assert format_result(None) == NO_SOLUTION
+    assert format_result(ValueError("Bad puzzle.")) == f"{ERROR} Bad puzzle."
+
+
+def test_solve_stream_accepts_all_blank_characters():
+    in_stream = io.StringIO("\n".join([PUZZLE, PUZZLE.replace('.', '0'), PUZZLE.replace('.', ' '), "11" + "." * 79]))
+    out_stream = io.StringIO()
+
+    assert solve_stream(in_stream, out_stream, workers=1) == 4
+    assert out_stream.getvalue().splitlines() == [SOLUTION] * 3 + [NO_SOLUTION]
+
+
+def test_solve_stream_reports_bad_lines():
+    in_stream = io.StringIO("\n".join([PUZZLE, "11", "11" + "." * 79, PUZZLE]))
+    out_stream = io.StringIO()
+
+    assert solve_stream(in_stream, out_stream, workers=1) == 4
+    lines = out_stream.getvalue().splitlines()
+    assert [lines[0], lines[2], lines[3]] == [SOLUTION, NO_SOLUTION, SOLUTION]
+    assert lines[1].startswith(f"{ERROR} ")
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from service import BUSY, ERROR, TIMEOUT, ServiceBusy, SolverService
+
+
+PUZZLE = "  1   5        4    6 8  139       4     3 6 8 7  1    42  76 1   5 2      41   7"
+SOLUTION = "791324586385176429426985713963258174214793865857641932542837691179562348638419257"
+UNSOLVABLE = "12345678." "........9" + " " * 63
+CONFLICTING = "11" + " " * 79
+HARD_17_CLUE = ("000000010400000000020000000000050407008000300001090000"
+                "300400200050100000000806000")
+
+
+def test_service_solve():
+    async def run():
+        async with SolverService(workers=2) as service:
+            results = await asyncio.gather(service.solve(PUZZLE), service.solve(UNSOLVABLE))
+            assert service.pending == 0
+            return results
+
+    assert asyncio.run(run()) == [SOLUTION, None]
+
+
+def test_service_rejects_bad_puzzle_before_dispatch():
+    async def run():
+        service = SolverService(workers=1)
+        with pytest.raises(ValueError):
+            await service.solve("123")
+        return service
+
+    assert asyncio.run(run())._executor is None
+
+
+def test_service_timeout():
+    async def run():
+        async with SolverService(workers=1, timeout=0.0, use_techniques=False) as service:
+            return await service.reply(HARD_17_CLUE)
+
+    assert asyncio.run(run()) == TIMEOUT
+
+
+def test_service_busy():
+    async def run():
+        async with SolverService(workers=1, max_queue=0) as service:
+            first = asyncio.create_task(service.solve(PUZZLE))
+            await asyncio.sleep(0)
+            with pytest.raises(ServiceBusy):
+                await service.solve(PUZZLE)
+            assert await service.reply(PUZZLE) == BUSY
+            return await first
+
+    assert asyncio.run(run()) == SOLUTION
+
+
+def test_service_invalid_arguments():
+    with pytest.raises(ValueError):
+        SolverService(engine='brute force')
+    with pytest.raises(ValueError):
+        SolverService(max_queue=-1)
+
+
+def test_line_protocol():
+    async def run():
+        async with SolverService(workers=2) as service:
+            server = await service.serve('127.0.0.1', 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.write(f"{PUZZLE}\n\n{UNSOLVABLE}\n123\n{CONFLICTING}\n".encode())
+                writer.write_eof()
+                replies = (await reader.read()).decode().splitlines()
+                writer.close()
+                return replies
+
+    replies = asyncio.run(run())
+
+    assert replies[:2] == [SOLUTION, "No solution."]
+    assert replies[2].startswith(ERROR)
+    assert replies[3] == f"{ERROR} Puzzle holds conflicting givens at r1c1, r1c2."
+    assert len(replies) == 4
@@ -0,0 +1,160 @@
+import random
+import time
+
+import pytest
+from board import Board
+from generator import random_solution
+from solver import ENGINES, Grid, count_solutions, get_engine, search, solve_backtracking
+from units import geometry
+
+
+HARD_17_CLUE = ("000000010400000000020000000000050407008000300001090000"
+                "300400200050100000000806000").replace("0", " ")
+HARD_17_CLUE_SOLUTION = ("693784512487512936125963874932651487568247391741398625"
+                         "319475268856129743274836159")
+
+
+def test_grid_from_board():
+    grid = Grid.from_board(Board("5" + " " * 80))
+
+    assert grid.digits[0] == 5
+    assert grid.masks[0] == 0
+    assert not grid.masks[1] & 1 << 4  # row peer
+    assert not grid.masks[9] & 1 << 4  # column peer
+    assert not grid.masks[20] & 1 << 4  # box peer
+    assert grid.masks[80] & 1 << 4
+    assert grid.trail == []
+
+
+def test_grid_from_board_conflicting_givens():
+    assert Grid.from_board(Board("55" + " " * 79)) is None
+
+
+def test_assign_and_undo():
+    grid = Grid.from_board(Board(" " * 81))
+    digits = list(grid.digits)
+    masks = list(grid.masks)
+
+    assert grid.assign(40, 7)
+    assert grid.digits[40] == 7
+    assert not grid.masks[36] & 1 << 6
+
+    grid.undo(0)
+    assert grid.digits.tolist() == digits
+    assert grid.masks.tolist() == masks
+    assert grid.trail == []
+
+
+def test_grid_is_compact():
+    grid = Grid.from_board(Board("5" + " " * 80))
+
+    assert grid.digits.typecode == 'B'
+    assert grid.masks.typecode == 'H'
+    assert not hasattr(grid, '__dict__')
+
+
+def test_grid_copy():
+    grid = Grid.from_board(Board("5" + " " * 80))
+    copy = grid.copy()
+
+    assert copy.assign(1, 3)
+    assert grid.digits[1] == 0
+    assert grid.masks[2] & 1 << 2
+    assert not copy.masks[2] & 1 << 2
+    assert copy.to_string('.') == "53" + "." * 79
+
+
+def test_best_cell():
+    grid = Grid.from_board(Board("12345  " + " " * 74))
+
+    assert grid.best_cell() in (5, 6)
+
+
+def test_search_hard_puzzle():
+    grid = Grid.from_board(Board(HARD_17_CLUE))
+
+    assert search(grid)
+    assert "".join(map(str, grid.digits)) == HARD_17_CLUE_SOLUTION
+
+
+def test_search_unsolvable():
+    # (0, 8) has no candidate left once the givens are placed
+    grid = Grid.from_board(Board("12345678 " + " " * 8 + "9" + " " * 63))
+
+    assert grid is None or not search(grid)
+
+
+def test_get_engine():
+    assert get_engine('backtracking') is solve_backtracking
+    assert get_engine('dlx') is ENGINES['dlx']
+
+    with pytest.raises(ValueError):
+        get_engine('brute force')
+
+
+def test_engines_agree():
+    digits = Board(HARD_17_CLUE).to_digits()
+
+    for engine in ENGINES.values():
+        assert "".join(map(str, engine(digits))) == HARD_17_CLUE_SOLUTION
+
+
+def test_count_solutions_stops_at_limit():
+    grid = Grid.from_board(Board(" " * 81))
+
+    assert count_solutions(grid, limit=1) == 1
+    assert count_solutions(grid, limit=5) == 5
+    assert grid.digits.tolist() == [0] * 81
+
+
+def test_count_solutions_all():
+    solved = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+    assert count_solutions(Grid.from_board(Board(solved[:72] + " " * 9)), limit=None) == 1
+
+    # blanking (0, 3), (0, 4), (3, 3) and (3, 4) lets the 6 and 7 swap
+    puzzle = list(solved)
+    for index in (3, 4, 30, 31):
+        puzzle[index] = " "
+    assert count_solutions(Grid.from_board(Board("".join(puzzle))), limit=None) == 2
+
+
+def test_grid_wide_masks():
+    grid = Grid(geometry=geometry(5))
+
+    assert grid.masks.typecode == 'L'
+    assert grid.masks[0] == (1 << 25) - 1
+    assert Grid().masks.typecode == 'H'
+
+
+def test_assign_hidden_singles():
+    grid = Grid(geometry=geometry(4))
+    # Remove 16 from every cell of the first row but the last one
+    for index in range(15):
+        grid.masks[index] &= ~(1 << 15)
+
+    assert grid.assign_hidden_singles()
+    assert grid.digits[15] == 16
+    grid.undo(0)
+    assert grid.digits[15] == 0
+
+
+@pytest.mark.parametrize("box_size", [4, 5])
+def test_solve_backtracking_large(box_size):
+    solution = random_solution(random.Random(box_size), box_size)
+    puzzle = [digit if index % 2 else 0 for index, digit in enumerate(solution)]
+
+    solved = solve_backtracking(puzzle)
+
+    assert solved is not None
+    assert all(solved[index] == digit for index, digit in enumerate(puzzle) if digit)
+    tables = geometry(box_size)
+    assert all(len({solved[index] for index in unit}) == tables.size for unit in tables.units)
+
+
+def test_search_deadline():
+    grid = Grid.from_board(Board(HARD_17_CLUE))
+
+    with pytest.raises(TimeoutError):
+        search(grid, deadline=time.monotonic() - 1)
+    with pytest.raises(TimeoutError):
+        Board(HARD_17_CLUE).solve(use_techniques=False, deadline=time.monotonic() - 1)
@@ -0,0 +1,58 @@
+import pytest
+
+from board import Board
+from stats import SolveStats, solve_with_stats
+
+
+SINGLES_PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SINGLES_SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+SEARCH_PUZZLE = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+
+
+def test_singles_without_search():
+    solution, stats = solve_with_stats(SINGLES_PUZZLE)
+
+    assert solution == SINGLES_SOLUTION
+    assert stats.singles == SINGLES_PUZZLE.count('.')
+    assert stats.eliminated > 0
+    assert (stats.nodes, stats.guesses, stats.backtracks, stats.max_depth) == (1, 0, 0, 0)
+    assert set(stats.technique_time) == {'find_candidates', 'naked_single'}
+
+
+@pytest.mark.parametrize("engine", ["backtracking", "dlx", "bitboard"])
+def test_search_counters(engine):
+    solution, stats = solve_with_stats(SEARCH_PUZZLE, engine, use_techniques=False)
+    board = Board(SEARCH_PUZZLE)
+    board.solve(engine)
+
+    assert solution == ''.join(map(str, board.to_digits()))
+    assert stats.nodes > 1
+    assert stats.nodes <= stats.guesses + 1
+    assert 0 < stats.guesses - stats.backtracks <= stats.max_depth
+    assert stats.search_time > 0
+    assert stats.technique_time == {}
+
+
+def test_unsolvable():
+    solution, stats = solve_with_stats("11" + "." * 79)
+
+    assert solution is None
+    assert stats.nodes == 0
+
+
+def test_stats_accumulate_and_export():
+    stats = SolveStats()
+    Board(SINGLES_PUZZLE).solve(stats=stats)
+    Board(SINGLES_PUZZLE).solve(stats=stats)
+
+    exported = stats.as_dict()
+    assert exported['singles'] == 2 * SINGLES_PUZZLE.count('.')
+    assert exported['nodes'] == 2
+    assert 'SolveStats(' in repr(stats)
+
+
+def test_stats_from_dict():
+    _, stats = solve_with_stats(SEARCH_PUZZLE)
+
+    assert SolveStats.from_dict(stats.as_dict()).as_dict() == stats.as_dict()
+    assert SolveStats.from_dict({"nodes": 3}).nodes == 3
@@ -0,0 +1,71 @@
+import pytest
+
+from units import (BOX_OF, BOX_SIZES, BOX_UNITS, CELL_UNITS, CLASSIC, COL_OF, COL_UNITS, PEERS, ROW_OF, ROW_UNITS,
+                   UNITS, geometry, geometry_for_cells, with_units)
+
+
+def test_units():
+    assert len(UNITS) == 27
+    assert all(len(unit) == 9 for unit in UNITS)
+    assert ROW_UNITS[1] == tuple(range(9, 18))
+    assert COL_UNITS[2] == tuple(range(2, 81, 9))
+    assert BOX_UNITS[4] == (30, 31, 32, 39, 40, 41, 48, 49, 50)
+
+
+def test_cell_units():
+    # cell (4, 7)
+    assert (ROW_OF[43], COL_OF[43], BOX_OF[43]) == (4, 7, 5)
+    assert CELL_UNITS[43] == (4, 16, 23)
+    assert all(index in UNITS[unit] for index in range(81) for unit in CELL_UNITS[index])
+
+
+def test_peers():
+    assert all(len(peers) == 20 for peers in PEERS)
+    assert all(index not in peers for index, peers in enumerate(PEERS))
+    assert all(index in PEERS[peer] for index, peers in enumerate(PEERS) for peer in peers)
+    assert set(PEERS[0]) == set(range(1, 9)) | set(range(9, 81, 9)) | {10, 11, 19, 20}
+
+
+@pytest.mark.parametrize("box_size", BOX_SIZES)
+def test_geometry(box_size):
+    tables = geometry(box_size)
+    size = box_size * box_size
+
+    assert (tables.size, tables.cells, tables.all_candidates) == (size, size * size, (1 << size) - 1)
+    assert len(tables.units) == 3 * size
+    assert all(len(peers) == 3 * size - 2 * box_size - 1 for peers in tables.peers)
+    assert geometry_for_cells(box_size ** 4) is tables
+
+
+def test_geometry_classic_tables():
+    assert CLASSIC is geometry(3)
+    assert (CLASSIC.units, CLASSIC.peers, CLASSIC.cell_units) == (UNITS, PEERS, CELL_UNITS)
+
+
+def test_geometry_unsupported():
+    with pytest.raises(ValueError):
+        geometry(6)
+    with pytest.raises(ValueError):
+        geometry_for_cells(82)
+
+
+def test_with_units():
+    diagonal = tuple(range(0, 81, 10))
+    tables = with_units(CLASSIC, [diagonal], [(1, 2)])
+
+    assert tables.units == UNITS + (diagonal,)
+    assert tables.cell_units[0] == CELL_UNITS[0] + (27,)
+    assert tables.cell_units[1] == CELL_UNITS[1]
+    assert 80 in tables.peers[0] and 80 not in PEERS[0]
+    assert 0 in tables.peers[80]
+    assert tables.peers[1] == PEERS[1]  # cells 1 and 2 already share a row
+    assert CLASSIC.units == UNITS  # the classic tables are left alone
+
+
+def test_with_units_invalid():
+    with pytest.raises(ValueError):
+        with_units(CLASSIC, [range(8)])
+    with pytest.raises(ValueError):
+        with_units(CLASSIC, [(0,) * 9])
+    with pytest.raises(ValueError):
+        with_units(CLASSIC, cliques=[(80, 81)])
@@ -0,0 +1,56 @@
+import pytest
+from board import parse_puzzle
+from validate import ConflictError, cell_name, check_solution, find_conflicts, validate_puzzle
+
+
+PUZZLE = "..1...5........4....6.8..139.......4.....3.6.8.7..1....42..76.1...5.2......41...7"
+SOLUTION = "791324586385176429426985713963258174214793865857641932542837691179562348638419257"
+
+
+def test_find_conflicts():
+    digits = parse_puzzle(PUZZLE)
+    assert find_conflicts(digits) == []
+
+    # a second 1 in the first row and a second 5 in the box of r1c7
+    digits[0] = 1
+    digits[15] = 5
+    assert find_conflicts(digits) == [0, 2, 6, 15]
+
+
+def test_find_conflicts_16x16():
+    digits = [0] * 256
+    digits[0] = digits[16 * 15] = 16
+
+    assert find_conflicts(digits) == [0, 240]
+
+
+def test_check_solution():
+    puzzle = parse_puzzle(PUZZLE)
+    solution = parse_puzzle(SOLUTION)
+    assert check_solution(solution, puzzle) == []
+
+    solution[0], solution[1] = solution[1], solution[0]
+    assert check_solution(solution) == [0, 1, 27, 64]
+
+    solution = parse_puzzle(SOLUTION)
+    solution[80] = 0
+    assert check_solution(solution, puzzle) == [80]
+    with pytest.raises(ValueError):
+        check_solution(solution, puzzle[:16])
+
+
+def test_validate_puzzle():
+    assert validate_puzzle(PUZZLE) == parse_puzzle(PUZZLE)
+
+    with pytest.raises(ConflictError) as error:
+        validate_puzzle("11" + "." * 79)
+    assert error.value.cells == [0, 1]
+    assert str(error.value) == "Puzzle holds conflicting givens at r1c1, r1c2."
+    with pytest.raises(ValueError):
+        validate_puzzle("x" * 81)
+
+
+def test_cell_name():
+    assert cell_name(0) == "r1c1"
+    assert cell_name(80) == "r9c9"
+    assert cell_name(255, 16) == "r16c16"
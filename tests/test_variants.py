@@ -0,0 +1,168 @@
+import random
+import time
+
+import pytest
+
+from board import Board, format_digits, parse_puzzle
+from generator import random_solution
+from units import CLASSIC, geometry
+from validate import check_solution
+from variants import Cage, Variant, VariantGrid, _sum_masks, diagonal_units, window_units
+
+
+def all_grids(box_size):
+    # Every solution of the empty board, by plain enumeration
+    tables = geometry(box_size)
+    digits = [0] * tables.cells
+
+    def fill(index):
+        if index == tables.cells:
+            yield list(digits)
+            return
+        used = {digits[peer] for peer in tables.peers[index]}
+        for digit in range(1, tables.size + 1):
+            if digit not in used:
+                digits[index] = digit
+                yield from fill(index + 1)
+        digits[index] = 0
+
+    return list(fill(0))
+
+
+def follows(solution, variant):
+    return (all(len({solution[index] for index in unit}) == len(unit) for unit in variant.geometry.units)
+            and all(len({solution[index] for index in cage.cells}) == len(cage.cells)
+                    and sum(solution[index] for index in cage.cells) == cage.total for cage in variant.cages))
+
+
+def test_diagonal_and_window_units():
+    assert diagonal_units() == (tuple(range(0, 81, 10)), tuple(range(8, 73, 8)))
+    assert window_units()[0] == (10, 11, 12, 19, 20, 21, 28, 29, 30)
+    assert window_units()[3] == (50, 51, 52, 59, 60, 61, 68, 69, 70)
+    assert len(window_units()) == 4
+    assert window_units(2) == ((5, 6, 9, 10),)
+    assert all(len(unit) == 16 for unit in window_units(4))
+
+
+def test_sum_masks():
+    assert _sum_masks(9, 2, 3) == (0b11,)
+    assert _sum_masks(9, 3, 24) == (0b111000000,)
+    assert sorted(_sum_masks(9, 2, 10)) == sorted([0b100000001, 0b10000010, 0b1000100, 0b101000])
+    assert _sum_masks(9, 2, 18) == ()
+    assert _sum_masks(9, 0, 0) == (0,)
+
+
+def test_classic_variant_keeps_the_classic_tables():
+    variant = Variant()
+
+    assert variant.classic
+    assert variant.geometry is CLASSIC
+    assert Variant(units=diagonal_units()).geometry is not CLASSIC
+
+
+def test_cage_propagate():
+    variant = Variant(cages=[Cage((0, 1), 3), Cage((9, 10, 11), 24)])
+    grid = variant.grid([0] * 81)
+
+    assert isinstance(grid, VariantGrid)
+    assert grid.masks[0] == grid.masks[1] == 0b11
+    assert grid.masks[9] == grid.masks[10] == grid.masks[11] == 0b111000000
+
+
+def test_cage_propagate_after_guess():
+    variant = Variant(cages=[Cage((0, 1, 2), 12)])
+    grid = variant.grid([0] * 81)
+    mark = len(grid.trail)
+
+    assert grid.guess(0, 9)
+    assert {grid.masks[1], grid.masks[2]} == {0b11}
+    grid.undo(mark)
+    assert grid.masks[1] == grid.masks[2] == 0b111111111
+
+
+def test_cage_unsatisfiable():
+    assert Variant(cages=[Cage((0, 1), 2)]).grid([0] * 81) is None
+    assert Variant(cages=[Cage((0,), 4)]).solve(parse_puzzle("5" + "." * 80)) is None
+    with pytest.raises(ValueError):
+        Cage((), 0)
+
+
+def test_solve_diagonal_windoku():
+    variant = Variant(units=diagonal_units() + window_units())
+
+    solution = variant.solve([0] * 81)
+
+    assert not check_solution(solution)
+    assert follows(solution, variant)
+
+
+def test_solve_killer():
+    solution = random_solution(random.Random(1))
+    cages = [Cage((row * 9 + col, row * 9 + col + 1), solution[row * 9 + col] + solution[row * 9 + col + 1])
+             for row in range(9) for col in range(0, 8, 2)]
+    variant = Variant(cages=cages)
+
+    solved = variant.solve([0] * 81)
+
+    assert not check_solution(solved)
+    assert follows(solved, variant)
+
+
+@pytest.mark.parametrize("units", [(), diagonal_units(2), window_units(2)])
+def test_count_matches_enumeration(units):
+    grids = all_grids(2)
+    solution = [grid for grid in grids if follows(grid, Variant(2, units))][-1]
+    cages = [Cage((0, 4), solution[0] + solution[4]), Cage((2, 3, 7), solution[2] + solution[3] + solution[7]),
+             Cage((12, 13), solution[12] + solution[13])]
+    variant = Variant(2, units, cages)
+
+    expected = sum(follows(grid, variant) for grid in grids)
+
+    assert expected >= 1
+    assert variant.count_solutions([0] * 16, None) == expected
+
+
+def test_variant_wrong_size():
+    with pytest.raises(ValueError):
+        Variant(2).solve([0] * 81)
+    with pytest.raises(ValueError):
+        Board.from_digits([0] * 81, Variant(2))
+
+
+def test_board_with_variant():
+    variant = Variant(units=diagonal_units())
+    board = Board("1" + "." * 80, variant=variant)
+
+    board.find_candidates()
+    assert not board.cells[80].mask & 1  # on the diagonal of r1c1
+    assert board.cells[79].mask & 1
+    assert board.count_solutions() == 2
+
+    assert board.solve()
+    assert follows(board.to_digits(), variant)
+    assert board.count_solutions() == 1
+
+
+def test_board_with_variant_engines():
+    board = Board("." * 81, variant=Variant(units=diagonal_units()))
+
+    with pytest.raises(ValueError):
+        board.solve('dlx')
+    assert Board("." * 81, variant=Variant()).solve('dlx')
+
+
+def test_board_killer_puzzle():
+    solution = random_solution(random.Random(2))
+    cages = [Cage((index, index + 9), solution[index] + solution[index + 9])
+             for row in range(0, 8, 2) for index in range(row * 9, row * 9 + 9)]
+    variant = Variant(cages=cages)
+    puzzle = format_digits([digit if index >= 72 else 0 for index, digit in enumerate(solution)], '.')
+    board = Board(puzzle, variant=variant)
+
+    assert board.solve()
+    assert follows(board.to_digits(), variant)
+
+
+def test_variant_deadline():
+    with pytest.raises(TimeoutError):
+        Variant(units=diagonal_units()).solve([0] * 81, deadline=time.monotonic() - 1)
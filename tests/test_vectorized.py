@@ -0,0 +1,81 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from board import Board, parse_puzzle  # noqa: E402
+from validate import check_solution, find_conflicts  # noqa: E402
+from vectorized import BoardBatch, check_solutions_batch, find_conflicts_batch, solve_batch  # noqa: E402
+
+
+SINGLES_PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SINGLES_SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+SEARCH_PUZZLE = "..1...5........4....6.8..139.......4.....3.6.8.7..1....42..76.1...5.2......41...7"
+SEARCH_SOLUTION = "791324586385176429426985713963258174214793865857641932542837691179562348638419257"
+
+
+def test_from_puzzles():
+    batch = BoardBatch.from_puzzles([SINGLES_PUZZLE, SEARCH_PUZZLE.replace('.', '0')])
+
+    assert batch.digits.shape == (2, 9, 9)
+    assert batch.digits.dtype == np.uint8
+    assert batch.digits[0, 0, 0] == 5
+    assert batch.digits[1, 0, 0] == 0
+
+    with pytest.raises(ValueError):
+        BoardBatch.from_puzzles(["x" * 81])
+    with pytest.raises(ValueError):
+        BoardBatch.from_puzzles(["1" * 80])
+
+
+def test_find_candidates_matches_board():
+    batch = BoardBatch.from_puzzles([SINGLES_PUZZLE, SEARCH_PUZZLE])
+    batch.find_candidates()
+
+    assert batch.masks.dtype == np.uint16
+    for i, puzzle in enumerate([SINGLES_PUZZLE, SEARCH_PUZZLE]):
+        board = Board(puzzle)
+        board.find_candidates()
+        assert batch.masks[i].tolist() == [[cell.mask for cell in row] for row in board.board]
+
+
+def test_apply_mono_candidates():
+    batch = BoardBatch.from_puzzles([SINGLES_PUZZLE, "." * 81])
+    batch.find_candidates()
+
+    changed = batch.apply_mono_candidates()
+
+    assert changed.tolist() == [True, False]
+    assert (batch.digits[1] == 0).all()
+
+
+def test_propagate_solves_singles():
+    batch = BoardBatch.from_puzzles([SINGLES_PUZZLE, SEARCH_PUZZLE])
+
+    batch.propagate()
+
+    assert batch.solved().tolist() == [True, False]
+    assert "".join(map(str, batch.digits[0].ravel())) == SINGLES_SOLUTION
+
+
+def test_solve_batch_falls_back_to_scalar_engine():
+    puzzles = [SINGLES_PUZZLE, SEARCH_PUZZLE, "11" + "." * 79, "12345678." + "." * 8 + "9" + "." * 63]
+
+    assert solve_batch(puzzles) == [SINGLES_SOLUTION, SEARCH_SOLUTION, None, None]
+    assert solve_batch(puzzles, engine='dlx') == [SINGLES_SOLUTION, SEARCH_SOLUTION, None, None]
+
+
+def test_find_conflicts_batch_matches_scalar():
+    puzzles = [SINGLES_PUZZLE, "11" + "." * 79, "5" + SINGLES_PUZZLE[1:9] + "5" + SINGLES_PUZZLE[10:]]
+
+    assert find_conflicts_batch(puzzles) == [find_conflicts(parse_puzzle(puzzle)) for puzzle in puzzles]
+    assert find_conflicts_batch(puzzles)[1] == [0, 1]
+
+
+def test_check_solutions_batch():
+    broken = SINGLES_SOLUTION[1] + SINGLES_SOLUTION[0] + SINGLES_SOLUTION[2:]
+    results = check_solutions_batch([SINGLES_SOLUTION, broken, SEARCH_PUZZLE], [SINGLES_PUZZLE] * 3)
+
+    assert results[0] == []
+    assert results[1]
+    assert results == [check_solution(parse_puzzle(solution), parse_puzzle(SINGLES_PUZZLE))
+                       for solution in [SINGLES_SOLUTION, broken, SEARCH_PUZZLE]]
@@ -0,0 +1,199 @@
+"""
+units.py - Sudoku Index Tables Module
+
+This module precomputes the index tables shared by the board, the solving engines and the logical techniques,
+so no caller has to redo `row // 3 * 3` style arithmetic in a loop. A board with boxes of `n` x `n` cells has
+`n * n` rows, columns, boxes and numbers; its cells are numbered in row-major order and its units are numbered
+rows first, then columns, then boxes. The tables for each box size are built once, on first use, and kept in a
+`Geometry`; the classic 9x9 tables are built at import and also exported as module constants.
+
+Classes:
+    - Geometry: The tables of one board size.
+
+Functions:
+    - geometry: Returns the tables for a box size.
+    - geometry_for_cells: Returns the tables for the board size with a given number of cells.
+    - with_units: Returns the tables of a board with extra units, such as diagonals, and extra groups of
+      cells that must differ, such as killer cages.
+
+Constants:
+    - BOX_SIZES: The supported box sizes, from 4x4 boards (2) to 25x25 boards (5).
+    - CLASSIC: The `Geometry` of the 9x9 board.
+    - ROW_OF, COL_OF, BOX_OF: The row, column and box (0-8) of each cell of the 9x9 board.
+    - UNITS: The 9 cell indices of each of the 27 units.
+    - ROW_UNITS, COL_UNITS, BOX_UNITS: The slices of `UNITS` holding the rows, columns and boxes.
+    - CELL_UNITS: The row, column and box unit indices (into `UNITS`) of each cell.
+    - PEERS: The 20 cells sharing a row, column or box with each cell.
+
+Example:
+    ```python
+    for peer in PEERS[row * 9 + col]:
+        ...
+
+    tables = geometry(4)
+    for peer in tables.peers[row * 16 + col]:
+        ...
+    ```
+
+Dependencies:
+    - None
+"""
+
+
+from collections import namedtuple
+
+
+BOX_SIZES = (2, 3, 4, 5)
+
+Geometry = namedtuple('Geometry', ['box_size', 'size', 'cells', 'all_candidates', 'row_of', 'col_of', 'box_of',
+                                   'units', 'row_units', 'col_units', 'box_units', 'cell_units', 'peers'])
+Geometry.__doc__ = """
+Represents the index tables of one board size.
+
+Attributes:
+    box_size (int): The width and height of a box, `n`.
+    size (int): The number of rows, columns, boxes and numbers, `n * n`.
+    cells (int): The number of cells, `size * size`.
+    all_candidates (int): The mask with a bit set for every number.
+    row_of, col_of, box_of (tuple of int): The row, column and box of each cell.
+    units (tuple of tuple): The cell indices of each unit: rows, then columns, then boxes, then the extra
+                            units of tables built by `with_units`.
+    row_units, col_units, box_units (tuple of tuple): The slices of `units` holding the rows, columns and boxes.
+    cell_units (tuple of tuple): The row, column and box unit indices (into `units`) of each cell, followed by
+                                 those of its extra units.
+    peers (tuple of tuple): The sorted cells sharing a unit, or a group from `with_units`, with each cell.
+"""
+
+_GEOMETRIES = {}
+
+
+def _build_geometry(box_size: int):
+    """
+    Builds the tables of the board with `box_size` x `box_size` boxes.
+
+    Args:
+        box_size (int): The width and height of a box.
+
+    Returns:
+        Geometry: The tables.
+    """
+    size = box_size * box_size
+    cells = size * size
+    row_of = tuple(index // size for index in range(cells))
+    col_of = tuple(index % size for index in range(cells))
+    box_of = tuple(row_of[index] // box_size * box_size + col_of[index] // box_size for index in range(cells))
+
+    units = (
+        tuple(tuple(row * size + col for col in range(size)) for row in range(size))
+        + tuple(tuple(row * size + col for row in range(size)) for col in range(size))
+        + tuple(tuple(index for index in range(cells) if box_of[index] == box) for box in range(size))
+    )
+    cell_units = tuple((row_of[index], size + col_of[index], 2 * size + box_of[index]) for index in range(cells))
+    peers = tuple(
+        tuple(sorted(set().union(*(units[unit] for unit in cell_units[index])) - {index}))
+        for index in range(cells)
+    )
+
+    return Geometry(box_size, size, cells, (1 << size) - 1, row_of, col_of, box_of, units, units[0:size],
+                    units[size:2 * size], units[2 * size:3 * size], cell_units, peers)
+
+
+def geometry(box_size: int = 3):
+    """
+    Returns the tables of the board with `box_size` x `box_size` boxes, building them on first use.
+
+    Args:
+        box_size (int): One of `BOX_SIZES`.
+
+    Returns:
+        Geometry: The tables.
+
+    Raises:
+        ValueError: If the box size is not supported.
+    """
+    tables = _GEOMETRIES.get(box_size)
+    if tables is None:
+        if box_size not in BOX_SIZES:
+            raise ValueError(f'Unsupported box size {box_size!r}.')
+        tables = _GEOMETRIES[box_size] = _build_geometry(box_size)
+    return tables
+
+
+def geometry_for_cells(cells: int):
+    """
+    Returns the tables of the board with `cells` cells.
+
+    Args:
+        cells (int): The number of cells, such as 81 or 256.
+
+    Returns:
+        Geometry: The tables.
+
+    Raises:
+        ValueError: If no supported board has that many cells.
+    """
+    for box_size in BOX_SIZES:
+        if box_size ** 4 == cells:
+            return geometry(box_size)
+
+    lengths = [str(box_size ** 4) for box_size in BOX_SIZES]
+    raise ValueError(f'init_nums isn\'t {", ".join(lengths[:-1])} or {lengths[-1]} characters.')
+
+
+def with_units(tables, units=(), cliques=()):
+    """
+    Returns the tables of a board with extra constraints on top of its rows, columns and boxes.
+
+    Args:
+        tables (Geometry): The tables of the board size.
+        units (iterable of sequence of int): Extra units of `tables.size` cells each that hold every number
+                                             once, such as diagonals. They are appended to `units`.
+        cliques (iterable of sequence of int): Groups of cells whose numbers must all differ but need not
+                                               cover every number, such as killer cages. They only add peers.
+
+    Returns:
+        Geometry: The extended tables. They are not cached, so keep the result instead of rebuilding it.
+
+    Raises:
+        ValueError: If a unit does not have `tables.size` distinct cells, or a unit or clique holds a cell
+                    that is not on the board.
+    """
+    units = tuple(tuple(unit) for unit in units)
+    cliques = tuple(tuple(clique) for clique in cliques)
+    for group in units + cliques:
+        if len(set(group)) != len(group) or not all(0 <= index < tables.cells for index in group):
+            raise ValueError(f'Constraint cells {group!r} are not distinct cells of the board.')
+    for unit in units:
+        if len(unit) != tables.size:
+            raise ValueError(f'A unit needs {tables.size} cells, not {len(unit)}.')
+
+    all_units = tables.units + units
+    cell_units = [list(cell) for cell in tables.cell_units]
+    for number, unit in enumerate(units, len(tables.units)):
+        for index in unit:
+            cell_units[index].append(number)
+
+    peers = [set(cell) for cell in tables.peers]
+    for group in units + cliques:
+        for index in group:
+            peers[index].update(group)
+            peers[index].discard(index)
+
+    return tables._replace(units=all_units, cell_units=tuple(tuple(cell) for cell in cell_units),
+                           peers=tuple(tuple(sorted(cell)) for cell in peers))
+
+
+CLASSIC = geometry(3)
+
+ROW_OF = CLASSIC.row_of
+COL_OF = CLASSIC.col_of
+BOX_OF = CLASSIC.box_of
+
+UNITS = CLASSIC.units
+ROW_UNITS = CLASSIC.row_units
+COL_UNITS = CLASSIC.col_units
+BOX_UNITS = CLASSIC.box_units
+
+CELL_UNITS = CLASSIC.cell_units
+
+PEERS = CLASSIC.peers
@@ -0,0 +1,167 @@
+"""
+validate.py - Puzzle and Solution Validation Module
+
+This module checks puzzles and solutions without solving them. A single pass over the cells ORs each number
+into the "used digits" mask of its row, column and box, the same masks `Board` keeps, and records in a second
+set of masks every number that was already there. A number found in a duplicate mask of one of its cell's
+units is a conflict; only when there is one does a second pass list the offending cells. Checking a 9x9 grid
+costs about as much as building its masks, far less than any solve, so every puzzle can be checked before it
+is handed to a worker and every solution before it is sent back.
+
+Puzzle strings are parsed by `board.parse_puzzle`, which already rejects wrong lengths and characters that
+are neither numbers nor blanks; this module adds the checks that need the whole grid. `vectorized.BoardBatch`
+has the same checks for many 9x9 grids at once.
+
+Classes:
+    - ConflictError: Raised for a puzzle whose givens conflict, listing the offending cells.
+
+Functions:
+    - find_conflicts: Lists the cells whose number also appears elsewhere in one of their units.
+    - check_solution: Lists the cells that keep a grid from being a solution of a puzzle.
+    - validate_puzzle: Parses a puzzle string and raises if its givens conflict.
+    - cell_name: Names a cell as 'r1c1' to 'r25c25'.
+
+Example:
+    ```python
+    digits = validate_puzzle(puzzle)
+    solution = solve_backtracking(digits)
+    assert not check_solution(solution, digits)
+    ```
+
+Dependencies:
+    - board: Provides puzzle parsing.
+    - units: Provides the row, column and box of each cell for every board size.
+"""
+
+
+from board import parse_puzzle
+from units import geometry_for_cells
+
+
+class ConflictError(ValueError):
+    """
+    Raised when the givens of a puzzle conflict.
+
+    Attributes:
+        cells (list of int): Flat indices of the cells whose number also appears elsewhere in one of
+                             their units.
+    """
+
+    def __init__(self, cells, size: int = 9):
+        """
+        Initializes the error with the offending cells.
+
+        Args:
+            cells (list of int): Flat indices of the offending cells.
+            size (int): The number of rows of the board, for naming the cells.
+        """
+        super().__init__(f'Puzzle holds conflicting givens at {", ".join(cell_name(cell, size) for cell in cells)}.')
+        self.cells = cells
+
+
+def cell_name(index: int, size: int = 9):
+    """
+    Names a cell by its row and column, counting from 1.
+
+    Args:
+        index (int): Flat index of the cell.
+        size (int): The number of rows of the board.
+
+    Returns:
+        str: The name, such as 'r1c3'.
+    """
+    return f'r{index // size + 1}c{index % size + 1}'
+
+
+def find_conflicts(digits):
+    """
+    Finds the cells whose number also appears elsewhere in their row, column or box.
+
+    Args:
+        digits (sequence of int): The numbers in row-major order, with 0 for empty cells. Their count gives
+                                  the board size.
+
+    Returns:
+        list of int: Flat indices of the offending cells, in order; empty if nothing conflicts.
+
+    Raises:
+        ValueError: If no supported board has that many cells.
+    """
+    tables = geometry_for_cells(len(digits))
+    row_of, col_of, box_of = tables.row_of, tables.col_of, tables.box_of
+    rows = [0] * tables.size
+    cols = [0] * tables.size
+    boxes = [0] * tables.size
+    row_dups = [0] * tables.size
+    col_dups = [0] * tables.size
+    box_dups = [0] * tables.size
+    clash = 0
+    for index, digit in enumerate(digits):
+        if digit:
+            bit = 1 << (digit - 1)
+            row, col, box = row_of[index], col_of[index], box_of[index]
+            if (rows[row] | cols[col] | boxes[box]) & bit:
+                clash = 1
+                row_dups[row] |= rows[row] & bit
+                col_dups[col] |= cols[col] & bit
+                box_dups[box] |= boxes[box] & bit
+            rows[row] |= bit
+            cols[col] |= bit
+            boxes[box] |= bit
+
+    if not clash:
+        return []
+
+    return [
+        index for index, digit in enumerate(digits)
+        if digit and (row_dups[row_of[index]] | col_dups[col_of[index]] | box_dups[box_of[index]])
+        >> (digit - 1) & 1
+    ]
+
+
+def check_solution(solution, puzzle=None):
+    """
+    Finds the cells that keep a grid from being a complete, valid solution.
+
+    Args:
+        solution (sequence of int): The numbers of the grid in row-major order.
+        puzzle (sequence of int or None): The numbers of the puzzle it should solve, with 0 for empty cells,
+                                          or None to check the grid on its own.
+
+    Returns:
+        list of int: Flat indices of the cells that are empty, conflict with another cell or differ from a
+                     given of the puzzle, in order; empty if the grid is a solution.
+
+    Raises:
+        ValueError: If no supported board has that many cells, or the puzzle has a different size.
+    """
+    if puzzle is not None and len(puzzle) != len(solution):
+        raise ValueError('The solution and the puzzle have different sizes.')
+
+    offending = set(find_conflicts(solution))
+    offending.update(index for index, digit in enumerate(solution) if not digit)
+    if puzzle is not None:
+        offending.update(index for index, given in enumerate(puzzle) if given and given != solution[index])
+    return sorted(offending)
+
+
+def validate_puzzle(puzzle: str, box_size=None):
+    """
+    Parses a puzzle string and checks that its givens do not conflict.
+
+    Args:
+        puzzle (str): The puzzle string, in the format read by `board.parse_puzzle`.
+        box_size (int or None): The box size of the board, or None to tell it from the length of the string.
+
+    Returns:
+        list of int: The numbers of the puzzle in row-major order, with 0 for empty cells.
+
+    Raises:
+        ConflictError: If two givens share a unit and a number.
+        ValueError: If the puzzle cannot be parsed.
+    """
+    digits = parse_puzzle(puzzle, box_size)
+    conflicts = find_conflicts(digits)
+    if conflicts:
+        raise ConflictError(conflicts, geometry_for_cells(len(digits)).size)
+    return digits
@@ -0,0 +1,427 @@
+"""
+variants.py - Variant Sudoku Constraints Module
+
+This module adds the rules of variant puzzles on top of the classic rows, columns and boxes, as a layer of
+constraints the existing search runs unchanged. There are two kinds of constraint:
+
+    - Extra units: groups of one cell per number that hold every number once, such as the diagonals of
+      diagonal Sudoku or the windows of windoku. `units.with_units` appends them to the units and peers of the
+      board's tables, so placing a number removes it from the unit like from a row, and hidden singles and
+      the logical techniques cover them too, with no code of their own.
+    - Killer cages: cells whose numbers differ and add up to a total. The cells become peers the same way; the
+      sum is enforced by the cage's own propagator, which keeps only the candidates that appear in some set
+      of distinct numbers making up what is left of the total.
+
+A `Variant` holds the constraints of a puzzle and the tables they give. Without cages it solves on a plain
+`solver.Grid` over those tables, and a variant without any extra constraint uses the classic tables
+themselves, so it takes exactly the classic fast path. With cages it solves on a `VariantGrid`, which after
+every guess runs the propagator of each cage with a cell the guess changed, and of each cage those changes
+touch in turn, recording every removal on the trail so backtracking undoes them like any other.
+
+Classes:
+    - Cage: A killer cage, with its propagator.
+    - VariantGrid: A `solver.Grid` that runs the propagators of its cages after every guess.
+    - Variant: The extra constraints of a variant, with its tables, solve and count.
+
+Functions:
+    - diagonal_units: The two main diagonals of a board, as extra units.
+    - window_units: The windows of windoku, as extra units.
+
+Example:
+    ```python
+    variant = Variant(units=diagonal_units(), cages=[Cage((0, 1), 3), Cage((9, 10, 11), 24)])
+    board = Board(puzzle, variant=variant)
+    board.solve()
+    ```
+
+Dependencies:
+    - solver: Provides `Grid` and the search.
+    - units: Provides the tables of each board size and `with_units`.
+"""
+
+
+from solver import Grid, count_solutions, search
+from units import CLASSIC, geometry as geometry_for_box, geometry_for_cells, with_units
+
+
+_SUMS = {}
+
+
+def _sum_masks(top: int, count: int, total: int):
+    """
+    Lists the sets of `count` distinct numbers from 1 to `top` that add up to `total`, building each list once.
+
+    Args:
+        top (int): The largest number allowed.
+        count (int): The number of numbers in each set.
+        total (int): The sum of each set.
+
+    Returns:
+        tuple of int: The sets, as candidate masks.
+    """
+    key = (top, count, total)
+    masks = _SUMS.get(key)
+    if masks is None:
+        if count == 0:
+            masks = (0,) if total == 0 else ()
+        elif not count * (count + 1) // 2 <= total <= count * (2 * top - count + 1) // 2:
+            masks = ()
+        else:
+            bit = 1 << (top - 1)
+            masks = (tuple(mask | bit for mask in _sum_masks(top - 1, count - 1, total - top))
+                     + _sum_masks(top - 1, count, total))
+        _SUMS[key] = masks
+    return masks
+
+
+def diagonal_units(box_size: int = 3):
+    """
+    Returns the two main diagonals of a board, for diagonal Sudoku.
+
+    Args:
+        box_size (int): The box size of the board.
+
+    Returns:
+        tuple of tuple of int: The cell indices of the diagonal from the top left, then from the top right.
+    """
+    size = box_size * box_size
+    return (tuple(row * size + row for row in range(size)),
+            tuple(row * size + size - 1 - row for row in range(size)))
+
+
+def window_units(box_size: int = 3):
+    """
+    Returns the windows of windoku: the box-sized squares one cell in from the boxes of the top left, spaced
+    a cell apart, four of them on a 9x9 board.
+
+    Args:
+        box_size (int): The box size of the board.
+
+    Returns:
+        tuple of tuple of int: The cell indices of each window, left to right, top to bottom.
+    """
+    size = box_size * box_size
+    corners = range(1, size - box_size, box_size + 1)
+    return tuple(
+        tuple((top + row) * size + left + col for row in range(box_size) for col in range(box_size))
+        for top in corners for left in corners
+    )
+
+
+class Cage:
+    """
+    Represents a killer cage: cells whose numbers all differ and add up to a total.
+
+    Attributes:
+        cells (tuple of int): Flat indices of the cells.
+        total (int): The sum of their numbers.
+    """
+
+    __slots__ = ('cells', 'total')
+
+    def __init__(self, cells, total: int):
+        """
+        Initializes a cage.
+
+        Args:
+            cells (iterable of int): Flat indices of the cells.
+            total (int): The sum of their numbers.
+
+        Raises:
+            ValueError: If the cage has no cells.
+        """
+        self.cells = tuple(cells)
+        self.total = total
+        if not self.cells:
+            raise ValueError('A cage needs at least one cell.')
+
+    def __repr__(self):
+        return f'Cage({self.cells!r}, {self.total!r})'
+
+    def propagate(self, grid):
+        """
+        Removes the candidates of the cage's empty cells that belong to no set of distinct numbers, drawn
+        from the candidates left in the cage, that makes up the rest of the total.
+
+        Args:
+            grid (VariantGrid): The grid to work on; removals go through `grid.restrict`.
+
+        Returns:
+            bool: False if no set of numbers can complete the cage or a removal leads to a contradiction,
+                  True otherwise.
+        """
+        digits = grid.digits
+        masks = grid.masks
+        remaining = self.total
+        empty = []
+        union = 0
+        for index in self.cells:
+            if digits[index]:
+                remaining -= digits[index]
+            else:
+                empty.append(index)
+                union |= masks[index]
+        if not empty:
+            return remaining == 0
+
+        allowed = 0
+        for mask in _sum_masks(grid.geometry.size, len(empty), remaining):
+            if not mask & ~union:
+                allowed |= mask
+        if not allowed:
+            return False
+
+        for index in empty:
+            if masks[index] & ~allowed and not grid.restrict(index, allowed):
+                return False
+        return True
+
+
+def _watch(cages, cells: int):
+    """
+    Maps each cell to the cages it belongs to.
+
+    Args:
+        cages (tuple of Cage): The cages.
+        cells (int): The number of cells of the board.
+
+    Returns:
+        tuple of tuple of int: The indices into `cages` of the cages of each cell.
+    """
+    watch = [[] for _ in range(cells)]
+    for number, cage in enumerate(cages):
+        for index in cage.cells:
+            watch[index].append(number)
+    return tuple(tuple(numbers) for numbers in watch)
+
+
+class VariantGrid(Grid):
+    """
+    Represents the search state of a board with killer cages. Its tables must already hold the cages'
+    cells as peers (see `units.with_units`), so `assign` keeps their numbers distinct.
+
+    Attributes:
+        cages (tuple of Cage): The cages.
+        watch (tuple of tuple of int): The indices into `cages` of the cages of each cell.
+    """
+
+    __slots__ = ('cages', 'watch')
+
+    def __init__(self, digits=None, masks=None, geometry=CLASSIC, cages=(), watch=None):
+        """
+        Initializes a grid like `Grid`, with cages.
+
+        Args:
+            digits (array of int or None): `array('B')` of numbers to use without copying.
+            masks (array of int or None): Array of candidate masks to use without copying.
+            geometry (Geometry): The tables of the board, with the cages' cells as peers.
+            cages (tuple of Cage): The cages.
+            watch (tuple of tuple of int or None): The cages of each cell, or None to build it.
+        """
+        super().__init__(digits, masks, geometry)
+        self.cages = tuple(cages)
+        self.watch = _watch(self.cages, geometry.cells) if watch is None else watch
+
+    @classmethod
+    def from_digits(cls, digits, geometry=None, cages=()):
+        """
+        Builds a grid from the numbers of a puzzle and runs the propagator of every cage.
+
+        Args:
+            digits (list of int): The numbers in row-major order, with 0 for empty cells.
+            geometry (Geometry or None): The tables of the board, with the cages' cells as peers, or None
+                                         for the classic tables of the board size.
+            cages (iterable of Cage): The cages.
+
+        Returns:
+            VariantGrid or None: The grid, or None if the givens conflict or a cage cannot be completed.
+
+        Raises:
+            ValueError: If no supported board has that many cells.
+        """
+        grid = cls(geometry=geometry or geometry_for_cells(len(digits)), cages=cages)
+        for index, digit in enumerate(digits):
+            if digit and not grid.assign(index, digit):
+                return None
+        if not grid.propagate_cages(0, range(len(grid.cages))):
+            return None
+
+        grid.trail.clear()
+        return grid
+
+    def copy(self):
+        """
+        Copies the grid's numbers and candidates, without the trail.
+
+        Returns:
+            VariantGrid: The copy, sharing the cages.
+        """
+        return VariantGrid(self.digits[:], self.masks[:], self.geometry, self.cages, self.watch)
+
+    def restrict(self, index: int, mask: int):
+        """
+        Keeps only the candidates of an empty cell that are in `mask`, recording the change on the trail,
+        and places the cell if a single candidate is left.
+
+        Args:
+            index (int): Flat index of the cell.
+            mask (int): The candidates to keep.
+
+        Returns:
+            bool: False if no candidate is left or the placement leads to a contradiction, True otherwise.
+        """
+        old = self.masks[index]
+        mask &= old
+        if mask == old:
+            return True
+        if not mask:
+            return False
+
+        self.trail.append(index)
+        self.trail.append(old)
+        self.masks[index] = mask
+        if not mask & (mask - 1):
+            return self.assign(index, mask.bit_length())
+        return True
+
+    def guess(self, index: int, digit: int):
+        """
+        Places a number chosen by the search like `Grid.guess`, then propagates the cages it touched.
+
+        Args:
+            index (int): Flat index of the cell.
+            digit (int): The number to place.
+
+        Returns:
+            bool: False if the placement leads to a contradiction, True otherwise.
+        """
+        mark = len(self.trail)
+        return super().guess(index, digit) and self.propagate_cages(mark)
+
+    def propagate_cages(self, mark: int, pending=()):
+        """
+        Runs the propagators of the cages with a cell changed on the trail since `mark`, and of `pending`,
+        then of the cages their own changes touch, until no cage changes anything.
+
+        Args:
+            mark (int): The trail length before the changes to propagate.
+            pending (iterable of int): Indices into `cages` of cages to run in any case.
+
+        Returns:
+            bool: False if a cage cannot be completed, True otherwise.
+        """
+        trail = self.trail
+        watch = self.watch
+        pending = set(pending)
+        seen = mark
+        while True:
+            for entry in range(seen, len(trail), 2):
+                index = trail[entry]
+                pending.update(watch[~index if index < 0 else index])
+            seen = len(trail)
+            if not pending:
+                return True
+
+            for cage in sorted(pending):
+                if not self.cages[cage].propagate(self):
+                    return False
+            pending.clear()
+
+
+class Variant:
+    """
+    Represents the rules of a variant: the classic rows, columns and boxes plus extra units and killer cages.
+
+    Attributes:
+        units (tuple of tuple of int): The cell indices of each extra unit.
+        cages (tuple of Cage): The killer cages.
+        geometry (Geometry): The tables of the board with the extra units and the cages' cells as peers; the
+                             classic tables themselves when there are neither.
+    """
+
+    def __init__(self, box_size: int = 3, units=(), cages=()):
+        """
+        Initializes the rules of a variant.
+
+        Args:
+            box_size (int): The box size of the board.
+            units (iterable of sequence of int): Extra units of one cell per number, such as those of
+                                                 `diagonal_units()` and `window_units()`.
+            cages (iterable of Cage): Killer cages.
+
+        Raises:
+            ValueError: If the box size is not supported, a unit does not have one cell per number, or a
+                        unit or cage holds a cell twice or a cell that is not on the board.
+        """
+        tables = geometry_for_box(box_size)
+        self.units = tuple(tuple(unit) for unit in units)
+        self.cages = tuple(cages)
+        self.geometry = tables if self.classic else with_units(tables, self.units,
+                                                                 (cage.cells for cage in self.cages))
+
+    @property
+    def classic(self):
+        """
+        bool: Whether the variant adds nothing to the classic rules.
+        """
+        return not self.units and not self.cages
+
+    def grid(self, digits):
+        """
+        Builds the search grid of a puzzle under the variant's rules.
+
+        Args:
+            digits (list of int): The numbers in row-major order, with 0 for empty cells.
+
+        Returns:
+            Grid or None: A `VariantGrid` if the variant has cages, a `Grid` otherwise, or None if the
+                          givens break a rule.
+
+        Raises:
+            ValueError: If the puzzle is not the size of the variant's board.
+        """
+        if len(digits) != self.geometry.cells:
+            raise ValueError(f'The variant is for {self.geometry.cells} cells, not {len(digits)}.')
+        if self.cages:
+            return VariantGrid.from_digits(digits, self.geometry, self.cages)
+        return Grid.from_digits(digits, self.geometry)
+
+    def solve(self, digits, stats=None, deadline=None):
+        """
+        Solves a puzzle under the variant's rules; it takes and returns the same values as the engines in
+        `solver.ENGINES`.
+
+        Args:
+            digits (list of int): The numbers of the puzzle in row-major order, with 0 for empty cells.
+            stats (SolveStats or None): If given, the search adds its counters to it.
+            deadline (float or None): The `time.monotonic()` value at which to give up, or None to search
+                                      without a time limit.
+
+        Returns:
+            list of int or None: The numbers of the solution, or None if the puzzle has no solution.
+
+        Raises:
+            ValueError: If the puzzle is not the size of the variant's board.
+            TimeoutError: If the deadline passes before the search ends.
+        """
+        grid = self.grid(digits)
+        if grid is None or not search(grid, stats, deadline=deadline):
+            return None
+        return grid.digits.tolist()
+
+    def count_solutions(self, digits, limit=2):
+        """
+        Counts the solutions of a puzzle under the variant's rules, stopping once `limit` are found.
+
+        Args:
+            digits (list of int): The numbers of the puzzle in row-major order, with 0 for empty cells.
+            limit (int or None): The count at which to stop, or None to count every solution.
+
+        Returns:
+            int: The number of solutions found, at most `limit`.
+
+        Raises:
+            ValueError: If the puzzle is not the size of the variant's board.
+        """
+        grid = self.grid(digits)
+        return 0 if grid is None else count_solutions(grid, limit)
@@ -0,0 +1,321 @@
+"""
+vectorized.py - NumPy Batch Candidate Module
+
+This module computes candidates and naked singles for thousands of boards at once with NumPy. A `BoardBatch`
+holds N boards as an (N, 9, 9) uint8 array of numbers and an (N, 9, 9) uint16 array of candidate masks, using
+the same bit layout as `Cell.mask`. Row, column and box "used digits" masks are found with OR reductions over
+the whole batch, so `find_candidates` and `apply_mono_candidates` do the work of their `Board` counterparts
+without any per-cell Python code.
+
+Most easy and medium puzzles are solved by naked singles alone. `BoardBatch.solve` repeats the singles step
+until no board changes and hands the remaining boards to one of the scalar engines in the `solver` module.
+Conflicting givens and broken solutions are found the same way, by counting each number per unit across the
+whole batch, with the same results as the scalar checks in the `validate` module.
+
+NumPy is only needed by this module; the rest of the solver runs without it.
+
+Classes:
+    - BoardBatch: A batch of boards with vectorized candidate search, naked singles, conflict checks and
+      solving.
+
+Functions:
+    - solve_batch: Solves a list of puzzle strings with a `BoardBatch`.
+    - find_conflicts_batch: Lists the conflicting givens of each of a list of puzzle strings.
+    - check_solutions_batch: Lists the cells that keep each of a list of grids from being a solution.
+
+Example:
+    ```python
+    solutions = solve_batch(puzzles)
+    ```
+
+Dependencies:
+    - numpy: Array storage and the vectorized reductions.
+    - board: Provides the blank characters and the conversion of numbers back to strings.
+    - cell: Provides the candidate mask constants.
+    - solver: Provides the engines used for boards that singles do not finish.
+    - units: Provides the units of each cell, for counting numbers per unit.
+"""
+
+
+import numpy as np
+
+from board import BLANKS, format_digits
+from cell import ALL_CANDIDATES, MASK_DIGITS
+from solver import get_engine
+from units import CELL_UNITS, UNITS
+
+
+_CHAR_DIGITS = np.full(256, 255, dtype=np.uint8)
+for _digit in range(1, 10):
+    _CHAR_DIGITS[ord(str(_digit))] = _digit
+for _blank in BLANKS:
+    _CHAR_DIGITS[ord(_blank)] = 0
+
+# Count bins of the numbers 0-9 in each of the 27 units of a board, and the first bin of each cell's row,
+# column and box units
+_UNIT_BINS = len(UNITS) * 10
+_CELL_UNIT_BINS = np.array(CELL_UNITS, dtype=np.intp).T * 10
+
+_DIGIT_BITS = np.array([0] + [1 << (digit - 1) for digit in range(1, 10)], dtype=np.uint16)
+
+_SINGLE_DIGITS = np.array(
+    [digits[0] if len(digits) == 1 else 0 for digits in MASK_DIGITS], dtype=np.uint8
+)
+
+
+class BoardBatch:
+    """
+    Represents N 9x9 boards stored as NumPy arrays.
+
+    Attributes:
+        digits (numpy.ndarray): (N, 9, 9) uint8 array of numbers, with 0 for empty cells.
+        masks (numpy.ndarray): (N, 9, 9) uint16 array of candidate masks; 0 for filled cells.
+    """
+
+    def __init__(self, digits):
+        """
+        Initializes the batch from an array of numbers.
+
+        Args:
+            digits (numpy.ndarray): Array of shape (N, 9, 9) or (N, 81) with numbers 0-9.
+        """
+        self.digits = np.ascontiguousarray(digits, dtype=np.uint8).reshape(-1, 9, 9)
+        self.masks = np.zeros(self.digits.shape, dtype=np.uint16)
+
+    @classmethod
+    def from_puzzles(cls, puzzles):
+        """
+        Builds a batch from puzzle strings.
+
+        Args:
+            puzzles (list of str): 81-character puzzle strings, with ' ', '.' or '0' for empty cells.
+
+        Returns:
+            BoardBatch: The batch, with boards in the order of `puzzles`.
+
+        Raises:
+            ValueError: If a puzzle is not 81 characters or holds a character that is neither a number
+                        nor a blank.
+        """
+        if any(len(puzzle) != 81 for puzzle in puzzles):
+            raise ValueError('init_nums isn\'t 81 characters.')
+
+        try:
+            raw = np.frombuffer(''.join(puzzles).encode('ascii'), dtype=np.uint8)
+        except UnicodeEncodeError as error:
+            raise ValueError('Puzzle holds a character that is not a number or blank.') from error
+
+        digits = _CHAR_DIGITS[raw]
+        if (digits == 255).any():
+            raise ValueError('Puzzle holds a character that is not a number or blank.')
+        return cls(digits.reshape(-1, 81))
+
+    def __len__(self):
+        """
+        Returns the number of boards in the batch.
+        """
+        return len(self.digits)
+
+    def unit_masks(self, digits=None):
+        """
+        Computes the used-number masks of every row, column and box.
+
+        Args:
+            digits (numpy.ndarray or None): The (M, 9, 9) numbers to use, or None for the whole batch.
+
+        Returns:
+            tuple of numpy.ndarray: The (M, 9) row masks, (M, 9) column masks and (M, 3, 3) box masks.
+        """
+        if digits is None:
+            digits = self.digits
+        bits = _DIGIT_BITS[digits]
+        row_masks = np.bitwise_or.reduce(bits, axis=2)
+        col_masks = np.bitwise_or.reduce(bits, axis=1)
+        box_masks = np.bitwise_or.reduce(bits.reshape(-1, 3, 3, 3, 3), axis=(2, 4))
+        return row_masks, col_masks, box_masks
+
+    def find_candidates(self, index=None):
+        """
+        Finds the candidates of every empty cell from the numbers in its row, column and box.
+
+        Args:
+            index (numpy.ndarray or None): Indices of the boards to update, or None for every board.
+        """
+        digits = self.digits if index is None else self.digits[index]
+        row_masks, col_masks, box_masks = self.unit_masks(digits)
+        used = (row_masks[:, :, None]
+                | col_masks[:, None, :]
+                | box_masks.repeat(3, axis=1).repeat(3, axis=2))
+        masks = np.where(digits == 0, ~used & ALL_CANDIDATES, 0).astype(np.uint16)
+        if index is None:
+            self.masks = masks
+        else:
+            self.masks[index] = masks
+
+    def apply_mono_candidates(self, index=None):
+        """
+        Sets the number of every empty cell that has exactly one candidate.
+
+        Args:
+            index (numpy.ndarray or None): Indices of the boards to update, or None for every board.
+
+        Returns:
+            numpy.ndarray: Boolean array telling which of the updated boards changed.
+        """
+        masks = self.masks if index is None else self.masks[index]
+        singles = _SINGLE_DIGITS[masks]
+        changed = singles.reshape(len(singles), -1).any(axis=1)
+        digits = self.digits if index is None else self.digits[index]
+        digits = np.where(singles > 0, singles, digits)
+        if index is None:
+            self.digits = digits
+        else:
+            self.digits[index] = digits
+        return changed
+
+    def propagate(self):
+        """
+        Repeats `find_candidates` and `apply_mono_candidates` until no board changes, only
+        revisiting boards that changed in the previous round.
+        """
+        active = np.arange(len(self))
+        while len(active):
+            self.find_candidates(active)
+            changed = self.apply_mono_candidates(active)
+            active = active[changed]
+        self.find_candidates()
+
+    def solved(self):
+        """
+        Finds the boards that are complete and valid.
+
+        Returns:
+            numpy.ndarray: Boolean array with one entry per board.
+        """
+        row_masks, col_masks, box_masks = self.unit_masks()
+        return ((row_masks == ALL_CANDIDATES).all(axis=1)
+                & (col_masks == ALL_CANDIDATES).all(axis=1)
+                & (box_masks == ALL_CANDIDATES).all(axis=(1, 2)))
+
+    def conflicts(self):
+        """
+        Finds the cells whose number also appears elsewhere in their row, column or box, the batch
+        counterpart of `validate.find_conflicts`. Each (board, unit, number) triple gets its own bin, so
+        one `bincount` per kind of unit counts every number of every unit of the batch.
+
+        Returns:
+            numpy.ndarray: (N, 9, 9) boolean array, True for the offending cells.
+        """
+        digits = self.digits.reshape(len(self), -1).astype(np.intp)
+        bins = np.arange(len(self), dtype=np.intp)[:, None] * _UNIT_BINS + digits
+        offending = np.zeros(digits.shape, dtype=bool)
+        for unit_bins in _CELL_UNIT_BINS:
+            keys = bins + unit_bins
+            offending |= np.bincount(keys.ravel(), minlength=len(self) * _UNIT_BINS)[keys] > 1
+        offending &= digits > 0
+        return offending.reshape(-1, 9, 9)
+
+    def solve(self, engine: str = 'backtracking'):
+        """
+        Solves every board: naked singles for the whole batch first, then the scalar engine
+        for the boards singles could not finish.
+
+        Args:
+            engine (str): Name of the solving engine in `solver.ENGINES` used for the remaining boards.
+
+        Returns:
+            list of str or None: The 81-character solution of each board, or None if it has no solution.
+        """
+        solve = get_engine(engine)
+        self.propagate()
+        solved = self.solved()
+        full = (self.digits.reshape(len(self), -1) > 0).all(axis=1)
+        solutions = []
+        for digits, is_solved, is_full in zip(self.digits.reshape(len(self), -1).tolist(), solved, full):
+            if is_solved:
+                solutions.append(format_digits(digits))
+            elif is_full:
+                solutions.append(None)
+            else:
+                solution = solve(digits)
+                solutions.append(None if solution is None else format_digits(solution))
+
+        return solutions
+
+
+def solve_batch(puzzles, engine: str = 'backtracking'):
+    """
+    Solves a list of puzzles with vectorized naked singles and a scalar engine for the rest.
+
+    Args:
+        puzzles (list of str): 81-character puzzle strings, with ' ', '.' or '0' for empty cells.
+        engine (str): Name of the solving engine in `solver.ENGINES` used for boards singles do not finish.
+
+    Returns:
+        list of str or None: The 81-character solution of each puzzle, or None if it has no solution.
+
+    Raises:
+        ValueError: If a puzzle cannot be parsed.
+    """
+    return BoardBatch.from_puzzles(list(puzzles)).solve(engine)
+
+
+def _cell_lists(offending):
+    """
+    Converts a per-board array of offending cells into lists of flat indices.
+
+    Args:
+        offending (numpy.ndarray): (N, 9, 9) boolean array.
+
+    Returns:
+        list of list of int: The flat indices of the offending cells of each board, in order.
+    """
+    boards, cells = np.nonzero(offending.reshape(len(offending), -1))
+    lists = [[] for _ in range(len(offending))]
+    for board, cell in zip(boards.tolist(), cells.tolist()):
+        lists[board].append(cell)
+    return lists
+
+
+def find_conflicts_batch(puzzles):
+    """
+    Finds the conflicting givens of many puzzles at once.
+
+    Args:
+        puzzles (list of str): 81-character puzzle strings, with ' ', '.' or '0' for empty cells.
+
+    Returns:
+        list of list of int: For each puzzle, the flat indices of the cells whose number also appears
+                             elsewhere in one of their units, as `validate.find_conflicts` returns them.
+
+    Raises:
+        ValueError: If a puzzle cannot be parsed.
+    """
+    return _cell_lists(BoardBatch.from_puzzles(list(puzzles)).conflicts())
+
+
+def check_solutions_batch(solutions, puzzles=None):
+    """
+    Checks many solutions at once.
+
+    Args:
+        solutions (list of str): 81-character solution strings.
+        puzzles (list of str or None): The puzzles they should solve, in the same order, or None to check
+                                       the solutions on their own.
+
+    Returns:
+        list of list of int: For each solution, the flat indices of the cells that are empty, conflict with
+                             another cell or differ from a given of its puzzle, as `validate.check_solution`
+                             returns them; empty for a valid solution.
+
+    Raises:
+        ValueError: If a string cannot be parsed or the two lists have different lengths.
+    """
+    batch = BoardBatch.from_puzzles(list(solutions))
+    offending = batch.conflicts() | (batch.digits == 0)
+    if puzzles is not None:
+        givens = BoardBatch.from_puzzles(list(puzzles)).digits
+        if givens.shape != batch.digits.shape:
+            raise ValueError('There are not as many puzzles as solutions.')
+        offending |= (givens != 0) & (givens != batch.digits)
+    return _cell_lists(offending)